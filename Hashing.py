@@ -1,158 +1,1098 @@
-import random
-import datetime
-
-class HashTable:
-    def __init__(self, size):
-        self.size = size
-        self.table = [[] for _ in range(self.size)]
-        self.collisions = 0
-
-    def _hash(self, ic_number_str):
-        # Generates hash code for a 12-digit Malaysian IC using a folding technique.
-        numeric_ic_str = ic_number_str.replace('-', '')
-
-        if not (isinstance(numeric_ic_str, str) and
-                len(numeric_ic_str) == 12 and
-                numeric_ic_str.isdigit()):
-            raise ValueError(
-                f"Processed IC number '{numeric_ic_str}' is not a valid 12-digit numeric string."
-            )
-
-        # Split the 12-digit IC number string into three 4-digit parts
-        part1 = int(numeric_ic_str[0:4])
-        part2 = int(numeric_ic_str[4:8])
-        part3 = int(numeric_ic_str[8:12])
-
-        sum_of_parts = part1 + part2 + part3
-        return sum_of_parts % self.size
-
-    def insert(self, ic_number_str):
-        try:
-            index = self._hash(ic_number_str)
-
-            # Check for collision: if the chain is not empty, a collision occurred
-            if len(self.table[index]) > 0:
-                self.collisions += 1
-
-            self.table[index].append(ic_number_str)
-        except ValueError as e:
-            print(f"Error inserting IC number '{ic_number_str}': {e}")
-
-    def get_total_collisions(self):
-        return self.collisions
-
-    def display_table(self, limit=None):
-        print(f"\n--- Hash Table with size {self.size} Contents ---")
-        if limit is not None and limit < self.size:
-            print(f"--- Displaying first {limit} entries ---")
-
-        display_count = 0
-        for i, chain in enumerate(self.table):
-            if limit is not None and display_count >= limit:
-                break
-            
-            if chain:
-                print(f"table[{i}] --> {' --> '.join(chain)}")
-            else:
-                print(f"table[{i}]")
-            display_count += 1
-            
-        print(f"--- End of Hash Table Contents (Size {self.size}) ---\n")
-
-
-def generate_random_date_yymmdd():
-    return datetime.date(random.randrange(1950, 2006), random.randrange(1, 13), random.randrange(1, 29)).strftime('%y%m%d')
-
-def generate_random_pb_code():
-    ic_codes = [
-        "01", "21", "22", "23", "24",   # Johor
-        "02", "25", "26", "27",   # Kedah
-        "03", "28", "29",   # Kelantan
-        "04", "30",   # Melaka
-        "05", "31", "59",   # Negeri Sembilan
-        "06", "32", "33",   # Pahang
-        "07", "34", "35",   # Penang
-        "08", "36", "37", "38", "39",   # Perak
-        "09", "40",   # Perlis
-        "10", "41", "42", "43", "44",   # Selangor
-        "11", "45", "46",   # Terengganu
-        "12", "47", "48", "49",   # Sabah
-        "13", "50", "51", "52", "53",   # Sarawak
-        "14", "54", "55", "56", "57",   # W.P.(KL)
-        "15", "58",   # W.P.(Labuan)
-        "16",   # W.P.(Putrajaya)
-        "82"    # Unknown State
-    ]
-    return random.choice(ic_codes)
-
-def generate_random_four_digits():
-    return str(random.randint(0, 9999)).zfill(4)
-
-def generate_unique_ic_numbers(count):
-    ic_numbers = set()
-    print(f"Generating {count} unique IC numbers...")
-    while len(ic_numbers) < count:
-        yymmdd = generate_random_date_yymmdd()
-        pb = generate_random_pb_code()
-        xxxx = generate_random_four_digits()
-        
-        formatted_ic = f"{yymmdd}-{pb}-{xxxx}"
-        ic_numbers.add(formatted_ic)
-    print(f"Finished generating {len(ic_numbers)} unique IC numbers.\n")
-    return list(ic_numbers)
-
-if __name__ == "__main__":
-    num_ics_to_insert = 1000
-    num_rounds = 10
-
-    # Define the sizes of the two hash tables.
-    # Prime numbers are often chosen for hash table sizes to reduce collisions.
-    table_sizes = [1009, 2003]
-    
-    all_table_collisions = {size: [] for size in table_sizes}
-    average_collisions_per_table = {}
-
-    print("--- Starting Hashing Simulation ---")
-
-    for table_size in table_sizes:
-        print(f"\nSimulating for Hash Table Size: {table_size}")
-        round_collisions = []
-        
-        for round_num in range(1, num_rounds + 1):
-            hash_table = HashTable(table_size)
-            ic_numbers_for_round = generate_unique_ic_numbers(num_ics_to_insert)
-            
-            print(f"  Round {round_num}: Inserting {num_ics_to_insert} IC numbers into table of size {table_size}...")
-
-            for ic in ic_numbers_for_round:
-                hash_table.insert(ic)
-            
-            # Display the first 20 entries of the hash table for visualization
-            hash_table.display_table(limit=20)
-
-            collisions_this_round = hash_table.get_total_collisions()
-            round_collisions.append(collisions_this_round)
-            
-            print(f"  Round {round_num}: Total Collisions = {collisions_this_round}")
-            
-        all_table_collisions[table_size] = round_collisions
-        
-        average_collisions = sum(round_collisions) / num_rounds
-        average_collisions_per_table[table_size] = average_collisions
-        
-    print("\n--- Simulation Complete ---")
-    
-    print("\n--- Summary of Collisions Per Round ---")
-    print(f"----------------------------------------------------------------------------------------")
-    print(f"| {'Round':<8} | {'Table 1 (Size 1009) Collisions':<35} | {'Table 2 (Size 2003) Collisions':<35} |")
-    print(f"----------------------------------------------------------------------------------------")
-    for i in range(num_rounds):
-        col1 = all_table_collisions[1009][i]
-        col2 = all_table_collisions[2003][i]
-        print(f"| {i+1:<8} | {col1:<35} | {col2:<35} |")
-
-    print(f"----------------------------------------------------------------------------------------")    
-
-    print("\n--- Average Collisions Across All Rounds ---")
-    for table_size, avg_collisions in average_collisions_per_table.items():
-        print(f"Average Collisions for Table Size {table_size}: {avg_collisions:.2f}")
+import argparse
+import calendar
+import csv
+import json
+import random
+import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the batch methods fall back to per-item loops.
+    np = None
+
+MAX_PACKED_IC = 10**12
+
+
+def normalize_ic(ic_number_str):
+    # Strips the dashes from an IC number and checks that 12 digits remain.
+    numeric_ic_str = ic_number_str.replace('-', '')
+
+    if not (isinstance(numeric_ic_str, str) and
+            len(numeric_ic_str) == 12 and
+            numeric_ic_str.isdigit()):
+        raise ValueError(
+            f"Processed IC number '{numeric_ic_str}' is not a valid 12-digit numeric string."
+        )
+    return numeric_ic_str
+
+
+def pack_ic(ic_number_str):
+    # Packs an IC number into a single integer (at most 10**12 - 1, fits in 64 bits).
+    return int(normalize_ic(ic_number_str))
+
+
+def unpack_ic(key):
+    # Turns a packed IC key back into the YYMMDD-PB-XXXX display format.
+    digits = str(key).zfill(12)
+    return f"{digits[0:6]}-{digits[6:8]}-{digits[8:12]}"
+
+
+def unpack_ics(keys):
+    # Vectorized unpack_ic: formats an int64 array of packed keys as a 'U14' array
+    # (a list of strings without NumPy).
+    if np is None:
+        return [unpack_ic(key) for key in keys]
+    keys = np.asarray(keys, dtype=np.int64)
+    chars = np.empty((len(keys), 14), dtype=np.uint8)
+    chars[:, 6] = chars[:, 9] = ord('-')
+    for power, column in zip(range(11, -1, -1), DASHED_IC_DIGIT_COLUMNS):
+        chars[:, column] = (keys // 10**power) % 10 + ord('0')
+    return chars.view('S14').reshape(-1).astype('U14')
+
+
+DASHED_IC_DIGIT_COLUMNS = (0, 1, 2, 3, 4, 5, 7, 8, 10, 11, 12, 13)
+
+
+def _pack_digit_columns(chars, columns):
+    # Horner-packs the given character columns; returns (keys, all_digits) per row.
+    # Columns are read one at a time, so no (n, 12) temporary is built.
+    packed = np.zeros(len(chars), dtype=np.int64)
+    is_digit = np.ones(len(chars), dtype=bool)
+    for column in columns:
+        digit = chars[:, column].astype(np.int64) - ord('0')
+        is_digit &= (digit >= 0) & (digit <= 9)
+        packed = packed * 10 + digit
+    return packed, is_digit
+
+
+def _pack_char_matrix(chars, lengths):
+    # Packs an (n, width) matrix of character codes whose rows have the given lengths.
+    n, width = chars.shape
+    if width == 14 and (lengths == 14).all() and (chars[:, 6] == ord('-')).all() \
+            and (chars[:, 9] == ord('-')).all():
+        # Fast path for the usual YYMMDD-PB-XXXX layout.
+        keys, valid = _pack_digit_columns(chars, DASHED_IC_DIGIT_COLUMNS)
+    elif width == 12 and (lengths == 12).all():
+        keys, valid = _pack_digit_columns(chars, range(12))
+    else:
+        in_string = np.arange(width) < lengths[:, None]
+        keep = in_string & (chars != ord('-'))
+        valid = keep.sum(axis=1) == 12
+        keys = np.full(n, -1, dtype=np.int64)
+        if valid.any():
+            # Every valid row keeps exactly 12 characters, so the boolean gather reshapes cleanly.
+            digit_chars = chars[valid][keep[valid]].reshape(-1, 12)
+            packed, is_digit = _pack_digit_columns(digit_chars, range(12))
+            valid_rows = np.flatnonzero(valid)
+            keys[valid_rows] = packed
+            valid[valid_rows[~is_digit]] = False
+    return np.where(valid, keys, -1), valid
+
+
+def pack_ics(ic_numbers):
+    # Packs a batch of IC numbers in one vectorized pass.
+    # Accepts a list or NumPy array of IC strings (with or without dashes), or an integer
+    # array of already packed keys. Returns (keys, valid) as int64 / bool arrays; keys of
+    # invalid entries are -1. Without NumPy the same pair comes back as an array('q')
+    # and a list of bools, packed one entry at a time.
+    if np is None:
+        keys = array('q')
+        for ic in ic_numbers:
+            try:
+                key = ic if isinstance(ic, int) else pack_ic(ic)
+            except (ValueError, AttributeError):
+                key = -1
+            keys.append(key if 0 <= key < MAX_PACKED_IC else -1)
+        return keys, [key >= 0 for key in keys]
+
+    if isinstance(ic_numbers, list) and ic_numbers:
+        # Building a fixed-width NumPy string array from a list is slow; when every entry
+        # is a 14-character ASCII string, one join gives the character matrix directly.
+        try:
+            if set(map(len, ic_numbers)) == {14}:
+                joined = "".join(ic_numbers).encode('ascii')
+                chars = np.frombuffer(joined, dtype=np.uint8).reshape(len(ic_numbers), 14)
+                return _pack_char_matrix(chars, np.full(len(ic_numbers), 14))
+        except (TypeError, UnicodeEncodeError):
+            pass
+
+    arr = np.asarray(ic_numbers)
+    if arr.ndim != 1:
+        arr = arr.reshape(-1)
+
+    if arr.dtype.kind in 'iu':
+        keys = arr.astype(np.int64)
+        valid = (keys >= 0) & (keys < MAX_PACKED_IC)
+        return np.where(valid, keys, -1), valid
+
+    if arr.dtype.kind not in 'SU':
+        # Mixed or non-string input: validate each entry the same way insert() does.
+        keys = np.full(len(arr), -1, dtype=np.int64)
+        for i, ic in enumerate(arr.tolist()):
+            try:
+                keys[i] = pack_ic(ic)
+            except (ValueError, AttributeError):
+                pass
+        return keys, keys >= 0
+
+    n = len(arr)
+    width = arr.dtype.itemsize // (4 if arr.dtype.kind == 'U' else 1)
+    if n == 0 or width == 0:
+        return np.full(n, -1, dtype=np.int64), np.zeros(n, dtype=bool)
+
+    # View the fixed-width strings as an (n, width) matrix of code points.
+    chars = arr.view(np.uint32 if arr.dtype.kind == 'U' else np.uint8).reshape(n, width)
+    return _pack_char_matrix(chars, np.char.str_len(arr))
+
+
+def ic_strings(ic_numbers, positions):
+    # Picks the given positions out of a batch as plain IC strings for chained storage.
+    if np is not None and isinstance(ic_numbers, np.ndarray):
+        items = ic_numbers.reshape(-1)
+        if items.dtype.kind in 'iu':
+            return [unpack_ic(key) for key in items[positions].tolist()]
+        if items.dtype.kind == 'S':
+            return [item.decode() for item in items[positions].tolist()]
+        return [str(item) for item in items[positions].tolist()]
+    return [ic_numbers[i] for i in positions]
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    divisor = 3
+    while divisor * divisor <= n:
+        if n % divisor == 0:
+            return False
+        divisor += 2
+    return True
+
+
+def next_prime(n):
+    # Smallest prime >= n, used to keep table sizes prime when growing.
+    while not is_prime(n):
+        n += 1
+    return n
+
+
+# Marks an unused slot in the open-addressing key buffer. Packed IC keys are never negative.
+EMPTY_SLOT = -1
+MASK_64 = (1 << 64) - 1
+GOLDEN_RATIO_64 = 0x9E3779B97F4A7C15
+
+
+def mix_key(key):
+    # Multiplicative (Fibonacci) mixing of a packed IC key into 64 bits.
+    mixed = (key * GOLDEN_RATIO_64) & MASK_64
+    return mixed ^ (mixed >> 29)
+
+
+def mix_keys(keys):
+    # Vectorized mix_key; uint64 arithmetic wraps the same way as the & MASK_64 above.
+    mixed = keys.astype(np.uint64) * np.uint64(GOLDEN_RATIO_64)
+    return mixed ^ (mixed >> np.uint64(29))
+
+
+FNV_OFFSET_BASIS_64 = 0xCBF29CE484222325
+FNV_PRIME_64 = 0x100000001B3
+
+
+def splitmix_finalize(value):
+    # The SplitMix64 finalizer: a full-avalanche bijection on 64-bit integers.
+    value &= MASK_64
+    value ^= value >> 30
+    value = (value * 0xBF58476D1CE4E5B9) & MASK_64
+    value ^= value >> 27
+    value = (value * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+def splitmix_finalize_many(values):
+    values = values.astype(np.uint64)
+    values ^= values >> np.uint64(30)
+    values *= np.uint64(0xBF58476D1CE4E5B9)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+class HashStrategy:
+    # Maps packed IC keys to buckets. Subclasses implement hash_key (scalar) and
+    # hash_keys (NumPy); the table size is only applied by bucket/buckets.
+    # strategy_id is stable and is what gets written into on-disk index headers.
+    name = None
+    strategy_id = None
+
+    def hash_key(self, key):
+        raise NotImplementedError
+
+    def hash_keys(self, keys):
+        raise NotImplementedError
+
+    def bucket(self, key, size):
+        return self.hash_key(key) % size
+
+    def buckets(self, keys, size):
+        return (self.hash_keys(keys).astype(np.uint64) % np.uint64(size)).astype(np.int64)
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class FoldingHash(HashStrategy):
+    # The original 4-4-4 digit folding: sum of the three 4-digit parts.
+    name = "folding"
+    strategy_id = 1
+
+    def hash_key(self, key):
+        return key // 100000000 + (key // 10000) % 10000 + key % 10000
+
+    def hash_keys(self, keys):
+        return keys // 100000000 + (keys // 10000) % 10000 + keys % 10000
+
+
+class MultiplicativeHash(HashStrategy):
+    # Knuth's multiplicative method with the 64-bit golden ratio constant.
+    name = "multiplicative"
+    strategy_id = 2
+
+    def hash_key(self, key):
+        return mix_key(key)
+
+    def hash_keys(self, keys):
+        return mix_keys(keys)
+
+
+class FNV1aHash(HashStrategy):
+    # 64-bit FNV-1a over the 12 ASCII digits of the IC.
+    name = "fnv1a"
+    strategy_id = 3
+
+    def hash_key(self, key):
+        value = FNV_OFFSET_BASIS_64
+        for digit in str(key).zfill(12).encode('ascii'):
+            value ^= digit
+            value = (value * FNV_PRIME_64) & MASK_64
+        return value
+
+    def hash_keys(self, keys):
+        value = np.full(len(keys), FNV_OFFSET_BASIS_64, dtype=np.uint64)
+        prime = np.uint64(FNV_PRIME_64)
+        for power in range(11, -1, -1):
+            digit = (keys // 10**power) % 10 + ord('0')
+            value ^= digit.astype(np.uint64)
+            value *= prime
+        return value
+
+
+class DateAwareHash(HashStrategy):
+    # Re-encodes YYMMDD, the place-of-birth code and the serial into a dense index
+    # (there are only ~372 day values per year, not 10000), then applies the SplitMix64
+    # finalizer so the skewed date and state fields still reach every output bit.
+    name = "date_aware"
+    strategy_id = 4
+
+    @staticmethod
+    def _dense(key):
+        yy = key // 10**10
+        mm = (key // 10**8) % 100
+        dd = (key // 10**6) % 100
+        pb = (key // 10**4) % 100
+        serial = key % 10000
+        day_index = yy * 372 + mm * 31 + dd
+        return (day_index * 100 + pb) * 10000 + serial
+
+    def hash_key(self, key):
+        return splitmix_finalize(self._dense(key))
+
+    def hash_keys(self, keys):
+        return splitmix_finalize_many(self._dense(keys))
+
+
+HASH_STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (FoldingHash(), MultiplicativeHash(), FNV1aHash(), DateAwareHash())
+}
+
+
+def get_hash_strategy(strategy):
+    # Accepts a registered strategy name, a strategy_id or a HashStrategy instance.
+    if isinstance(strategy, HashStrategy):
+        return strategy
+    for registered in HASH_STRATEGIES.values():
+        if strategy == registered.name or strategy == registered.strategy_id:
+            return registered
+    raise ValueError(
+        f"Unknown hash strategy '{strategy}'. Choose from: {', '.join(HASH_STRATEGIES)}."
+    )
+
+
+class HashTable:
+    def __init__(self, size, hash_strategy="folding"):
+        self.size = size
+        self.table = [[] for _ in range(self.size)]
+        self.collisions = 0
+        self.hash_strategy = get_hash_strategy(hash_strategy)
+
+    def _hash(self, ic_number_str):
+        # Generates hash code for a 12-digit Malaysian IC using the table's hash strategy
+        # (4-4-4 digit folding by default).
+        return self.hash_strategy.bucket(pack_ic(ic_number_str), self.size)
+
+    def insert(self, ic_number_str):
+        try:
+            index = self._hash(ic_number_str)
+
+            # Check for collision: if the chain is not empty, a collision occurred
+            if len(self.table[index]) > 0:
+                self.collisions += 1
+
+            self.table[index].append(ic_number_str)
+        except ValueError as e:
+            print(f"Error inserting IC number '{ic_number_str}': {e}")
+
+    def _hash_many(self, keys):
+        # Vectorized version of _hash operating on packed keys.
+        return self.hash_strategy.buckets(keys, self.size)
+
+    def insert_many(self, ic_numbers):
+        # Inserts a batch of IC numbers, hashing them in a single vectorized pass.
+        # Returns (bucket_indices, collisions) where invalid entries get index -1 and
+        # collisions counts the entries that landed in an already occupied bucket.
+        keys, valid = pack_ics(ic_numbers)
+        invalid_count = len(keys) - int(sum(valid) if np is None else valid.sum())
+        if invalid_count:
+            print(f"Error inserting {invalid_count} IC number(s): not valid 12-digit numeric strings.")
+
+        if np is None:
+            # Without NumPy: one pass over the packed keys, hashing each valid key once.
+            bucket, size, table = self.hash_strategy.bucket, self.size, self.table
+            indices = [bucket(key, size) if is_valid else -1 for key, is_valid in zip(keys, valid)]
+            collisions = 0
+            for ic_number_str, key, index in zip(ic_numbers, keys, indices):
+                if index >= 0:
+                    if table[index]:
+                        collisions += 1
+                    table[index].append(ic_number_str if isinstance(ic_number_str, str) else unpack_ic(key))
+            self.collisions += collisions
+            return indices, collisions
+
+        indices = np.full(len(keys), -1, dtype=np.int64)
+        indices[valid] = self._hash_many(keys[valid])
+
+        valid_positions = np.flatnonzero(valid)
+        buckets = indices[valid_positions]
+        # Every entry collides except the first one to reach a bucket that was empty.
+        newly_filled = sum(1 for bucket in np.unique(buckets).tolist() if not self.table[bucket])
+        collisions = len(buckets) - newly_filled
+        self.collisions += collisions
+
+        table = self.table
+        for ic_number_str, bucket in zip(ic_strings(ic_numbers, valid_positions), buckets.tolist()):
+            table[bucket].append(ic_number_str)
+        return indices, collisions
+
+    def contains(self, ic_number_str):
+        try:
+            numeric_ic_str = normalize_ic(ic_number_str)
+            index = self._hash(ic_number_str)
+        except ValueError:
+            return False
+        return any(entry.replace('-', '') == numeric_ic_str for entry in self.table[index])
+
+    def contains_many(self, ic_numbers):
+        # Batch membership query; returns a bool array (a list without NumPy).
+        if np is None:
+            return [self.contains(ic_number_str) for ic_number_str in ic_numbers]
+
+        keys, valid = pack_ics(ic_numbers)
+        found = np.zeros(len(keys), dtype=bool)
+        valid_positions = np.flatnonzero(valid)
+        buckets = self._hash_many(keys[valid_positions])
+        table = self.table
+        for position, key, bucket in zip(valid_positions.tolist(), keys[valid_positions].tolist(), buckets.tolist()):
+            chain = table[bucket]
+            if chain:
+                numeric_ic_str = str(key).zfill(12)
+                found[position] = any(entry.replace('-', '') == numeric_ic_str for entry in chain)
+        return found
+
+    def get_total_collisions(self):
+        return self.collisions
+
+    def display_table(self, limit=None):
+        print(f"\n--- Hash Table with size {self.size} Contents ---")
+        if limit is not None and limit < self.size:
+            print(f"--- Displaying first {limit} entries ---")
+
+        display_count = 0
+        for i, chain in enumerate(self.table):
+            if limit is not None and display_count >= limit:
+                break
+            
+            if chain:
+                print(f"table[{i}] --> {' --> '.join(chain)}")
+            else:
+                print(f"table[{i}]")
+            display_count += 1
+            
+        print(f"--- End of Hash Table Contents (Size {self.size}) ---\n")
+
+
+class OpenAddressingHashTable:
+    # Stores IC numbers packed into 64-bit integers in one flat array, using linear probing.
+    # Each slot costs 8 bytes instead of a string object plus a list entry, and the table
+    # grows (to the next prime of roughly double the size) once max_load_factor is exceeded.
+    # Folding is a poor fit here: it never exceeds 29997, so large tables would cluster.
+
+    # Set when a delete may have removed the longest probe sequence.
+    _max_probe_stale = False
+
+    def __init__(self, size, max_load_factor=0.7, hash_strategy="multiplicative"):
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1.")
+        self.hash_strategy = get_hash_strategy(hash_strategy)
+        self.max_load_factor = max_load_factor
+        self._allocate(next_prime(max(size, 2)))
+        self.count = 0
+        self.resizes = 0
+        self._reset_stats()
+
+    def _allocate(self, size):
+        # Points self.keys at a fresh, all-empty buffer of `size` slots.
+        self.size = size
+        self.keys = array('q', [EMPTY_SLOT]) * size
+
+    def _release(self, old_keys):
+        # Called once a resize has copied everything out of the previous buffer.
+        pass
+
+    def _reset_stats(self):
+        self.collisions = 0
+        self.total_probes = 0
+        self.max_probe_length = 0
+        self._max_probe_stale = False
+
+    def _hash(self, key):
+        return self.hash_strategy.bucket(key, self.size)
+
+    def _find_slot(self, key):
+        # Returns (slot, probe_length); the slot holds either the key or EMPTY_SLOT.
+        keys = self.keys
+        size = self.size
+        index = self._hash(key)
+        probes = 0
+        while keys[index] != EMPTY_SLOT and keys[index] != key:
+            index += 1
+            if index == size:
+                index = 0
+            probes += 1
+        return index, probes
+
+    def _place(self, key):
+        index, probes = self._find_slot(key)
+        if self.keys[index] == key:
+            return False
+        self._store(key, index, probes)
+        return True
+
+    def _store(self, key, index, probes):
+        # Writes a new key into the empty slot _find_slot returned for it.
+        # Same definition as HashTable: the home slot was already taken.
+        if probes > 0:
+            self.collisions += 1
+        self.total_probes += probes
+        if probes > self.max_probe_length:
+            self.max_probe_length = probes
+
+        self.keys[index] = key
+        self.count += 1
+
+    def _hash_many(self, keys):
+        return self.hash_strategy.buckets(keys, self.size)
+
+    def _buffer(self):
+        # Zero-copy NumPy view of the key array; recreate it after every resize.
+        return np.frombuffer(self.keys, dtype=np.int64)
+
+    def _place_many(self, pending):
+        # Linear-probes a batch of keys in lock-step, one probe step per round.
+        # When several keys reach the same empty slot, exactly one claim sticks and the rest
+        # keep probing. Slots only ever fill up, so every key still has no empty slot between
+        # its home and where it lands, as linear probing requires. Copies of one key move in
+        # lock-step, so the losing copies find the winner's key in the slot and stop there.
+        # Returns the slot of every key (new or already present).
+        table = self._buffer()
+        size = self.size
+        slots = self._hash_many(pending)
+        probes = np.zeros(len(pending), dtype=np.int64)
+        placed = np.zeros(len(pending), dtype=bool)
+        active = np.arange(len(pending))
+        # Scratch space for claim resolution; only slots written this call are ever read.
+        owner = np.empty(size, dtype=np.int64)
+
+        while active.size:
+            active_slots = slots[active]
+            empty = table[active_slots] == EMPTY_SLOT
+            claimants = active[empty]
+            owner[slots[claimants]] = claimants
+
+            won = np.zeros(len(active), dtype=bool)
+            won[empty] = owner[slots[claimants]] == claimants
+            winners = active[won]
+            table[slots[winners]] = pending[winners]
+            placed[winners] = True
+
+            # Re-read after writing so duplicates of a winner see their key and stop.
+            active = active[table[active_slots] != pending[active]]
+            slots[active] += 1
+            slots[active[slots[active] == size]] = 0
+            probes[active] += 1
+
+        placed_probes = probes[placed]
+        self.count += int(placed.sum())
+        self.collisions += int((placed_probes > 0).sum())
+        self.total_probes += int(placed_probes.sum())
+        if placed_probes.size:
+            self.max_probe_length = max(self.max_probe_length, int(placed_probes.max()))
+        return slots
+
+    def _resize(self, new_size):
+        old_keys = self.keys
+        self._allocate(next_prime(new_size))
+        self.count = 0
+        self.resizes += 1
+        # Statistics describe the current layout, so they are rebuilt while rehashing.
+        self._reset_stats()
+        if np is not None:
+            old_buffer = np.frombuffer(old_keys, dtype=np.int64)
+            self._place_many(old_buffer[old_buffer != EMPTY_SLOT])
+            del old_buffer
+        else:
+            for key in old_keys:
+                if key != EMPTY_SLOT:
+                    self._place(key)
+        self._release(old_keys)
+
+    def _reserve(self, extra):
+        # Grows once, up front, so that `extra` more keys stay under the load factor.
+        new_size = self.size
+        while self.count + extra > new_size * self.max_load_factor:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
+
+    def add_if_absent(self, key):
+        # Inserts an already packed key (see pack_ic) unless it is present, growing the
+        # table first if needed. Returns True if the key was added.
+        if (self.count + 1) > self.size * self.max_load_factor:
+            self._resize(self.size * 2)
+        return self._place(key)
+
+    def insert(self, ic_number_str):
+        # Returns True if the IC was added, False if it was already present or invalid.
+        try:
+            key = pack_ic(ic_number_str)
+        except ValueError as e:
+            print(f"Error inserting IC number '{ic_number_str}': {e}")
+            return False
+        return self.add_if_absent(key)
+
+    def insert_many(self, ic_numbers):
+        # Vectorized bulk insert. Returns (slot_indices, collisions): the slot now holding
+        # each IC (-1 for invalid entries) and the number of newly stored ICs whose home
+        # slot was already taken.
+        keys, valid = pack_ics(ic_numbers)
+        invalid_count = len(keys) - int(sum(valid) if np is None else valid.sum())
+        if invalid_count:
+            print(f"Error inserting {invalid_count} IC number(s): not valid 12-digit numeric strings.")
+
+        # Reserve for the whole batch; duplicates can only make the table emptier.
+        self._reserve(len(keys) - invalid_count)
+
+        if np is None:
+            # Without NumPy: probe for each valid key once and store it where the probe ends.
+            slots = []
+            collisions_before = self.collisions
+            for key, is_valid in zip(keys, valid):
+                if not is_valid:
+                    slots.append(-1)
+                    continue
+                index, probes = self._find_slot(key)
+                if self.keys[index] != key:
+                    self._store(key, index, probes)
+                slots.append(index)
+            return slots, self.collisions - collisions_before
+
+        pending = keys[valid]
+        collisions_before = self.collisions
+        slots = np.full(len(keys), -1, dtype=np.int64)
+        slots[valid] = self._place_many(pending)
+        return slots, self.collisions - collisions_before
+
+    def contains(self, ic_number_str):
+        try:
+            key = pack_ic(ic_number_str)
+        except ValueError:
+            return False
+        index, _ = self._find_slot(key)
+        return self.keys[index] == key
+
+    def contains_many(self, ic_numbers):
+        # Batch membership query; returns a bool array (a list without NumPy).
+        if np is None:
+            return [self.contains(ic_number_str) for ic_number_str in ic_numbers]
+
+        keys, valid = pack_ics(ic_numbers)
+        table = self._buffer()
+        size = self.size
+        found = np.zeros(len(keys), dtype=bool)
+        active = np.flatnonzero(valid)
+        slots = np.zeros(len(keys), dtype=np.int64)
+        slots[active] = self._hash_many(keys[active])
+
+        while active.size:
+            current = table[slots[active]]
+            hit = current == keys[active]
+            found[active[hit]] = True
+            active = active[~hit & (current != EMPTY_SLOT)]
+            slots[active] += 1
+            slots[active[slots[active] == size]] = 0
+        return found
+
+    def delete(self, ic_number_str):
+        # Removes an IC using backward-shift deletion, so no tombstones are left behind.
+        try:
+            key = pack_ic(ic_number_str)
+        except ValueError:
+            return False
+        index, _ = self._find_slot(key)
+        keys = self.keys
+        if keys[index] != key:
+            return False
+
+        size = self.size
+        # Keep the statistics describing the current layout: drop the removed entry's
+        # probe length, then re-measure every entry shifted back towards its home.
+        self._forget_probe_length((index - self._hash(key)) % size)
+        hole = index
+        probe = index
+        while True:
+            probe = (probe + 1) % size
+            if keys[probe] == EMPTY_SLOT:
+                break
+            home = self._hash(keys[probe])
+            # Move the entry back unless its home slot lies cyclically in (hole, probe].
+            if (probe > hole and (home <= hole or home > probe)) or \
+                    (probe < hole and (home <= hole and home > probe)):
+                keys[hole] = keys[probe]
+                self._forget_probe_length((probe - home) % size)
+                self._count_probe_length((hole - home) % size)
+                hole = probe
+        keys[hole] = EMPTY_SLOT
+        self.count -= 1
+        return True
+
+    def _forget_probe_length(self, probes):
+        if probes > 0:
+            self.collisions -= 1
+        self.total_probes -= probes
+        if probes == self.max_probe_length:
+            # The longest probe may be gone; get_probe_stats() rescans when asked.
+            self._max_probe_stale = True
+
+    def _count_probe_length(self, probes):
+        if probes > 0:
+            self.collisions += 1
+        self.total_probes += probes
+        if probes > self.max_probe_length:
+            self.max_probe_length = probes
+
+    def _rescan_max_probe_length(self):
+        size = self.size
+        if np is not None:
+            table = np.frombuffer(self.keys, dtype=np.int64)
+            slots = np.flatnonzero(table != EMPTY_SLOT)
+            lengths = (slots - self._hash_many(table[slots])) % size
+            self.max_probe_length = int(lengths.max()) if lengths.size else 0
+        else:
+            self.max_probe_length = max(((slot - self._hash(key)) % size
+                                         for slot, key in enumerate(self.keys) if key != EMPTY_SLOT), default=0)
+        self._max_probe_stale = False
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, ic_number_str):
+        return self.contains(ic_number_str)
+
+    def load_factor(self):
+        return self.count / self.size
+
+    def get_total_collisions(self):
+        return self.collisions
+
+    def get_probe_stats(self):
+        if self._max_probe_stale:
+            self._rescan_max_probe_length()
+        mean_probe = self.total_probes / self.count if self.count else 0.0
+        return {
+            "entries": self.count,
+            "size": self.size,
+            "load_factor": self.load_factor(),
+            "collisions": self.collisions,
+            "mean_probe_length": mean_probe,
+            "max_probe_length": self.max_probe_length,
+            "resizes": self.resizes,
+            "buffer_bytes": self.keys.itemsize * len(self.keys),
+        }
+
+    def display_table(self, limit=None):
+        print(f"\n--- Open Addressing Hash Table with size {self.size} Contents ---")
+        if limit is not None and limit < self.size:
+            print(f"--- Displaying first {limit} entries ---")
+
+        for i in range(self.size if limit is None else min(limit, self.size)):
+            key = self.keys[i]
+            if key != EMPTY_SLOT:
+                print(f"table[{i}] --> {unpack_ic(key)}")
+            else:
+                print(f"table[{i}]")
+
+        print(f"--- End of Hash Table Contents (Size {self.size}) ---\n")
+
+
+def generate_random_date_yymmdd():
+    return datetime.date(random.randrange(1950, 2006), random.randrange(1, 13), random.randrange(1, 29)).strftime('%y%m%d')
+
+IC_PB_CODES = [
+    "01", "21", "22", "23", "24",   # Johor
+    "02", "25", "26", "27",   # Kedah
+    "03", "28", "29",   # Kelantan
+    "04", "30",   # Melaka
+    "05", "31", "59",   # Negeri Sembilan
+    "06", "32", "33",   # Pahang
+    "07", "34", "35",   # Penang
+    "08", "36", "37", "38", "39",   # Perak
+    "09", "40",   # Perlis
+    "10", "41", "42", "43", "44",   # Selangor
+    "11", "45", "46",   # Terengganu
+    "12", "47", "48", "49",   # Sabah
+    "13", "50", "51", "52", "53",   # Sarawak
+    "14", "54", "55", "56", "57",   # W.P.(KL)
+    "15", "58",   # W.P.(Labuan)
+    "16",   # W.P.(Putrajaya)
+    "82"    # Unknown State
+]
+
+DEFAULT_BIRTH_YEARS = range(1950, 2006)
+
+
+def generate_random_pb_code():
+    return random.choice(IC_PB_CODES)
+
+def generate_random_four_digits():
+    return str(random.randint(0, 9999)).zfill(4)
+
+def _normalize_weights(weights, default_values, label):
+    # Turns None, a sequence of values or a {value: weight} dict into (values, probabilities).
+    if weights is None:
+        weights = list(default_values)
+    if not isinstance(weights, dict):
+        weights = {value: 1 for value in weights}
+    values = list(weights)
+    total = sum(weights.values())
+    if not values or total <= 0 or any(weight < 0 for weight in weights.values()):
+        raise ValueError(f"{label} weights must be non-negative and sum to more than zero.")
+    return values, [weights[value] / total for value in values]
+
+
+def _ic_key_space(years, states):
+    # Number of distinct valid ICs for the given birth years and state codes.
+    days = sum(366 if calendar.isleap(year) else 365 for year in years)
+    return days * len(states) * 10000
+
+
+def _draw_ic_keys_numpy(rng, count, years, year_p, states, state_p):
+    birth_years = rng.choice(np.array(years, dtype=np.int64), size=count, p=year_p)
+    is_leap = ((birth_years % 4 == 0) & (birth_years % 100 != 0)) | (birth_years % 400 == 0)
+    day_of_year = rng.integers(0, 365 + is_leap.astype(np.int64))
+
+    dates = (birth_years - 1970).astype('datetime64[Y]').astype('datetime64[D]') + day_of_year
+    month_starts = dates.astype('datetime64[M]')
+    month = month_starts.astype(np.int64) % 12 + 1
+    day = (dates - month_starts.astype('datetime64[D]')).astype(np.int64) + 1
+
+    pb = rng.choice(np.array([int(code) for code in states], dtype=np.int64), size=count, p=state_p)
+    serial = rng.integers(0, 10000, size=count)
+    return ((((birth_years % 100) * 100 + month) * 100 + day) * 100 + pb) * 10000 + serial
+
+
+def _draw_ic_key_python(rng, years, year_p, states, state_p):
+    birth_year = rng.choices(years, year_p)[0]
+    first_day = datetime.date(birth_year, 1, 1).toordinal()
+    last_day = datetime.date(birth_year, 12, 31).toordinal()
+    birth_date = datetime.date.fromordinal(rng.randint(first_day, last_day))
+    pb = int(rng.choices(states, state_p)[0])
+    yymmdd = (birth_date.year % 100) * 10000 + birth_date.month * 100 + birth_date.day
+    return (yymmdd * 100 + pb) * 10000 + rng.randrange(10000)
+
+
+def generate_ic_stream(count, chunk_size=100000, seed=None, year_weights=None,
+                       state_weights=None, packed=False):
+    # Yields `count` unique, valid IC numbers in chunks of at most chunk_size.
+    # year_weights / state_weights are either sequences of allowed birth years / PB codes
+    # or {value: weight} dicts; the defaults are uniform over 1950-2005 and IC_PB_CODES.
+    # Chunks are lists of YYMMDD-PB-XXXX strings, or int64 arrays of packed keys when
+    # packed=True (lists of ints without NumPy). The same seed gives the same stream.
+    # Uniqueness is tracked in an OpenAddressingHashTable of packed keys (~8-16 bytes per
+    # IC) instead of a set of strings.
+    years, year_p = _normalize_weights(year_weights, DEFAULT_BIRTH_YEARS, "Birth year")
+    states, state_p = _normalize_weights(state_weights, IC_PB_CODES, "State code")
+    for code in states:
+        if not (isinstance(code, str) and len(code) == 2 and code.isdigit()):
+            raise ValueError(f"State code '{code}' is not a 2-digit string.")
+    if count > _ic_key_space([year for year, p in zip(years, year_p) if p > 0],
+                             [code for code, p in zip(states, state_p) if p > 0]):
+        raise ValueError(f"Cannot generate {count} unique IC numbers from the configured years and states.")
+
+    # Sized for the whole stream up front so it never has to rehash.
+    seen = OpenAddressingHashTable(int(count / 0.7) + 1, max_load_factor=0.7)
+
+    if np is None:
+        rng = random.Random(seed)
+        produced = 0
+        while produced < count:
+            chunk = []
+            while len(chunk) < min(chunk_size, count - produced):
+                key = _draw_ic_key_python(rng, years, year_p, states, state_p)
+                if seen.add_if_absent(key):
+                    chunk.append(key)
+            produced += len(chunk)
+            yield chunk if packed else [unpack_ic(key) for key in chunk]
+        return
+
+    rng = np.random.default_rng(seed)
+    produced = 0
+    while produced < count:
+        wanted = min(chunk_size, count - produced)
+        parts = []
+        missing = wanted
+        while missing:
+            # Over-draw slightly so a chunk rarely needs a second round of rejection.
+            candidates = _draw_ic_keys_numpy(rng, missing + missing // 8 + 16, years, year_p, states, state_p)
+            _, first = np.unique(candidates, return_index=True)
+            candidates = candidates[np.sort(first)]
+            fresh = candidates[~seen.contains_many(candidates)][:missing]
+            seen.insert_many(fresh)
+            parts.append(fresh)
+            missing -= len(fresh)
+        chunk = np.concatenate(parts)
+        produced += len(chunk)
+        yield chunk if packed else unpack_ics(chunk).tolist()
+
+
+def generate_unique_ic_numbers(count, seed=None):
+    print(f"Generating {count} unique IC numbers...")
+    ic_numbers = [ic for chunk in generate_ic_stream(count, seed=seed) for ic in chunk]
+    print(f"Finished generating {len(ic_numbers)} unique IC numbers.\n")
+    return ic_numbers
+
+def chain_length_stats(chain_lengths):
+    # Distribution statistics for a list of bucket occupancies.
+    size = len(chain_lengths)
+    entries = sum(chain_lengths)
+    occupied = [length for length in chain_lengths if length]
+    expected = entries / size
+    # Pearson's chi-square against a uniform spread; divided by the degrees of freedom it
+    # is ~1.0 for an ideal hash and grows with clustering.
+    chi_square = sum((length - expected) ** 2 for length in chain_lengths) / expected if expected else 0.0
+    return {
+        "max_chain_length": max(chain_lengths) if chain_lengths else 0,
+        "mean_chain_length": entries / len(occupied) if occupied else 0.0,
+        "empty_bucket_ratio": (size - len(occupied)) / size,
+        "chi_square": chi_square,
+        "chi_square_per_dof": chi_square / (size - 1) if size > 1 else 0.0,
+    }
+
+
+def benchmark_hash_strategies(ic_numbers, table_sizes, strategy_names=None, repeats=3):
+    # Builds a chained HashTable for every (strategy, size) pair from the same ICs and
+    # reports insert throughput (best of `repeats` fresh tables, timed by the benchmark
+    # harness) alongside the bucket distribution.
+    from benchmark_harness import measure  # benchmark-only; keeps it out of plain imports
+
+    strategy_names = list(strategy_names or HASH_STRATEGIES)
+    results = []
+    for name in strategy_names:
+        for table_size in table_sizes:
+            tables = []
+
+            def new_table():
+                tables.append(HashTable(table_size, hash_strategy=name))
+                return tables[-1]
+
+            def insert_all(hash_table):
+                for ic in ic_numbers:
+                    hash_table.insert(ic)
+
+            stats = measure(insert_all, setup=new_table, warmup=0, min_rounds=repeats, max_rounds=repeats)
+            best_seconds = stats["min_ns"] / 1e9
+            hash_table = tables[-1]
+
+            row = {
+                "strategy": name,
+                "table_size": table_size,
+                "entries": len(ic_numbers),
+                "ops_per_second": len(ic_numbers) / best_seconds if best_seconds > 0 else float('inf'),
+                "p50_ms": stats["p50_ns"] / 1e6,
+                "collisions": hash_table.get_total_collisions(),
+            }
+            row.update(chain_length_stats([len(chain) for chain in hash_table.table]))
+            results.append(row)
+    return results
+
+
+def display_benchmark_results(results):
+    print("\n--- Hash Strategy Benchmark ---")
+    header = (f"| {'Strategy':<15} | {'Size':>8} | {'Ops/s':>12} | {'Collisions':>10} | "
+              f"{'Max chain':>9} | {'Mean chain':>10} | {'Empty %':>8} | {'Chi2/dof':>8} |")
+    print("-" * len(header))
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(f"| {row['strategy']:<15} | {row['table_size']:>8} | {row['ops_per_second']:>12,.0f} | "
+              f"{row['collisions']:>10} | {row['max_chain_length']:>9} | {row['mean_chain_length']:>10.2f} | "
+              f"{row['empty_bucket_ratio'] * 100:>7.1f}% | {row['chi_square_per_dof']:>8.2f} |")
+    print("-" * len(header))
+
+
+def simulation_seed(base_seed, round_num):
+    # Deterministic per-round seed, independent of which worker runs the round.
+    return base_seed * 1000003 + round_num
+
+
+def simulate_round(round_num, base_seed, num_ics, table_sizes, strategy_names):
+    # One unit of work for the simulation pool: the round's ICs are generated once and
+    # inserted into a fresh table for every (strategy, size) pair.
+    seed = simulation_seed(base_seed, round_num)
+    ic_numbers = [ic for chunk in generate_ic_stream(num_ics, seed=seed) for ic in chunk]
+
+    rows = []
+    for name in strategy_names:
+        for table_size in table_sizes:
+            hash_table = HashTable(table_size, hash_strategy=name)
+            _, collisions = hash_table.insert_many(ic_numbers)
+            row = {
+                "round": round_num,
+                "seed": seed,
+                "strategy": name,
+                "table_size": table_size,
+                "entries": num_ics,
+                "collisions": collisions,
+            }
+            row.update(chain_length_stats([len(chain) for chain in hash_table.table]))
+            rows.append(row)
+    return rows
+
+
+def _simulate_round_task(task):
+    return simulate_round(*task)
+
+
+def run_collision_simulation(table_sizes=(1009, 2003), num_rounds=10, num_ics=1000,
+                             strategy_names=("folding",), base_seed=0, workers=None):
+    # Runs every round across a process pool (workers=1 runs inline) and returns one
+    # result row per (round, strategy, table size), ordered by round.
+    tasks = [(round_num, base_seed, num_ics, list(table_sizes), list(strategy_names))
+             for round_num in range(1, num_rounds + 1)]
+    if workers == 1:
+        round_rows = map(_simulate_round_task, tasks)
+        return [row for rows in round_rows for row in rows]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        round_rows = executor.map(_simulate_round_task, tasks)
+        return [row for rows in round_rows for row in rows]
+
+
+def write_simulation_results(rows, path):
+    # Writes result rows as JSON (for .json paths) or CSV (anything else).
+    with open(path, 'w', newline='') as output_file:
+        if path.lower().endswith('.json'):
+            json.dump(rows, output_file, indent=2)
+            return
+        if rows:
+            writer = csv.DictWriter(output_file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def display_simulation_summary(rows):
+    # Console renderer: collisions per round for every (strategy, size), then averages.
+    columns = list(dict.fromkeys((row["strategy"], row["table_size"]) for row in rows))
+    rounds = list(dict.fromkeys(row["round"] for row in rows))
+    collisions = {(row["round"], row["strategy"], row["table_size"]): row["collisions"] for row in rows}
+
+    labels = [f"{strategy} (Size {size})" for strategy, size in columns]
+    width = max([len(label) for label in labels] + [10])
+    header = f"| {'Round':<8} | " + " | ".join(f"{label:<{width}}" for label in labels) + " |"
+
+    print("\n--- Summary of Collisions Per Round ---")
+    print("-" * len(header))
+    print(header)
+    print("-" * len(header))
+    for round_num in rounds:
+        cells = " | ".join(f"{collisions[(round_num,) + column]:<{width}}" for column in columns)
+        print(f"| {round_num:<8} | {cells} |")
+    print("-" * len(header))
+
+    print("\n--- Average Collisions Across All Rounds ---")
+    for strategy, size in columns:
+        values = [collisions[(round_num, strategy, size)] for round_num in rounds]
+        print(f"Average Collisions for Table Size {size} ({strategy}): {sum(values) / len(values):.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hash table collision simulation for Malaysian IC numbers.")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="compare the hash strategies instead of running the collision simulation")
+    parser.add_argument("--count", type=int,
+                        help="ICs per round (default 1000), or per benchmark run (default 10000)")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        help="table sizes (default 1009 2003, or 1009 2003 10007 for --benchmark)")
+    parser.add_argument("--strategies", nargs="+", choices=list(HASH_STRATEGIES),
+                        help="hash strategies (default: folding, or all for --benchmark)")
+    parser.add_argument("--rounds", type=int, default=10, help="simulation rounds")
+    parser.add_argument("--seed", type=int, default=0, help="base seed; each round derives its own")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count, 1 runs inline)")
+    parser.add_argument("--output", help="write simulation rows to this .csv or .json file")
+    parser.add_argument("--quiet", action="store_true", help="skip the console summary")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        display_benchmark_results(
+            benchmark_hash_strategies(generate_unique_ic_numbers(args.count or 10000),
+                                      args.sizes or [1009, 2003, 10007], args.strategies)
+        )
+    else:
+        print("--- Starting Hashing Simulation ---")
+        start_time = time.perf_counter()
+        results = run_collision_simulation(
+            table_sizes=args.sizes or [1009, 2003],
+            num_rounds=args.rounds,
+            num_ics=args.count or 1000,
+            strategy_names=args.strategies or ["folding"],
+            base_seed=args.seed,
+            workers=args.workers,
+        )
+        print(f"\n--- Simulation Complete ({len(results)} runs in {time.perf_counter() - start_time:.2f} s) ---")
+        if args.output:
+            write_simulation_results(results, args.output)
+            print(f"Results written to {args.output}")
+        if not args.quiet:
+            display_simulation_summary(results)
@@ -0,0 +1,234 @@
+import argparse
+import contextlib
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+
+# Shared micro-benchmark harness: warm-up calls, repetition until the confidence
+# interval of the mean is tight enough, order statistics, GC control, JSON results and
+# a regression check between two result files. Used by random_number_performance.py,
+# Hashing.py and graph_benchmark.py.
+GC_MODES = ("disable", "collect", "enable")
+DEFAULT_THRESHOLD = 0.05
+
+
+def percentile(sorted_values, fraction):
+    # Nearest-rank percentile of an already sorted list: the smallest value with at
+    # least `fraction` of the values at or below it.
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def t_critical(confidence, dof):
+    # Two-sided Student t quantile from the normal one (Cornish-Fisher expansion);
+    # within 1% of the exact value from 3 degrees of freedom up.
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    if dof <= 0:
+        return float('inf')
+    return (z + (z**3 + z) / (4 * dof) + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * dof**2)
+            + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * dof**3))
+
+
+def summarize(samples_ns, confidence=0.95):
+    # Statistics of a list of per-round times in nanoseconds.
+    ordered = sorted(samples_ns)
+    count = len(ordered)
+    mean = statistics.fmean(ordered) if ordered else 0.0
+    stddev = statistics.stdev(ordered) if count > 1 else 0.0
+    half_width = t_critical(confidence, count - 1) * stddev / math.sqrt(count) if count > 1 else float('inf')
+    return {
+        "rounds": count,
+        "mean_ns": mean,
+        "stddev_ns": stddev,
+        "min_ns": ordered[0] if ordered else 0,
+        "p50_ns": percentile(ordered, 0.50),
+        "p95_ns": percentile(ordered, 0.95),
+        "p99_ns": percentile(ordered, 0.99),
+        "max_ns": ordered[-1] if ordered else 0,
+        "confidence": confidence,
+        "ci_half_width_ns": half_width,
+        "relative_ci": half_width / mean if mean > 0 else float('inf'),
+    }
+
+
+@contextlib.contextmanager
+def gc_control(mode="disable"):
+    # "disable": collect once, then keep the collector off while timing (restored on
+    # exit). "collect" and "enable" leave it on; measure() additionally collects
+    # before every round for "collect".
+    if mode not in GC_MODES:
+        raise ValueError(f"Unknown GC mode '{mode}'. Choose from: {', '.join(GC_MODES)}")
+    was_enabled = gc.isenabled()
+    gc.collect()
+    if mode == "disable":
+        gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def measure(operation, setup=None, warmup=3, min_rounds=5, max_rounds=1000, target_ci=0.02,
+            confidence=0.95, max_seconds=10.0, gc_mode="disable", clock=time.perf_counter_ns):
+    # Times operation() (or operation(setup()) when `setup` is given; setup is untimed)
+    # after `warmup` untimed calls. Rounds repeat until the confidence interval of the
+    # mean is within `target_ci` of it (relative), bounded by `min_rounds`,
+    # `max_rounds` and `max_seconds` of timed work. The summary's "converged" says
+    # whether the target was met.
+    def run_round():
+        argument = setup() if setup is not None else None
+        if gc_mode == "collect":
+            gc.collect()
+        start = clock()
+        if setup is not None:
+            operation(argument)
+        else:
+            operation()
+        return clock() - start
+
+    samples = []
+    with gc_control(gc_mode):
+        for _ in range(warmup):
+            run_round()
+        budget_ns = max_seconds * 1e9
+        spent_ns = 0
+        while len(samples) < max_rounds:
+            sample = run_round()
+            samples.append(sample)
+            spent_ns += sample
+            if len(samples) >= min_rounds:
+                if summarize(samples, confidence)["relative_ci"] <= target_ci or spent_ns >= budget_ns:
+                    break
+
+    stats = summarize(samples, confidence)
+    stats["warmup"] = warmup
+    stats["gc_mode"] = gc_mode
+    stats["converged"] = stats["relative_ci"] <= target_ci
+    return stats
+
+
+def add_harness_arguments(parser):
+    # The harness options, for CLIs that time things through measure().
+    group = parser.add_argument_group("benchmark harness")
+    group.add_argument("--warmup", type=int, default=3, help="untimed calls before measuring")
+    group.add_argument("--min-rounds", type=int, default=5, help="minimum timed rounds")
+    group.add_argument("--max-rounds", type=int, default=1000, help="maximum timed rounds")
+    group.add_argument("--target-ci", type=float, default=0.02,
+                       help="stop once the CI half-width is this fraction of the mean")
+    group.add_argument("--confidence", type=float, default=0.95, help="confidence level of the interval")
+    group.add_argument("--max-seconds", type=float, default=10.0, help="timed-work budget per measurement")
+    group.add_argument("--gc", choices=GC_MODES, default="disable", dest="gc_mode",
+                       help="garbage collector during timing")
+    group.add_argument("--output", help="write the results to this JSON file")
+    group.add_argument("--compare", metavar="BASELINE", help="flag regressions against this results file")
+    group.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                       help="relative slowdown that counts as a regression")
+    return group
+
+
+def harness_options(args):
+    # The measure() keyword arguments from parsed add_harness_arguments() options.
+    return {
+        "warmup": args.warmup,
+        "min_rounds": args.min_rounds,
+        "max_rounds": args.max_rounds,
+        "target_ci": args.target_ci,
+        "confidence": args.confidence,
+        "max_seconds": args.max_seconds,
+        "gc_mode": args.gc_mode,
+    }
+
+
+def environment():
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def write_results(path, results, config=None):
+    # results: {benchmark name: measure() summary}.
+    with open(path, 'w') as output_file:
+        json.dump({"config": config or {}, "environment": environment(), "results": results},
+                  output_file, indent=2)
+
+
+def read_results(path):
+    with open(path) as input_file:
+        return json.load(input_file)["results"]
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    # One row per benchmark present in both: the relative change of the mean and a
+    # status. A change only counts when it exceeds `threshold` and the two confidence
+    # intervals do not overlap, so noise alone is reported as "unchanged".
+    rows = []
+    for name, stats in current.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        change = (stats["mean_ns"] - base["mean_ns"]) / base["mean_ns"] if base["mean_ns"] else 0.0
+        separated = abs(stats["mean_ns"] - base["mean_ns"]) > stats["ci_half_width_ns"] + base["ci_half_width_ns"]
+        if separated and change > threshold:
+            status = "regression"
+        elif separated and change < -threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append({"name": name, "baseline_ns": base["mean_ns"], "current_ns": stats["mean_ns"],
+                     "change": change, "status": status})
+    return rows
+
+
+def display_results(results):
+    header = (f"| {'Benchmark':<28} | {'Mean (ns)':>14} | {'+/- CI':>7} | {'p50 (ns)':>14} | {'p95 (ns)':>14} | "
+              f"{'p99 (ns)':>14} | {'Min (ns)':>14} | {'Rounds':>6} |")
+    print("-" * len(header))
+    print(header)
+    print("-" * len(header))
+    for name, stats in results.items():
+        marker = "" if stats.get("converged", True) else "*"
+        print(f"| {name:<28} | {stats['mean_ns']:>14,.0f} | {stats['relative_ci']:>6.1%}{marker:1}| "
+              f"{stats['p50_ns']:>14,.0f} | {stats['p95_ns']:>14,.0f} | {stats['p99_ns']:>14,.0f} | "
+              f"{stats['min_ns']:>14,.0f} | {stats['rounds']:>6} |")
+    print("-" * len(header))
+    if not all(stats.get("converged", True) for stats in results.values()):
+        print("* did not reach the target confidence interval within the round/time budget")
+
+
+def display_comparison(rows, threshold=DEFAULT_THRESHOLD):
+    print(f"\n--- Comparison against baseline (threshold {threshold:.0%}) ---")
+    header = f"| {'Benchmark':<28} | {'Baseline (ns)':>14} | {'Current (ns)':>14} | {'Change':>8} | {'Status':<11} |"
+    print("-" * len(header))
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(f"| {row['name']:<28} | {row['baseline_ns']:>14,.0f} | {row['current_ns']:>14,.0f} | "
+              f"{row['change']:>+8.1%} | {row['status']:<11} |")
+    print("-" * len(header))
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files written by the harness.")
+    parser.add_argument("baseline", help="earlier results (JSON)")
+    parser.add_argument("current", help="new results (JSON)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown that counts as a regression")
+    args = parser.parse_args()
+    if display_comparison(compare_results(read_results(args.baseline), read_results(args.current),
+                                          args.threshold), args.threshold):
+        sys.exit(1)
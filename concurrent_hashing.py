@@ -0,0 +1,240 @@
+import argparse
+import sys
+import threading
+import time
+
+from Hashing import (HashTable, generate_unique_ic_numbers, get_hash_strategy, ic_strings, normalize_ic, np, pack_ics,
+                     unpack_ic)
+
+
+class StripedHashTable(HashTable):
+    # A chained HashTable that can be shared between threads. Buckets are split into
+    # `stripes` groups (bucket index modulo stripes), each guarded by its own lock and
+    # keeping its own collision counter, so threads touching different stripes never
+    # wait on each other. Counters are only summed when read.
+
+    def __init__(self, size, stripes=16, hash_strategy="folding"):
+        self.size = size
+        self.table = [[] for _ in range(self.size)]
+        self.hash_strategy = get_hash_strategy(hash_strategy)
+        self.stripes = max(1, min(stripes, size))
+        self.locks = [threading.Lock() for _ in range(self.stripes)]
+        self.stripe_collisions = [0] * self.stripes
+
+    @property
+    def collisions(self):
+        return sum(self.stripe_collisions)
+
+    def insert(self, ic_number_str):
+        try:
+            index = self._hash(ic_number_str)
+        except ValueError as e:
+            print(f"Error inserting IC number '{ic_number_str}': {e}")
+            return
+
+        stripe = index % self.stripes
+        chain = self.table[index]
+        with self.locks[stripe]:
+            if chain:
+                self.stripe_collisions[stripe] += 1
+            chain.append(ic_number_str)
+
+    def insert_many(self, ic_numbers):
+        # Hashes the batch without holding any lock, then appends stripe by stripe.
+        keys, valid = pack_ics(ic_numbers)
+        invalid_count = len(keys) - int(sum(valid) if np is None else valid.sum())
+        if invalid_count:
+            print(f"Error inserting {invalid_count} IC number(s): not valid 12-digit numeric strings.")
+
+        if np is None:
+            bucket, size = self.hash_strategy.bucket, self.size
+            indices = [bucket(key, size) if is_valid else -1 for key, is_valid in zip(keys, valid)]
+            collisions = 0
+            for ic_number_str, key, index in zip(ic_numbers, keys, indices):
+                if index < 0:
+                    continue
+                stripe = index % self.stripes
+                chain = self.table[index]
+                with self.locks[stripe]:
+                    if chain:
+                        collisions += 1
+                        self.stripe_collisions[stripe] += 1
+                    chain.append(ic_number_str if isinstance(ic_number_str, str) else unpack_ic(key))
+            return indices, collisions
+
+        indices = np.full(len(keys), -1, dtype=np.int64)
+        indices[valid] = self._hash_many(keys[valid])
+
+        positions = np.flatnonzero(valid)
+        order = np.argsort(indices[positions] % self.stripes, kind='stable')
+        positions = positions[order]
+        stripe_of = (indices[positions] % self.stripes).tolist()
+        buckets = indices[positions].tolist()
+        # Chains always hold IC strings, whatever form (str, bytes, packed int64) the batch came in.
+        items = ic_strings(ic_numbers, positions)
+
+        collisions = 0
+        start = 0
+        while start < len(buckets):
+            stripe = stripe_of[start]
+            end = start
+            with self.locks[stripe]:
+                while end < len(buckets) and stripe_of[end] == stripe:
+                    chain = self.table[buckets[end]]
+                    if chain:
+                        collisions += 1
+                        self.stripe_collisions[stripe] += 1
+                    chain.append(items[end])
+                    end += 1
+            start = end
+        return indices, collisions
+
+    def contains(self, ic_number_str):
+        try:
+            numeric_ic_str = normalize_ic(ic_number_str)
+            index = self._hash(ic_number_str)
+        except ValueError:
+            return False
+        with self.locks[index % self.stripes]:
+            return any(entry.replace('-', '') == numeric_ic_str for entry in self.table[index])
+
+    def contains_many(self, ic_numbers):
+        return [self.contains(ic_number_str) for ic_number_str in ic_numbers]
+
+    def delete(self, ic_number_str):
+        # Removes one occurrence of the IC; returns False if it was not present.
+        try:
+            numeric_ic_str = normalize_ic(ic_number_str)
+            index = self._hash(ic_number_str)
+        except ValueError:
+            return False
+        stripe = index % self.stripes
+        with self.locks[stripe]:
+            chain = self.table[index]
+            for position, entry in enumerate(chain):
+                if entry.replace('-', '') == numeric_ic_str:
+                    # Every entry after a chain's first counted as a collision.
+                    if len(chain) > 1:
+                        self.stripe_collisions[stripe] -= 1
+                    del chain[position]
+                    return True
+        return False
+
+    def __len__(self):
+        return sum(len(chain) for chain in self.table)
+
+
+def gil_status():
+    # "disabled" only on a free-threaded build running without the GIL.
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return "enabled"
+    return "enabled" if is_gil_enabled() else "disabled"
+
+
+def _run_threads(worker, thread_count):
+    # Starts thread_count threads behind a barrier and returns the wall time from the
+    # moment they are all released until the last one finishes.
+    barrier = threading.Barrier(thread_count + 1)
+    errors = []
+
+    def run(thread_index):
+        barrier.wait()
+        try:
+            worker(thread_index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+    if errors:
+        raise errors[0]
+    return elapsed
+
+
+def stress_test(ic_numbers, thread_count, size, stripes):
+    # Concurrent insert, lookup and delete phases over disjoint slices of ic_numbers,
+    # checking the table against the expected contents after each phase.
+    table = StripedHashTable(size, stripes)
+    shares = [ic_numbers[i::thread_count] for i in range(thread_count)]
+    lookup_misses = [0] * thread_count
+
+    def insert_share(i):
+        for ic in shares[i]:
+            table.insert(ic)
+
+    def lookup_share(i):
+        lookup_misses[i] = sum(1 for ic in shares[i] if not table.contains(ic))
+
+    def delete_half(i):
+        for ic in shares[i][::2]:
+            table.delete(ic)
+
+    insert_seconds = _run_threads(insert_share, thread_count)
+    # Collisions are order independent: every insert collides except the first per bucket.
+    occupied = sum(1 for chain in table.table if chain)
+    if len(table) != len(ic_numbers) or table.get_total_collisions() != len(ic_numbers) - occupied:
+        raise AssertionError(f"Lost updates with {thread_count} threads: {len(table)} entries, "
+                             f"{table.get_total_collisions()} collisions.")
+
+    lookup_seconds = _run_threads(lookup_share, thread_count)
+    if any(lookup_misses):
+        raise AssertionError(f"{sum(lookup_misses)} inserted ICs not found with {thread_count} threads.")
+
+    delete_seconds = _run_threads(delete_half, thread_count)
+    remaining = set(ic for share in shares for ic in share[1::2])
+    stored = [ic for chain in table.table for ic in chain]
+    occupied = sum(1 for chain in table.table if chain)
+    if (len(stored) != len(remaining) or set(stored) != remaining
+            or table.get_total_collisions() != len(stored) - occupied):
+        raise AssertionError(f"Table contents wrong after concurrent deletes with {thread_count} threads.")
+
+    deleted = sum(len(share[::2]) for share in shares)
+    return {
+        "threads": thread_count,
+        "stripes": table.stripes,
+        "insert_ops_per_second": len(ic_numbers) / insert_seconds,
+        "lookup_ops_per_second": len(ic_numbers) / lookup_seconds,
+        "delete_ops_per_second": deleted / delete_seconds,
+    }
+
+
+def run_stress_benchmark(count=100000, max_threads=8, size=100003, stripes=64):
+    ic_numbers = generate_unique_ic_numbers(count, seed=0)
+    print(f"--- Striped HashTable stress test ({count} ICs, table size {size}, GIL {gil_status()}) ---")
+    header = f"| {'Threads':>7} | {'Stripes':>7} | {'Insert ops/s':>14} | {'Lookup ops/s':>14} | {'Delete ops/s':>14} | {'Speedup':>7} |"
+    print("-" * len(header))
+    print(header)
+    print("-" * len(header))
+    results = []
+    for lock_stripes in sorted({1, stripes}):
+        baseline = None
+        thread_count = 1
+        while thread_count <= max_threads:
+            row = stress_test(ic_numbers, thread_count, size, lock_stripes)
+            baseline = baseline or row["insert_ops_per_second"]
+            row["insert_speedup"] = row["insert_ops_per_second"] / baseline
+            results.append(row)
+            print(f"| {row['threads']:>7} | {row['stripes']:>7} | {row['insert_ops_per_second']:>14,.0f} | "
+                  f"{row['lookup_ops_per_second']:>14,.0f} | {row['delete_ops_per_second']:>14,.0f} | "
+                  f"{row['insert_speedup']:>6.2f}x |")
+            thread_count *= 2
+    print("-" * len(header))
+    print("All concurrent insert/lookup/delete checks passed.")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multi-threaded stress test for StripedHashTable.")
+    parser.add_argument("--count", type=int, default=100000, help="ICs inserted per run")
+    parser.add_argument("--threads", type=int, default=8, help="largest thread count (runs 1, 2, 4, ...)")
+    parser.add_argument("--size", type=int, default=100003, help="hash table size")
+    parser.add_argument("--stripes", type=int, default=64, help="lock stripes (also compared against 1)")
+    args = parser.parse_args()
+    run_stress_benchmark(args.count, args.threads, args.size, args.stripes)
@@ -1,40 +1,608 @@
-class Graph:
-    def __init__(self):
-        self.vertices = {}
-
-    def addVertex(self, vertex):
-        if vertex not in self.vertices:
-            self.vertices[vertex] = set()
-            print(f"Vertex '{vertex}' added to the graph.")
-        else:
-            print(f"Vertex '{vertex}' already exists in the graph.")
-
-    def addEdge(self, from_vertex, to_vertex):
-        if from_vertex in self.vertices and to_vertex in self.vertices:
-            # Check if the edge already exists
-            if to_vertex in self.vertices[from_vertex]:
-                print(f"Error: {from_vertex} is already following {to_vertex}.")
-            else:
-                self.vertices[from_vertex].add(to_vertex)
-                print(f"Edge added from '{from_vertex}' to '{to_vertex}'.")
-        else:
-            print(f"Error: One or both vertices ('{from_vertex}', '{to_vertex}') not found. Cannot add edge.")
-
-    def listOutgoingAdjacentVertex(self, vertex):
-        if vertex in self.vertices:
-            return self.vertices[vertex]
-        else:
-            print(f"Vertex '{vertex}' not found in the graph.")
-            return set()
-
-    def removeEdge(self, from_vertex, to_vertex):
-        if from_vertex in self.vertices and to_vertex in self.vertices[from_vertex]:
-            self.vertices[from_vertex].remove(to_vertex)
-            print(f"Edge removed from '{from_vertex}' to '{to_vertex}'.")
-        else:
-            print(f"Error: Edge from '{from_vertex}' to '{to_vertex}' does not exist or vertices not found.")
-
-    def get_all_vertices(self):
-        return list(self.vertices.keys())
-
-
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from collections.abc import Set
+
+from pagination import DEFAULT_PAGE_SIZE, check_limit, decode_cursor, encode_cursor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; CSR snapshots then use plain arrays.
+    np = None
+
+
+class _SetView(Set):
+    # Read-only view of one of Graph's adjacency sets, returned by the public getters
+    # in O(1). It reflects later edge changes, so iterating it while following or
+    # unfollowing raises RuntimeError; take set(view) to keep a snapshot. Set
+    # operators (|, &, -) return plain sets.
+    __slots__ = ("members",)
+
+    def __init__(self, members):
+        self.members = members
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+    def __len__(self):
+        return len(self.members)
+
+    def __iter__(self):
+        return iter(self.members)
+
+    def __contains__(self, name):
+        return name in self.members
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.members!r})"
+
+
+class _AdjacencyView(Set):
+    # Read-only, non-copying view of a sorted id array as a set of names, returned by
+    # CompactGraph's and CSRGraph's getters and internal traversals: len() is O(1),
+    # membership is a bisect, and iteration maps ids to names lazily.
+    __slots__ = ("id_array", "names", "ids")
+
+    def __init__(self, id_array, names, ids):
+        self.id_array = id_array
+        self.names = names
+        self.ids = ids
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+    def __len__(self):
+        return len(self.id_array)
+
+    def __iter__(self):
+        names = self.names
+        return (names[i] for i in self.id_array)
+
+    def __contains__(self, name):
+        vertex_id = self.ids.get(name)
+        if vertex_id is None:
+            return False
+        id_array = self.id_array
+        position = bisect_left(id_array, vertex_id)
+        return position < len(id_array) and id_array[position] == vertex_id
+
+    def __repr__(self):
+        return f"{type(self).__name__}({set(self)!r})"
+
+
+_NO_NEIGHBOURS = frozenset()
+
+
+class Graph:
+    # Adjacency sets at least this large get a cached sorted copy for paging, kept up
+    # to date by _link/_unlink; smaller ones are just sorted per page.
+    SORTED_PAGE_MIN_DEGREE = 256
+    SORTED_PAGE_CACHE_SIZE = 64
+
+    def __init__(self):
+        self.vertices = {}
+        # Reverse adjacency (followers), kept in step with self.vertices by addEdge/removeEdge.
+        self.incoming = {}
+        self.edge_listeners = []
+        self.vertex_listeners = []
+        self.sorted_adjacency = OrderedDict()
+
+    def addVertex(self, vertex):
+        if self._add_vertex_quietly(vertex):
+            if self.vertex_listeners:
+                self._notify_vertex_added(vertex)
+            print(f"Vertex '{vertex}' added to the graph.")
+        else:
+            print(f"Vertex '{vertex}' already exists in the graph.")
+
+    def addEdge(self, from_vertex, to_vertex):
+        outcome = self._add_edge_quietly(from_vertex, to_vertex)
+        if outcome == "added":
+            print(f"Edge added from '{from_vertex}' to '{to_vertex}'.")
+        elif outcome == "duplicate":
+            print(f"Error: {from_vertex} is already following {to_vertex}.")
+        else:
+            print(f"Error: One or both vertices ('{from_vertex}', '{to_vertex}') not found. Cannot add edge.")
+
+    def listOutgoingAdjacentVertex(self, vertex):
+        # Returns a read-only view (_SetView), so callers cannot change the adjacency
+        # through it.
+        if vertex in self.vertices:
+            return _SetView(self.vertices[vertex])
+        else:
+            print(f"Vertex '{vertex}' not found in the graph.")
+            return set()
+
+    def listIncomingAdjacentVertex(self, vertex):
+        if vertex in self.incoming:
+            return _SetView(self.incoming[vertex])
+        else:
+            print(f"Vertex '{vertex}' not found in the graph.")
+            return set()
+
+    def _out(self, vertex):
+        # Internal read-only access for traversals: the live following set (empty for
+        # unknown vertices), without the copy or console output of the public getter.
+        # Callers must not modify it or keep it across edge changes.
+        return self.vertices.get(vertex, _NO_NEIGHBOURS)
+
+    def _in(self, vertex):
+        return self.incoming.get(vertex, _NO_NEIGHBOURS)
+
+    def in_degree(self, vertex):
+        return len(self.incoming.get(vertex, ()))
+
+    def out_degree(self, vertex):
+        return len(self.vertices.get(vertex, ()))
+
+    def removeEdge(self, from_vertex, to_vertex):
+        if self._remove_edge_quietly(from_vertex, to_vertex):
+            print(f"Edge removed from '{from_vertex}' to '{to_vertex}'.")
+        else:
+            print(f"Error: Edge from '{from_vertex}' to '{to_vertex}' does not exist or vertices not found.")
+
+    def get_all_vertices(self):
+        return list(self.vertices.keys())
+
+    def has_vertex(self, vertex):
+        return vertex in self.vertices
+
+    def add_edge_listener(self, listener):
+        # listener(from_vertex, to_vertex, added) runs after every successful edge
+        # addition (added=True) or removal (added=False), including bulk operations.
+        self.edge_listeners.append(listener)
+
+    def _notify_edge_change(self, from_vertex, to_vertex, added):
+        for listener in self.edge_listeners:
+            listener(from_vertex, to_vertex, added)
+
+    def add_vertex_listener(self, listener):
+        # listener(vertex) runs after every vertex addition, single or bulk.
+        self.vertex_listeners.append(listener)
+
+    def _notify_vertex_added(self, vertex):
+        for listener in self.vertex_listeners:
+            listener(vertex)
+
+    def following_page(self, vertex, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        # Returns (names, next_cursor): up to `limit` accounts `vertex` follows, in name
+        # order, after `cursor` (None for the first page). next_cursor is None on the
+        # last page.
+        return self._adjacency_page(self.vertices, "out", vertex, cursor, limit)
+
+    def followers_page(self, vertex, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        return self._adjacency_page(self.incoming, "in", vertex, cursor, limit)
+
+    def _adjacency_page(self, adjacency, direction, vertex, cursor, limit):
+        check_limit(limit)
+        if vertex not in adjacency:
+            print(f"Vertex '{vertex}' not found in the graph.")
+            return [], None
+        neighbours = adjacency[vertex]
+        if len(neighbours) < self.SORTED_PAGE_MIN_DEGREE:
+            ordered = sorted(neighbours)
+        else:
+            ordered = self.sorted_adjacency.get((direction, vertex))
+            if ordered is None:
+                ordered = self.sorted_adjacency[(direction, vertex)] = sorted(neighbours)
+                if len(self.sorted_adjacency) > self.SORTED_PAGE_CACHE_SIZE:
+                    self.sorted_adjacency.popitem(last=False)
+            else:
+                self.sorted_adjacency.move_to_end((direction, vertex))
+        start = 0 if cursor is None else bisect_right(ordered, decode_cursor(cursor, "name"))
+        page = ordered[start:start + limit]
+        more = start + limit < len(ordered)
+        return page, encode_cursor("name", page[-1]) if more else None
+
+    def _update_sorted_adjacency(self, from_vertex, to_vertex, added):
+        for key, member in ((("out", from_vertex), to_vertex), (("in", to_vertex), from_vertex)):
+            ordered = self.sorted_adjacency.get(key)
+            if ordered is not None:
+                if added:
+                    insort(ordered, member)
+                else:
+                    del ordered[bisect_left(ordered, member)]
+
+    def export_csr(self):
+        # Returns (names, out_offsets, out_targets, in_offsets, in_targets): vertex i is
+        # names[i], and its sorted neighbour ids are targets[offsets[i]:offsets[i + 1]].
+        # Offsets are array('Q'), targets array('I').
+        names = list(self.vertices)
+        ids = {name: i for i, name in enumerate(names)}
+        csr = [names]
+        for adjacency in (self.vertices, self.incoming):
+            offsets = array('Q', [0])
+            targets = array('I')
+            for name in names:
+                targets.extend(sorted(ids[neighbour] for neighbour in adjacency[name]))
+                offsets.append(len(targets))
+            csr += [offsets, targets]
+        return tuple(csr)
+
+    def load_csr(self, names, out_offsets, out_targets, in_offsets, in_targets):
+        # Replaces the graph's contents with export_csr()-style data (any indexable
+        # sequences, e.g. memoryviews over a file). Edge listeners are not notified.
+        self.vertices = {}
+        self.incoming = {}
+        self.sorted_adjacency.clear()
+        for adjacency, offsets, targets in ((self.vertices, out_offsets, out_targets),
+                                            (self.incoming, in_offsets, in_targets)):
+            for i, name in enumerate(names):
+                adjacency[name] = {names[t] for t in targets[offsets[i]:offsets[i + 1]]}
+
+    def add_vertices(self, vertices, max_errors=20):
+        # Bulk version of addVertex: no console output, returns a summary dict instead.
+        summary = {"added": 0, "existing": 0, "errors": []}
+        for vertex in vertices:
+            if self._add_vertex_quietly(vertex):
+                summary["added"] += 1
+                if self.vertex_listeners:
+                    self._notify_vertex_added(vertex)
+            else:
+                summary["existing"] += 1
+                if len(summary["errors"]) < max_errors:
+                    summary["errors"].append(f"Vertex '{vertex}' already exists in the graph.")
+        return summary
+
+    def add_edges(self, edges, max_errors=20):
+        # Bulk version of addEdge taking (from_vertex, to_vertex) pairs. Nothing is printed;
+        # the summary counts added edges, duplicates and edges with unknown endpoints and
+        # keeps the first max_errors messages.
+        summary = {"added": 0, "duplicates": 0, "missing": 0, "errors": []}
+        errors = summary["errors"]
+        for from_vertex, to_vertex in edges:
+            outcome = self._add_edge_quietly(from_vertex, to_vertex)
+            if outcome == "added":
+                summary["added"] += 1
+                continue
+            if outcome == "duplicate":
+                summary["duplicates"] += 1
+                message = f"Error: {from_vertex} is already following {to_vertex}."
+            else:
+                summary["missing"] += 1
+                message = f"Error: One or both vertices ('{from_vertex}', '{to_vertex}') not found. Cannot add edge."
+            if len(errors) < max_errors:
+                errors.append(message)
+        return summary
+
+    def remove_edges(self, edges, max_errors=20):
+        # Bulk version of removeEdge, reporting through the returned summary.
+        summary = {"removed": 0, "missing": 0, "errors": []}
+        for from_vertex, to_vertex in edges:
+            if self._remove_edge_quietly(from_vertex, to_vertex):
+                summary["removed"] += 1
+            else:
+                summary["missing"] += 1
+                if len(summary["errors"]) < max_errors:
+                    summary["errors"].append(
+                        f"Error: Edge from '{from_vertex}' to '{to_vertex}' does not exist or vertices not found.")
+        return summary
+
+    def _add_vertex_quietly(self, vertex):
+        if vertex in self.vertices:
+            return False
+        self.vertices[vertex] = set()
+        self.incoming[vertex] = set()
+        return True
+
+    def _add_edge_quietly(self, from_vertex, to_vertex):
+        # Returns "added", "duplicate" or "missing".
+        outcome = self._link(from_vertex, to_vertex)
+        if outcome == "added" and self.edge_listeners:
+            self._notify_edge_change(from_vertex, to_vertex, True)
+        return outcome
+
+    def _remove_edge_quietly(self, from_vertex, to_vertex):
+        removed = self._unlink(from_vertex, to_vertex)
+        if removed and self.edge_listeners:
+            self._notify_edge_change(from_vertex, to_vertex, False)
+        return removed
+
+    def _link(self, from_vertex, to_vertex):
+        # Storage-level edge insert; check if the edge already exists first.
+        outgoing = self.vertices.get(from_vertex)
+        if outgoing is None or to_vertex not in self.vertices:
+            return "missing"
+        if to_vertex in outgoing:
+            return "duplicate"
+        outgoing.add(to_vertex)
+        self.incoming[to_vertex].add(from_vertex)
+        if self.sorted_adjacency:
+            self._update_sorted_adjacency(from_vertex, to_vertex, True)
+        return "added"
+
+    def _unlink(self, from_vertex, to_vertex):
+        outgoing = self.vertices.get(from_vertex)
+        if outgoing is None or to_vertex not in outgoing:
+            return False
+        outgoing.remove(to_vertex)
+        self.incoming[to_vertex].discard(from_vertex)
+        if self.sorted_adjacency:
+            self._update_sorted_adjacency(from_vertex, to_vertex, False)
+        return True
+
+
+class CompactGraph(Graph):
+    # Same API as Graph, but vertex names are interned to dense integer ids and each
+    # adjacency list is a sorted array('I') of ids (4 bytes per edge per direction)
+    # instead of a set of name strings. Sorted arrays keep edge checks at O(log degree);
+    # adding or removing a single edge is a bisect plus an O(degree) shift of the array
+    # tail (a memmove, fast in practice but linear in the degree), so loading d follows
+    # of one account through addEdge costs O(d^2). add_edges() avoids that for large
+    # arrays: it collects their new ids and merges them in once per call, O(d + k log k)
+    # for k new ids, which keeps bulk loads of celebrity accounts near-linear.
+    # Call freeze() to get a read-only CSR snapshot for traversal-heavy phases.
+
+    # Arrays shorter than this take add_edges() ids by direct insertion, which is
+    # cheaper than deferring at the typical small degree.
+    DEFERRED_MERGE_DEGREE = 64
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+        self.out_edges = []
+        self.in_edges = []
+        self.edge_count = 0
+        self.edge_listeners = []
+        self.vertex_listeners = []
+
+    def intern(self, vertex):
+        # Returns the id of an existing vertex, or None.
+        return self.ids.get(vertex)
+
+    def listOutgoingAdjacentVertex(self, vertex):
+        # Returns a read-only set of names over the stored id array, in O(1).
+        vertex_id = self.ids.get(vertex)
+        if vertex_id is not None:
+            return _AdjacencyView(self.out_edges[vertex_id], self.names, self.ids)
+        else:
+            print(f"Vertex '{vertex}' not found in the graph.")
+            return set()
+
+    def listIncomingAdjacentVertex(self, vertex):
+        vertex_id = self.ids.get(vertex)
+        if vertex_id is not None:
+            return _AdjacencyView(self.in_edges[vertex_id], self.names, self.ids)
+        else:
+            print(f"Vertex '{vertex}' not found in the graph.")
+            return set()
+
+    def _out(self, vertex):
+        vertex_id = self.ids.get(vertex)
+        if vertex_id is None:
+            return _NO_NEIGHBOURS
+        return _AdjacencyView(self.out_edges[vertex_id], self.names, self.ids)
+
+    def _in(self, vertex):
+        vertex_id = self.ids.get(vertex)
+        if vertex_id is None:
+            return _NO_NEIGHBOURS
+        return _AdjacencyView(self.in_edges[vertex_id], self.names, self.ids)
+
+    def in_degree(self, vertex):
+        vertex_id = self.ids.get(vertex)
+        return 0 if vertex_id is None else len(self.in_edges[vertex_id])
+
+    def following_page(self, vertex, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        # Pages follow id (join) order: the adjacency arrays are already sorted by id,
+        # so a page is a bisect and a slice with no extra state.
+        return self._adjacency_page(self.out_edges, vertex, cursor, limit)
+
+    def followers_page(self, vertex, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        return self._adjacency_page(self.in_edges, vertex, cursor, limit)
+
+    def _adjacency_page(self, edges, vertex, cursor, limit):
+        check_limit(limit)
+        vertex_id = self.ids.get(vertex)
+        if vertex_id is None:
+            print(f"Vertex '{vertex}' not found in the graph.")
+            return [], None
+        ids = edges[vertex_id]
+        start = 0 if cursor is None else bisect_right(ids, decode_cursor(cursor, "id"))
+        page = ids[start:start + limit]
+        more = start + limit < len(ids)
+        names = self.names
+        return [names[i] for i in page], encode_cursor("id", page[-1]) if more else None
+
+    def out_degree(self, vertex):
+        vertex_id = self.ids.get(vertex)
+        return 0 if vertex_id is None else len(self.out_edges[vertex_id])
+
+    def get_all_vertices(self):
+        return list(self.names)
+
+    def has_vertex(self, vertex):
+        return vertex in self.ids
+
+    def _add_vertex_quietly(self, vertex):
+        if vertex in self.ids:
+            return False
+        self.ids[vertex] = len(self.names)
+        self.names.append(vertex)
+        self.out_edges.append(array('I'))
+        self.in_edges.append(array('I'))
+        return True
+
+    def add_edges(self, edges, max_errors=20):
+        summary = {"added": 0, "duplicates": 0, "missing": 0, "errors": []}
+        errors = summary["errors"]
+        ids, out_edges, in_edges = self.ids, self.out_edges, self.in_edges
+        deferred_degree = self.DEFERRED_MERGE_DEGREE
+        # New ids for arrays of at least deferred_degree entries, by vertex id; they
+        # are merged in after the loop instead of being inserted one at a time.
+        new_targets = {}
+        new_sources = {}
+        added = []
+        for from_vertex, to_vertex in edges:
+            from_id = ids.get(from_vertex)
+            to_id = ids.get(to_vertex)
+            if from_id is None or to_id is None:
+                summary["missing"] += 1
+                message = f"Error: One or both vertices ('{from_vertex}', '{to_vertex}') not found. Cannot add edge."
+            else:
+                targets = out_edges[from_id]
+                position = bisect_left(targets, to_id)
+                pending = new_targets.get(from_id)
+                if ((position == len(targets) or targets[position] != to_id)
+                        and (pending is None or to_id not in pending)):
+                    if pending is not None:
+                        pending.add(to_id)
+                    elif len(targets) >= deferred_degree:
+                        new_targets[from_id] = {to_id}
+                    else:
+                        targets.insert(position, to_id)
+                    sources = in_edges[to_id]
+                    if to_id in new_sources:
+                        new_sources[to_id].append(from_id)
+                    elif len(sources) >= deferred_degree:
+                        new_sources[to_id] = [from_id]
+                    else:
+                        sources.insert(bisect_left(sources, from_id), from_id)
+                    added.append((from_vertex, to_vertex))
+                    continue
+                summary["duplicates"] += 1
+                message = f"Error: {from_vertex} is already following {to_vertex}."
+            if len(errors) < max_errors:
+                errors.append(message)
+
+        for edge_lists, new_ids in ((out_edges, new_targets), (in_edges, new_sources)):
+            for vertex_id, pending in new_ids.items():
+                # Appending the new ids as a sorted run lets Timsort re-sort the array
+                # with a single linear merge of the two runs.
+                id_array = edge_lists[vertex_id]
+                id_array.extend(sorted(pending))
+                id_array[:] = array('I', sorted(id_array))
+        summary["added"] = len(added)
+        self.edge_count += len(added)
+        if self.edge_listeners:
+            for from_vertex, to_vertex in added:
+                self._notify_edge_change(from_vertex, to_vertex, True)
+        return summary
+
+    def _link(self, from_vertex, to_vertex):
+        from_id = self.ids.get(from_vertex)
+        to_id = self.ids.get(to_vertex)
+        if from_id is None or to_id is None:
+            return "missing"
+        targets = self.out_edges[from_id]
+        position = bisect_left(targets, to_id)
+        if position < len(targets) and targets[position] == to_id:
+            return "duplicate"
+        targets.insert(position, to_id)
+        sources = self.in_edges[to_id]
+        sources.insert(bisect_left(sources, from_id), from_id)
+        self.edge_count += 1
+        return "added"
+
+    def _unlink(self, from_vertex, to_vertex):
+        from_id = self.ids.get(from_vertex)
+        to_id = self.ids.get(to_vertex)
+        if from_id is None or to_id is None:
+            return False
+        targets = self.out_edges[from_id]
+        position = bisect_left(targets, to_id)
+        if position == len(targets) or targets[position] != to_id:
+            return False
+        del targets[position]
+        sources = self.in_edges[to_id]
+        del sources[bisect_left(sources, from_id)]
+        self.edge_count -= 1
+        return True
+
+    def freeze(self):
+        return CSRGraph(self.names, self.out_edges)
+
+    def export_csr(self):
+        csr = [list(self.names)]
+        for edges in (self.out_edges, self.in_edges):
+            offsets = array('Q', [0])
+            targets = array('I')
+            for adjacency in edges:
+                targets.extend(adjacency)
+                offsets.append(len(targets))
+            csr += [offsets, targets]
+        return tuple(csr)
+
+    def load_csr(self, names, out_offsets, out_targets, in_offsets, in_targets):
+        # Buffer-backed targets (array or memoryview) are copied in one frombytes call
+        # and then cut into per-vertex arrays, without going through Python ints.
+        self.names = list(names)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        edge_lists = []
+        for offsets, targets in ((out_offsets, out_targets), (in_offsets, in_targets)):
+            all_targets = array('I')
+            all_targets.frombytes(memoryview(targets).cast('B'))
+            bounds = list(offsets)
+            edge_lists.append([all_targets[start:end] for start, end in zip(bounds, bounds[1:])])
+        self.out_edges, self.in_edges = edge_lists
+        self.edge_count = len(out_targets)
+
+
+class CSRGraph:
+    # Immutable compressed-sparse-row snapshot: the out-neighbours of vertex i are
+    # targets[offsets[i]:offsets[i + 1]]. Both are NumPy arrays when NumPy is available
+    # (int64 offsets, uint32 targets) and array('q') / array('I') otherwise.
+
+    def __init__(self, names, out_edges):
+        self.names = list(names)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        degrees = [len(targets) for targets in out_edges]
+        if np is not None:
+            self.offsets = np.zeros(len(degrees) + 1, dtype=np.int64)
+            np.cumsum(degrees, out=self.offsets[1:])
+            self.targets = np.empty(int(self.offsets[-1]), dtype=np.uint32)
+            for i, targets in enumerate(out_edges):
+                if targets:
+                    self.targets[self.offsets[i]:self.offsets[i + 1]] = np.frombuffer(targets, dtype=np.uint32)
+        else:
+            self.offsets = array('q', [0])
+            self.targets = array('I')
+            for targets in out_edges:
+                self.targets.extend(targets)
+                self.offsets.append(len(self.targets))
+
+    def __len__(self):
+        return len(self.names)
+
+    def edge_count(self):
+        return int(self.offsets[-1])
+
+    def out_neighbors(self, vertex_id):
+        return self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]]
+
+    def out_degree(self, vertex):
+        vertex_id = self.ids[vertex]
+        return int(self.offsets[vertex_id + 1] - self.offsets[vertex_id])
+
+    def in_degrees(self):
+        # In-degree of every vertex, indexed by id.
+        if np is not None:
+            return np.bincount(self.targets, minlength=len(self.names))
+        counts = array('q', [0]) * len(self.names)
+        for target in self.targets:
+            counts[target] += 1
+        return counts
+
+    def listOutgoingAdjacentVertex(self, vertex):
+        vertex_id = self.ids.get(vertex)
+        if vertex_id is not None:
+            return _AdjacencyView(self.out_neighbors(vertex_id), self.names, self.ids)
+        else:
+            print(f"Vertex '{vertex}' not found in the graph.")
+            return set()
+
+    def _out(self, vertex):
+        vertex_id = self.ids.get(vertex)
+        if vertex_id is None:
+            return _NO_NEIGHBOURS
+        return _AdjacencyView(self.out_neighbors(vertex_id), self.names, self.ids)
+
+    def get_all_vertices(self):
+        return list(self.names)
+
+    def nbytes(self):
+        if np is not None:
+            return self.offsets.nbytes + self.targets.nbytes
+        return self.offsets.itemsize * len(self.offsets) + self.targets.itemsize * len(self.targets)
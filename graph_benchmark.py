@@ -0,0 +1,140 @@
+import argparse
+import contextlib
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from benchmark_harness import (add_harness_arguments, compare_results, display_comparison, display_results,
+                               harness_options, measure, read_results, write_results)
+from graph import CompactGraph, Graph
+from graph_generator import generate_social_graph
+
+GRAPH_CLASSES = {"dict": Graph, "compact": CompactGraph}
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def time_operation(operation, arguments, **options):
+    # Times single calls of operation(*args) with the benchmark harness, one call per
+    # round, taking the args tuples in order (warm-up calls included) so no tuple is
+    # used twice; max_rounds is capped to fit. `options` go to measure(), and the
+    # summary's "calls" says how many tuples were used. Console output (addVertex,
+    # display_profile, ... all print) goes to os.devnull, so formatting is measured but
+    # the terminal is not.
+    warmup = options.get("warmup", 3)
+    options["max_rounds"] = max(1, min(options.get("max_rounds", 1000), len(arguments) - warmup))
+    options["min_rounds"] = min(options.get("min_rounds", 5), options["max_rounds"])
+    calls = iter(arguments)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        stats = measure(lambda args: operation(*args), setup=lambda: next(calls), **options)
+    stats["calls"] = stats["warmup"] + stats["rounds"]
+    stats["ops_per_second"] = 1e9 / stats["mean_ns"] if stats["mean_ns"] > 0 else float('inf')
+    return stats
+
+
+def benchmark_graph_size(user_count, graph_class=Graph, operations=10000, follows_per_user=10,
+                         seed=0, trace_memory=True, **options):
+    # Builds a synthetic graph of `user_count` users, then times up to `operations`
+    # calls of each single-item operation against it (`options` go to measure()).
+    # Peak memory covers the build (graph plus profiles); tracing slows the build, so
+    # build_seconds is marked as traced.
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    start_time = time.perf_counter()
+    graph, profiles, names = generate_social_graph(user_count, graph_class(), follows_per_user=follows_per_user,
+                                                   seed=seed)
+    build_seconds = time.perf_counter() - start_time
+    peak_memory = None
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    edge_count = sum(graph.out_degree(name) for name in names)
+    rng = random.Random(seed)
+    new_names = [f"Benchmark User {i}" for i in range(operations)]
+    new_edges = [(new_name, rng.choice(names)) for new_name in new_names]
+    existing = [(rng.choice(names),) for _ in range(operations)]
+
+    results = {}
+    results["addVertex"] = time_operation(graph.addVertex, [(name,) for name in new_names], **options)
+    # Only the users addVertex created can follow, and only the follows addEdge made
+    # can be removed, so each step runs on what the previous one used.
+    added_edges = new_edges[:results["addVertex"]["calls"]]
+    results["addEdge"] = time_operation(graph.addEdge, added_edges, **options)
+    results["removeEdge"] = time_operation(graph.removeEdge, added_edges[:results["addEdge"]["calls"]],
+                                           **options)
+    results["following"] = time_operation(graph.listOutgoingAdjacentVertex, existing, **options)
+    results["followers"] = time_operation(graph.listIncomingAdjacentVertex, existing, **options)
+    # The getters return views in O(1); listing followers also materializes the names.
+    results["followers_list"] = time_operation(lambda name: list(graph.listIncomingAdjacentVertex(name)),
+                                               existing, **options)
+    results["followers_page"] = time_operation(graph.followers_page, existing, **options)
+    results["display_profile"] = time_operation(lambda name: profiles[name].display_profile(ignore_privacy=False),
+                                                existing, **options)
+    return {
+        "users": user_count,
+        "edges": edge_count,
+        "graph": graph_class.__name__,
+        "build_seconds": build_seconds,
+        "build_traced": trace_memory,
+        "peak_memory_bytes": peak_memory,
+        "operations": results,
+    }
+
+
+def run_graph_benchmark(sizes=DEFAULT_SIZES, graph_class=Graph, operations=10000, follows_per_user=10,
+                        seed=0, trace_memory=True, **options):
+    results = []
+    for user_count in sizes:
+        results.append(benchmark_graph_size(user_count, graph_class, operations, follows_per_user,
+                                            seed, trace_memory, **options))
+    return results
+
+
+def flatten_results(results):
+    # {"<graph>/<users>/<operation>": measure() summary}, the shape the harness's
+    # write_results() and compare_results() take.
+    return {f"{row['graph']}/{row['users']}/{name}": stats
+            for row in results for name, stats in row["operations"].items()}
+
+
+def display_graph_benchmark(results):
+    for row in results:
+        memory = (f"{row['peak_memory_bytes'] / 2**20:,.1f} MiB peak"
+                  if row['peak_memory_bytes'] is not None else "memory not traced")
+        print(f"\n--- {row['graph']}: {row['users']:,} users, {row['edges']:,} follows "
+              f"(built in {row['build_seconds']:.2f} s, {memory}) ---")
+        display_results(row["operations"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scaling benchmark for the social graph on synthetic data.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="user counts to benchmark (1K to 10M)")
+    parser.add_argument("--graph", choices=list(GRAPH_CLASSES), default="dict",
+                        help="graph implementation: dict (Graph) or compact (CompactGraph)")
+    parser.add_argument("--ops", type=int, default=10000,
+                        help="distinct arguments prepared per operation and size (caps the timed calls)")
+    parser.add_argument("--follows", type=int, default=10, help="follows per generated user")
+    parser.add_argument("--seed", type=int, default=0, help="generator seed")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc (faster builds)")
+    add_harness_arguments(parser)
+    args = parser.parse_args()
+    options = harness_options(args)
+
+    results = run_graph_benchmark(args.sizes, GRAPH_CLASSES[args.graph], args.ops, args.follows,
+                                  args.seed, not args.no_memory, **options)
+    display_graph_benchmark(results)
+    flat = flatten_results(results)
+    if args.output:
+        builds = [{key: row[key] for key in ("users", "edges", "graph", "build_seconds", "build_traced",
+                                             "peak_memory_bytes")} for row in results]
+        write_results(args.output, flat, {"graph": args.graph, "ops": args.ops, "follows": args.follows,
+                                          "seed": args.seed, "builds": builds, **options})
+        print(f"Results written to {args.output}")
+    if args.compare:
+        if display_comparison(compare_results(read_results(args.compare), flat, args.threshold), args.threshold):
+            sys.exit(1)
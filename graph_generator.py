@@ -0,0 +1,107 @@
+import random
+from array import array
+
+from graph import Graph
+from person import Person
+
+FIRST_NAMES = [
+    "Aisyah", "Ahmad", "Mei Ling", "Wei Jie", "Priya", "Arjun", "Nurul", "Hafiz", "Siew Lan", "Kumar",
+    "Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Henry", "Ivy", "Jack",
+    "Kavitha", "Lim", "Farah", "Daniel", "Sofia", "Ethan", "Chloe", "Ryan", "Hannah", "Marcus",
+]
+LAST_NAMES = [
+    "Abdullah", "Tan", "Lee", "Wong", "Rahman", "Ismail", "Subramaniam", "Ng", "Lim", "Chong",
+    "Smith", "Johnson", "Brown", "Garcia", "Miller", "Davis", "Wilson", "Taylor", "Anderson", "Thomas",
+    "Hassan", "Yusof", "Krishnan", "Goh", "Ong", "Teo", "Ramasamy", "Othman", "Chan", "Lau",
+]
+GENDERS = ["Female", "Male", "Non-binary", "Prefer not to say"]
+GENDER_WEIGHTS = [48, 48, 2, 2]
+BIOGRAPHY_OPENERS = [
+    "Coffee lover", "Weekend hiker", "Software engineer", "Amateur photographer", "Bookworm",
+    "Foodie", "Marathon runner", "Cat person", "Aspiring chef", "Travel addict", "Gamer", "Student",
+]
+BIOGRAPHY_TOPICS = [
+    "street food", "open source", "badminton", "film photography", "indie music", "machine learning",
+    "gardening", "history podcasts", "board games", "mountain trails", "baking", "football",
+]
+BIOGRAPHY_TEMPLATES = [
+    "{opener} who posts about {topic}.",
+    "{opener}. Currently obsessed with {topic} and {other}.",
+    "{opener} based in {city}. Ask me about {topic}!",
+    "Into {topic}, {other} and good company. {opener} at heart.",
+]
+CITIES = ["Kuala Lumpur", "Penang", "Johor Bahru", "Ipoh", "Kuching", "Kota Kinabalu", "Melaka", "Singapore"]
+
+
+def generate_people(count, seed=None, private_ratio=0.2):
+    # Yields `count` Person records with unique names (a suffix is added once a
+    # first/last name pair repeats), a weighted gender, a templated biography and
+    # roughly `private_ratio` private profiles. The same seed gives the same people.
+    rng = random.Random(seed)
+    seen = {}
+    for _ in range(count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        repeats = seen.get(name, 0) + 1
+        seen[name] = repeats
+        if repeats > 1:
+            name = f"{name} {repeats}"
+        opener, topic, other = rng.choice(BIOGRAPHY_OPENERS), rng.choice(BIOGRAPHY_TOPICS), rng.choice(BIOGRAPHY_TOPICS)
+        biography = rng.choice(BIOGRAPHY_TEMPLATES).format(opener=opener, topic=topic, other=other,
+                                                            city=rng.choice(CITIES))
+        gender = rng.choices(GENDERS, GENDER_WEIGHTS)[0]
+        yield Person(name, gender, biography, rng.random() < private_ratio)
+
+
+def generate_follow_edges(user_count, follows_per_user=10, reciprocity=0.1, seed=None, chunk_size=100000):
+    # Preferential attachment: users join in id order and each follows up to
+    # `follows_per_user` distinct earlier users, picked with probability proportional
+    # to (followers + 1), so follower counts end up power-law distributed. Each follow
+    # is returned with probability `reciprocity` (a follow from a newer account).
+    #
+    # Yields lists of (follower_id, followed_id) pairs of at most `chunk_size` edges.
+    # The attachment pool is an array('I') of one entry per vertex plus one per
+    # follow received, i.e. about 4 * (users + edges) bytes.
+    rng = random.Random(seed)
+    pick = rng.random
+    pool = array('I')
+    chunk = []
+    for user in range(user_count):
+        if user:
+            wanted = min(follows_per_user, user)
+            chosen = set()
+            pool_size = len(pool)
+            while len(chosen) < wanted:
+                chosen.add(pool[int(pick() * pool_size)])
+            for followed in chosen:
+                chunk.append((user, followed))
+                if pick() < reciprocity:
+                    chunk.append((followed, user))
+                    pool.append(user)
+                pool.append(followed)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        pool.append(user)
+    if chunk:
+        yield chunk
+
+
+def generate_social_graph(user_count, graph=None, profiles=None, follows_per_user=10, reciprocity=0.1,
+                          seed=None, private_ratio=0.2, chunk_size=100000):
+    # Fills `graph` (a new Graph by default) and the `profiles` dict with a synthetic
+    # network through the bulk, quiet graph API. Returns (graph, profiles, names), where
+    # names[i] is the user with generator id i.
+    graph = Graph() if graph is None else graph
+    profiles = {} if profiles is None else profiles
+    names = []
+    for person in generate_people(user_count, seed=seed, private_ratio=private_ratio):
+        profiles[person.name] = person
+        names.append(person.name)
+        if len(names) % chunk_size == 0:
+            graph.add_vertices(names[-chunk_size:])
+    graph.add_vertices(names[len(names) - len(names) % chunk_size:])
+
+    edge_seed = None if seed is None else seed + 1
+    for chunk in generate_follow_edges(user_count, follows_per_user, reciprocity, edge_seed, chunk_size):
+        graph.add_edges([(names[follower], names[followed]) for follower, followed in chunk])
+    return graph, profiles, names
@@ -0,0 +1,95 @@
+import csv
+import time
+
+from person import Person
+
+DEFAULT_CHUNK_SIZE = 50000
+
+
+def _delimiter_for(path, delimiter):
+    if delimiter is not None:
+        return delimiter
+    return '\t' if path.lower().endswith(('.tsv', '.tab')) else ','
+
+
+def iter_row_chunks(path, delimiter=None, chunk_size=DEFAULT_CHUNK_SIZE, has_header=False):
+    # Streams a CSV/TSV file as lists of at most chunk_size rows. Only one chunk is held
+    # in memory at a time; blank lines and lines starting with '#' are skipped.
+    with open(path, newline='', encoding='utf-8') as input_file:
+        reader = csv.reader(input_file, delimiter=_delimiter_for(path, delimiter))
+        if has_header:
+            next(reader, None)
+        chunk = []
+        for row in reader:
+            if not row or row[0].startswith('#'):
+                continue
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _merge_summary(total, summary):
+    for key, value in summary.items():
+        if key == "errors":
+            total["errors"].extend(value[:max(0, 20 - len(total["errors"]))])
+        else:
+            total[key] = total.get(key, 0) + value
+
+
+def load_edges(graph, path, delimiter=None, chunk_size=DEFAULT_CHUNK_SIZE, has_header=False):
+    # Streams a follower,followed edge list into graph.add_edges. Returns the merged
+    # add_edges summary plus row counts, elapsed seconds and edges per second.
+    total = {"rows": 0, "malformed": 0, "errors": []}
+    start_time = time.perf_counter()
+    for chunk in iter_row_chunks(path, delimiter, chunk_size, has_header):
+        edges = [(row[0].strip(), row[1].strip()) for row in chunk if len(row) >= 2]
+        total["rows"] += len(chunk)
+        total["malformed"] += len(chunk) - len(edges)
+        _merge_summary(total, graph.add_edges(edges))
+    total["seconds"] = time.perf_counter() - start_time
+    total["edges_per_second"] = total.get("added", 0) / total["seconds"] if total["seconds"] > 0 else 0.0
+    return total
+
+
+def parse_is_private(value):
+    return value.strip().lower() in ("1", "true", "yes", "private")
+
+
+def load_people(path, profiles, graph=None, delimiter=None, chunk_size=DEFAULT_CHUNK_SIZE, has_header=False):
+    # Streams name,gender,biography[,is_private] rows into the profiles dict (and the
+    # graph's vertices, if given). Existing names are kept and counted as duplicates.
+    total = {"rows": 0, "added": 0, "duplicates": 0, "malformed": 0, "errors": []}
+    start_time = time.perf_counter()
+    for chunk in iter_row_chunks(path, delimiter, chunk_size, has_header):
+        total["rows"] += len(chunk)
+        names = []
+        for row in chunk:
+            if len(row) < 3 or not row[0].strip():
+                total["malformed"] += 1
+                continue
+            name = row[0].strip()
+            if name in profiles:
+                total["duplicates"] += 1
+                if len(total["errors"]) < 20:
+                    total["errors"].append(f"Error: A user with the name '{name}' already exists.")
+                continue
+            is_private = parse_is_private(row[3]) if len(row) > 3 else False
+            profiles[name] = Person(name, row[1].strip(), row[2].strip(), is_private)
+            names.append(name)
+        total["added"] += len(names)
+        if graph is not None:
+            graph.add_vertices(names)
+    total["seconds"] = time.perf_counter() - start_time
+    total["people_per_second"] = total["added"] / total["seconds"] if total["seconds"] > 0 else 0.0
+    return total
+
+
+def describe_load(label, summary):
+    # One-line human readable report for a load_edges / load_people summary.
+    rate_key = "edges_per_second" if "edges_per_second" in summary else "people_per_second"
+    skipped = summary.get("duplicates", 0) + summary.get("missing", 0) + summary.get("malformed", 0)
+    return (f"Loaded {summary.get('added', 0):,} {label} from {summary['rows']:,} rows "
+            f"in {summary['seconds']:.2f} s ({summary[rate_key]:,.0f}/s, {skipped:,} skipped).")
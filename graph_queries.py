@@ -0,0 +1,222 @@
+import heapq
+from collections import OrderedDict
+
+
+class LRUCache:
+    # A small OrderedDict-based LRU map with hit/miss counters. If `is_expired` is
+    # given, get() drops entries whose value it flags and counts them as misses (and
+    # expirations).
+
+    def __init__(self, max_entries=1024, is_expired=None):
+        self.max_entries = max_entries
+        self.is_expired = is_expired
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        if key in self.entries:
+            value = self.entries[key]
+            if self.is_expired is None or not self.is_expired(value):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self.entries[key]
+            self.expirations += 1
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        # Returns the evicted key, or None.
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            evicted_key, _ = self.entries.popitem(last=False)
+            self.evictions += 1
+            return evicted_key
+        return None
+
+    def pop(self, key):
+        return self.entries.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "expirations": self.expirations}
+
+
+class SocialGraphQueries:
+    # Multi-hop queries over a Graph (or CompactGraph) with per-vertex cache invalidation.
+    #
+    # Recommendations for u depend on u's follows and on their follows, so an edge change
+    # a -> b drops the cached entry for a and for every cached follower of a.
+    # A cached path (or "no path") result is registered under every vertex its
+    # bidirectional BFS discovered. Removing a -> b can only break a path through a, and
+    # adding a -> b can only create a shorter one if a was discovered by the forward
+    # search or b by the backward search, so dropping entries registered under a or b
+    # is enough.
+
+    def __init__(self, graph, cache_size=1024):
+        self.graph = graph
+        self.recommendation_cache = LRUCache(cache_size)
+        self.path_cache = LRUCache(cache_size)
+        self.path_keys_by_vertex = {}
+        self.path_vertices = {}
+        graph.add_edge_listener(self._on_edge_change)
+
+    def _on_edge_change(self, from_vertex, to_vertex, added):
+        cache = self.recommendation_cache
+        if len(cache):
+            cache.pop(from_vertex)
+            followers = self.graph._in(from_vertex)
+            if len(followers) < len(cache):
+                stale = [vertex for vertex in followers if vertex in cache]
+            else:
+                stale = [vertex for vertex in cache.entries if vertex in followers]
+            for vertex in stale:
+                cache.pop(vertex)
+
+        for vertex in (from_vertex, to_vertex):
+            for key in self.path_keys_by_vertex.pop(vertex, ()):
+                self._drop_path(key)
+
+    def _drop_path(self, key):
+        self.path_cache.pop(key)
+        for vertex in self.path_vertices.pop(key, ()):
+            keys = self.path_keys_by_vertex.get(vertex)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.path_keys_by_vertex[vertex]
+
+    def recommend(self, vertex, k=5):
+        # "People you may know": accounts followed by the accounts `vertex` follows, ranked
+        # by that mutual count (ties by name), excluding `vertex` and accounts it already
+        # follows. Returns [(name, mutual_count), ...].
+        if not self.graph.has_vertex(vertex):
+            return []
+        cached = self.recommendation_cache.get(vertex)
+        if cached is not None and cached[0] >= k:
+            return cached[1][:k]
+
+        result = self._rank_candidates(vertex, k)
+        self.recommendation_cache.put(vertex, (k, result))
+        return result
+
+    def _rank_candidates(self, vertex, k):
+        graph = self.graph
+        following = graph._out(vertex)
+        followees = list(following)
+        counts = {}
+        check_every = max(1, len(followees) // 16)
+
+        for position, followee in enumerate(followees):
+            for candidate in graph._out(followee):
+                if candidate != vertex and candidate not in following:
+                    counts[candidate] = counts.get(candidate, 0) + 1
+
+            remaining = len(followees) - position - 1
+            if remaining and len(counts) > k and position % check_every == 0:
+                leaders = heapq.nlargest(k + 1, counts.items(), key=lambda item: item[1])
+                # Early cutoff: no outsider can catch the k-th leader any more, so only
+                # the leaders' counts still need finishing, by membership checks.
+                if leaders[k - 1][1] > leaders[k][1] + remaining:
+                    top = {name: count for name, count in leaders[:k]}
+                    for later in followees[position + 1:]:
+                        later_following = graph._out(later)
+                        for name in top:
+                            if name in later_following:
+                                top[name] += 1
+                    counts = top
+                    break
+
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:k]
+
+    def shortest_follow_path(self, source, target):
+        # Shortest chain of follows from source to target as a list of names, or None.
+        if not (self.graph.has_vertex(source) and self.graph.has_vertex(target)):
+            return None
+        key = (source, target)
+        if key in self.path_cache:
+            return self.path_cache.get(key)
+        self.path_cache.misses += 1
+
+        path, discovered = self._bidirectional_bfs(source, target)
+        evicted = self.path_cache.put(key, path)
+        if evicted is not None:
+            self._drop_path(evicted)
+        self.path_vertices[key] = discovered
+        for vertex in discovered:
+            self.path_keys_by_vertex.setdefault(vertex, set()).add(key)
+        return path
+
+    def degrees_of_separation(self, source, target):
+        path = self.shortest_follow_path(source, target)
+        return None if path is None else len(path) - 1
+
+    def _bidirectional_bfs(self, source, target):
+        # Expands whole BFS levels, always on the smaller frontier. Returns the path and
+        # every vertex either side discovered.
+        if source == target:
+            return [source], {source}
+        graph = self.graph
+        forward_parent = {source: None}
+        backward_parent = {target: None}
+        forward_frontier = [source]
+        backward_frontier = [target]
+
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier = self._expand(forward_frontier, forward_parent, graph._out)
+            else:
+                backward_frontier = self._expand(backward_frontier, backward_parent, graph._in)
+            meeting = self._meeting_point(forward_parent, backward_parent, forward_frontier, backward_frontier)
+            if meeting is not None:
+                path = []
+                vertex = meeting
+                while vertex is not None:
+                    path.append(vertex)
+                    vertex = forward_parent[vertex]
+                path.reverse()
+                vertex = backward_parent[meeting]
+                while vertex is not None:
+                    path.append(vertex)
+                    vertex = backward_parent[vertex]
+                return path, set(forward_parent) | set(backward_parent)
+
+        return None, set(forward_parent) | set(backward_parent)
+
+    @staticmethod
+    def _expand(frontier, parent, neighbours):
+        next_frontier = []
+        for vertex in frontier:
+            for neighbour in neighbours(vertex):
+                if neighbour not in parent:
+                    parent[neighbour] = vertex
+                    next_frontier.append(neighbour)
+        return next_frontier
+
+    @staticmethod
+    def _meeting_point(forward_parent, backward_parent, forward_frontier, backward_frontier):
+        # Only vertices on the newest frontiers can be new meeting points.
+        for vertex in forward_frontier:
+            if vertex in backward_parent:
+                return vertex
+        for vertex in backward_frontier:
+            if vertex in forward_parent:
+                return vertex
+        return None
+
+    def cache_stats(self):
+        return {"recommendations": self.recommendation_cache.stats(), "paths": self.path_cache.stats()}
@@ -0,0 +1,194 @@
+import mmap
+import os
+import struct
+
+from Hashing import (
+    EMPTY_SLOT,
+    HashTable,
+    OpenAddressingHashTable,
+    get_hash_strategy,
+    next_prime,
+    np,
+)
+
+# File layout (version 1):
+#   header, 64 bytes, little-endian:
+#     magic b"ICHX", format version (u16), hash strategy id (u16), slot count (u64),
+#     entry count (u64), max load factor (f64), collisions (u64), total probes (u64),
+#     max probe length (u64), resizes (u64)
+#   slot array: `slot count` signed 64-bit packed IC keys in native byte order,
+#     EMPTY_SLOT (-1, all bits set) marking unused slots.
+# The slot array is laid out exactly like OpenAddressingHashTable.keys, so the same
+# probing code runs directly on the mapped pages.
+INDEX_MAGIC = b"ICHX"
+INDEX_VERSION = 1
+HEADER_FORMAT = "<4sHHQQdQQQQ"
+HEADER_SIZE = 64
+FILL_CHUNK_BYTES = 1 << 20
+
+
+def _write_empty_index(path, size, strategy_id, max_load_factor):
+    with open(path, 'wb') as index_file:
+        header = struct.pack(HEADER_FORMAT, INDEX_MAGIC, INDEX_VERSION, strategy_id,
+                             size, 0, max_load_factor, 0, 0, 0, 0)
+        index_file.write(header.ljust(HEADER_SIZE, b'\0'))
+        # EMPTY_SLOT is -1, i.e. every byte 0xFF, so the slot array can be filled in bulk.
+        remaining = size * 8
+        fill = b'\xff' * FILL_CHUNK_BYTES
+        while remaining:
+            written = index_file.write(fill[:min(remaining, FILL_CHUNK_BYTES)])
+            remaining -= written
+
+
+class MappedHashIndex(OpenAddressingHashTable):
+    # An OpenAddressingHashTable whose slot array lives in a memory-mapped file.
+    # Opening only reads the header, so it is O(1) whatever the index size; lookups
+    # fault in just the pages they probe, and any number of read-only processes share
+    # the same page cache. Writers must call flush() (or close()) to persist the header.
+    # A resize or compact() rebuilds into a new file that replaces the old one, so
+    # readers opened earlier keep seeing the old contents until they reopen.
+
+    def __init__(self, path, writable=False):
+        self.path = path
+        self.writable = writable
+        self._file = None
+        self._map = None
+        self._retiring = None
+        self._map_file(path)
+
+        (magic, version, strategy_id, size, count, max_load_factor,
+         collisions, total_probes, max_probe_length, resizes) = struct.unpack_from(HEADER_FORMAT, self._map, 0)
+        self.hash_strategy = get_hash_strategy(strategy_id)
+        self.size = size
+        self.count = count
+        self.max_load_factor = max_load_factor
+        self.collisions = collisions
+        self.total_probes = total_probes
+        self.max_probe_length = max_probe_length
+        self.resizes = resizes
+        self.keys = memoryview(self._map)[HEADER_SIZE:HEADER_SIZE + size * 8].cast('q')
+
+    def _map_file(self, path):
+        index_file = open(path, 'r+b' if self.writable else 'rb')
+        try:
+            header = index_file.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE or header[:4] != INDEX_MAGIC:
+                raise ValueError(f"'{path}' is not an IC hash index file.")
+            magic, version, _, size = struct.unpack_from("<4sHHQ", header, 0)
+            if version != INDEX_VERSION:
+                raise ValueError(f"'{path}' uses unsupported index format version {version}.")
+            if os.fstat(index_file.fileno()).st_size != HEADER_SIZE + size * 8:
+                raise ValueError(f"'{path}' is truncated or has trailing data.")
+            access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+            self._map = mmap.mmap(index_file.fileno(), 0, access=access)
+        except Exception:
+            index_file.close()
+            raise
+        self._file = index_file
+
+    @classmethod
+    def create(cls, path, size, hash_strategy="multiplicative", max_load_factor=0.7):
+        # Creates an empty index file (overwriting `path`) and opens it for writing.
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1.")
+        strategy = get_hash_strategy(hash_strategy)
+        _write_empty_index(path, next_prime(max(size, 2)), strategy.strategy_id, max_load_factor)
+        return cls(path, writable=True)
+
+    @classmethod
+    def from_table(cls, table, path, hash_strategy="multiplicative"):
+        # Writes an in-memory table out as an index file and opens it for writing.
+        # An OpenAddressingHashTable is dumped slot-for-slot (its own hash strategy is kept
+        # and nothing is rehashed); a chained HashTable is bulk-loaded into a fresh index
+        # using `hash_strategy`.
+        if isinstance(table, OpenAddressingHashTable):
+            if table._max_probe_stale:
+                table._rescan_max_probe_length()
+            with open(path, 'wb') as index_file:
+                header = struct.pack(HEADER_FORMAT, INDEX_MAGIC, INDEX_VERSION,
+                                     table.hash_strategy.strategy_id, table.size, table.count,
+                                     table.max_load_factor, table.collisions, table.total_probes,
+                                     table.max_probe_length, table.resizes)
+                index_file.write(header.ljust(HEADER_SIZE, b'\0'))
+                index_file.write(table.keys)
+            return cls(path, writable=True)
+
+        if isinstance(table, HashTable):
+            entries = [ic for chain in table.table for ic in chain]
+            index = cls.create(path, int(len(entries) / 0.7) + 1, hash_strategy)
+            index.insert_many(entries)
+            index.flush()
+            return index
+
+        raise TypeError(f"Cannot convert {type(table).__name__} into a hash index.")
+
+    def _check_writable(self):
+        if not self.writable:
+            raise ValueError(f"Hash index '{self.path}' is open read-only.")
+
+    def _buffer(self):
+        return np.frombuffer(self._map, dtype=np.int64, count=self.size, offset=HEADER_SIZE)
+
+    def _allocate(self, size):
+        # Builds the resized table in a side file; _release swaps it into place.
+        self._retiring = (self._file, self._map)
+        resize_path = self.path + ".resize"
+        _write_empty_index(resize_path, size, self.hash_strategy.strategy_id, self.max_load_factor)
+        self._map_file(resize_path)
+        self.size = size
+        self.keys = memoryview(self._map)[HEADER_SIZE:HEADER_SIZE + size * 8].cast('q')
+
+    def _release(self, old_keys):
+        old_keys.release()
+        old_file, old_map = self._retiring
+        self._retiring = None
+        old_map.close()
+        old_file.close()
+        os.replace(self.path + ".resize", self.path)
+        self.flush()
+
+    def _reserve(self, extra):
+        self._check_writable()
+        super()._reserve(extra)
+
+    def add_if_absent(self, key):
+        self._check_writable()
+        return super().add_if_absent(key)
+
+    def delete(self, ic_number_str):
+        self._check_writable()
+        return super().delete(ic_number_str)
+
+    def flush(self):
+        # Writes the header counters and pushes dirty pages to disk.
+        if not self.writable:
+            return
+        if self._max_probe_stale:
+            self._rescan_max_probe_length()
+        struct.pack_into(HEADER_FORMAT, self._map, 0, INDEX_MAGIC, INDEX_VERSION,
+                         self.hash_strategy.strategy_id, self.size, self.count,
+                         self.max_load_factor, self.collisions, self.total_probes,
+                         self.max_probe_length, self.resizes)
+        self._map.flush()
+
+    def compact(self):
+        # Rebuilds the index at the smallest prime size that keeps it under the load
+        # factor. This reclaims space after deletions and shortens probe sequences.
+        self._check_writable()
+        self._resize(int(self.count / self.max_load_factor) + 1)
+
+    def close(self):
+        if self._map is None:
+            return
+        self.flush()
+        self.keys.release()
+        self._map.close()
+        self._file.close()
+        self._map = None
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
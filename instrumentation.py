@@ -0,0 +1,390 @@
+import functools
+import importlib
+import json
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Opt-in instrumentation for the hot paths of the hash tables, the graph and the app.
+#
+# enable() swaps timing wrappers into the methods listed in HOT_PATHS and disable()
+# puts the originals back, so instrumentation costs nothing until it is switched on:
+# there is no flag check left in the hot paths. Metrics live in the module-level
+# `metrics` registry and can be written as JSON or Prometheus text, or served over
+# HTTP. New metric names are registered under the registry's lock, which readers
+# also hold while copying the dicts, so an export never sees them change size.
+# Updates to an existing metric are not locked; under the GIL a concurrent increment
+# can at worst be lost, which is acceptable for diagnostics.
+#
+# Because the wrappers replace functions on the classes, only calls that look the
+# method up after enable() are timed. A bound method taken earlier (`insert =
+# table.insert`, a callback stored at start-up) keeps calling the original, and one
+# taken while enabled keeps recording after disable(); enable() before building such
+# references. Nested hot paths are timed separately (HashTable.insert's time includes
+# its _hash call), but each collision is counted once: the bulk inserts place keys
+# themselves instead of calling insert(), so the insert and insert_many counters can
+# be added up.
+
+# Histogram bucket upper bounds in seconds, from 1 us to 5 s.
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                   1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+# (module, class, method, metric, attribute): every call is timed into the `metric`
+# histogram; when `attribute` is set, its growth during the call is added to the
+# `<metric>_<attribute>_total` counter (how collision events are counted).
+HOT_PATHS = [
+    ("Hashing", "HashTable", "insert", "hashtable_insert", "collisions"),
+    ("Hashing", "HashTable", "insert_many", "hashtable_insert_many", "collisions"),
+    ("Hashing", "HashTable", "_hash", "hashtable_hash", None),
+    ("Hashing", "OpenAddressingHashTable", "insert", "open_addressing_insert", "collisions"),
+    ("Hashing", "OpenAddressingHashTable", "insert_many", "open_addressing_insert_many", "collisions"),
+    ("Hashing", "OpenAddressingHashTable", "_hash", "open_addressing_hash", None),
+    ("graph", "Graph", "addEdge", "graph_add_edge", None),
+    ("graph", "Graph", "add_edges", "graph_add_edges", None),
+    ("graph", "Graph", "add_vertices", "graph_add_vertices", None),
+    ("graph", "Graph", "remove_edges", "graph_remove_edges", None),
+    ("graph", "Graph", "removeEdge", "graph_remove_edge", None),
+    ("graph", "Graph", "listOutgoingAdjacentVertex", "graph_following", None),
+    ("graph", "Graph", "listIncomingAdjacentVertex", "graph_followers", None),
+    ("graph", "Graph", "following_page", "graph_following_page", None),
+    ("graph", "Graph", "followers_page", "graph_followers_page", None),
+    ("graph", "CompactGraph", "add_edges", "graph_add_edges", None),
+    ("graph", "CompactGraph", "listOutgoingAdjacentVertex", "graph_following", None),
+    ("graph", "CompactGraph", "listIncomingAdjacentVertex", "graph_followers", None),
+    ("graph", "CompactGraph", "following_page", "graph_following_page", None),
+    ("graph", "CompactGraph", "followers_page", "graph_followers_page", None),
+    ("graph_queries", "SocialGraphQueries", "recommend", "query_recommend", None),
+    ("graph_queries", "SocialGraphQueries", "shortest_follow_path", "query_shortest_path", None),
+    ("person", "Person", "render_profile", "profile_render", None),
+    ("profile_store", "ProfileStore", "render_profiles", "profile_render_many", None),
+    ("profile_cache", "RenderedProfileCache", "get", "profile_cache_get", None),
+]
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "count", "total")
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, fraction):
+        # Upper bound of the bucket holding the given quantile (None when empty).
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum_seconds": self.total,
+            "p50_seconds": self.quantile(0.50),
+            "p99_seconds": self.quantile(0.99),
+            "buckets": {str(bound): count for bound, count in zip(self.buckets + ("+Inf",), self.counts)},
+        }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.counters = Counter()
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def increment(self, name, amount=1):
+        counters = self.counters
+        if name in counters:
+            counters[name] += amount
+        else:
+            with self.lock:
+                counters[name] += amount
+
+    def observe(self, name, seconds):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(name, Histogram())
+        histogram.observe(seconds)
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def _copy(self):
+        # (counters, histograms) as new dicts, taken under the lock.
+        with self.lock:
+            return dict(self.counters), dict(self.histograms)
+
+    def snapshot(self):
+        counters, histograms = self._copy()
+        snapshot = {
+            "timestamp": time.time(),
+            "counters": counters,
+            "histograms": {name: histogram.to_dict() for name, histogram in histograms.items()},
+        }
+        if tracemalloc.is_tracing():
+            snapshot["allocations"] = allocation_report()
+        return snapshot
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix="social_"):
+        # Prometheus text exposition format (version 0.0.4).
+        counters, histograms = self._copy()
+        lines = []
+        for name, value in sorted(counters.items()):
+            lines.append(f"# TYPE {prefix}{name} counter")
+            lines.append(f"{prefix}{name} {value}")
+        for name, histogram in sorted(histograms.items()):
+            metric = f"{prefix}{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f"{metric}_sum {histogram.total}")
+            lines.append(f"{metric}_count {histogram.count}")
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"# TYPE {prefix}traced_memory_bytes gauge")
+            lines.append(f"{prefix}traced_memory_bytes {current}")
+            lines.append(f"# TYPE {prefix}traced_memory_peak_bytes gauge")
+            lines.append(f"{prefix}traced_memory_peak_bytes {peak}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+_patched = []  # (class, method name, original function) for disable()
+
+
+def _timed(function, metric, attribute):
+    observe = metrics.observe
+    increment = metrics.increment
+    clock = time.perf_counter
+    counter = f"{metric}_{attribute}_total"
+
+    if attribute is None:
+        @functools.wraps(function)
+        def wrapper(self, *args, **kwargs):
+            start = clock()
+            try:
+                return function(self, *args, **kwargs)
+            finally:
+                observe(metric, clock() - start)
+    else:
+        @functools.wraps(function)
+        def wrapper(self, *args, **kwargs):
+            before = getattr(self, attribute, 0)
+            start = clock()
+            try:
+                return function(self, *args, **kwargs)
+            finally:
+                observe(metric, clock() - start)
+                grown = getattr(self, attribute, 0) - before
+                if grown > 0:
+                    increment(counter, grown)
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def is_enabled():
+    return bool(_patched)
+
+
+def enable(hot_paths=HOT_PATHS):
+    # Wraps every listed method defined directly on its class (inherited ones are
+    # covered by the parent's wrapper, overrides need their own entry). Calling
+    # enable() twice is harmless.
+    for module_name, class_name, method_name, metric, attribute in hot_paths:
+        cls = getattr(importlib.import_module(module_name), class_name, None)
+        function = cls.__dict__.get(method_name) if cls is not None else None
+        if function is None or getattr(function, "__instrumented__", False):
+            continue
+        setattr(cls, method_name, _timed(function, metric, attribute))
+        _patched.append((cls, method_name, function))
+
+
+def disable():
+    while _patched:
+        cls, method_name, function = _patched.pop()
+        setattr(cls, method_name, function)
+
+
+# --- Allocation tracking ------------------------------------------------------------
+
+def start_allocation_tracking(frames=1):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def stop_allocation_tracking():
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def allocation_report(limit=10, key_type="lineno"):
+    # Current and peak traced memory plus the `limit` largest allocation sites.
+    if not tracemalloc.is_tracing():
+        return None
+    current, peak = tracemalloc.get_traced_memory()
+    top = tracemalloc.take_snapshot().statistics(key_type)[:limit]
+    return {
+        "current_bytes": current,
+        "peak_bytes": peak,
+        "top": [{"location": str(stat.traceback), "size_bytes": stat.size, "count": stat.count} for stat in top],
+    }
+
+
+# --- Output -------------------------------------------------------------------------
+
+def write_metrics(path, format=None):
+    # Writes the metrics as Prometheus text (.prom / .txt paths, or format="prometheus")
+    # or JSON (anything else).
+    if format is None:
+        format = "prometheus" if path.lower().endswith((".prom", ".txt")) else "json"
+    with open(path, 'w') as output_file:
+        output_file.write(metrics.to_prometheus() if format == "prometheus" else metrics.to_json())
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/metrics":
+            body, content_type = metrics.to_prometheus(), "text/plain; version=0.0.4"
+        elif self.path == "/metrics.json":
+            body, content_type = metrics.to_json(), "application/json"
+        else:
+            self.send_error(404)
+            return
+        self._send(body, content_type)
+
+    def do_POST(self):
+        # Switches allocation tracking at runtime: POST /allocations/start or /allocations/stop.
+        if self.path == "/allocations/start":
+            start_allocation_tracking()
+        elif self.path == "/allocations/stop":
+            stop_allocation_tracking()
+        else:
+            self.send_error(404)
+            return
+        self._send(json.dumps({"tracking": tracemalloc.is_tracing()}), "application/json")
+
+    def _send(self, body, content_type):
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # keep the menu's console clean
+
+
+def serve_metrics(port, host="127.0.0.1"):
+    # Serves /metrics (Prometheus) and /metrics.json, and accepts POST /allocations/start
+    # and /allocations/stop, from a daemon thread; returns the server, whose shutdown()
+    # stops it.
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True).start()
+    return server
+
+
+# --- Sampling profiler --------------------------------------------------------------
+
+class SamplingProfiler:
+    # Samples one thread's Python stack every `interval` seconds from a background
+    # thread (sys._current_frames), so the profiled code runs unmodified. Samples are
+    # kept as folded stacks ("outer;inner;leaf" -> count), the input format of
+    # flamegraph.pl and speedscope.
+
+    def __init__(self, interval=0.005, thread_id=None, max_depth=64):
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.max_depth = max_depth
+        self.samples = Counter()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    @property
+    def running(self):
+        return self.thread is not None
+
+    def start(self):
+        if self.thread is None:
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def top(self, n=10):
+        # The n functions most often on top of the stack: [(frame, samples), ...].
+        leaves = Counter()
+        for stack, count in self.samples.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(n)
+
+    def write_folded(self, path):
+        with open(path, 'w') as output_file:
+            for stack, count in self.samples.most_common():
+                output_file.write(f"{stack} {count}\n")
+
+
+def install_signal_handlers(metrics_path="metrics.json", profile_path="profile.folded", interval=0.005):
+    # Attaches to a running session (Unix only): SIGUSR1 starts the sampling profiler
+    # and, on the next SIGUSR1, stops it and writes the folded stacks to `profile_path`;
+    # SIGUSR2 writes the metrics to `metrics_path`. Returns the profiler.
+    profiler = SamplingProfiler(interval)
+    if not hasattr(signal, "SIGUSR1"):
+        return profiler
+
+    def toggle_profiler(signum, frame):
+        if profiler.running:
+            profiler.stop()
+            if profile_path:
+                profiler.write_folded(profile_path)
+        else:
+            profiler.samples.clear()
+            profiler.start()
+
+    def dump_metrics(signum, frame):
+        if metrics_path:
+            write_metrics(metrics_path)
+
+    signal.signal(signal.SIGUSR1, toggle_profiler)
+    signal.signal(signal.SIGUSR2, dump_metrics)
+    return profiler
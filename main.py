@@ -1,270 +1,508 @@
-import random
-import datetime
-from graph import Graph
-from person import Person
-
-# Initializing Person objects and the social media graph
-person1 = Person("Alice Wonderland", "Female", "Loves adventures and tea parties.", False)
-person2 = Person("Bob TheBuilder", "Male", "Can we fix it? Yes we can!", False)
-person3 = Person("Charlie Chaplin", "Male", "Silent film actor and comedian.", True)
-person4 = Person("Diana Prince", "Female", "Warrior princess and ambassador of peace.", False)
-person5 = Person("Eve Harrington", "Female", "Aspiring actress with a mysterious past.", True)
-person6 = Person("Frankenstein Monster", "Male", "Misunderstood creation seeking acceptance.", False)
-person7 = Person("Grace Hopper", "Female", "Pioneering computer scientist and naval admiral.", False)
-
-people_profiles = {
-    person1.name: person1,
-    person2.name: person2,
-    person3.name: person3,
-    person4.name: person4,
-    person5.name: person5,
-    person6.name: person6,
-    person7.name: person7
-}
-
-social_media_graph = Graph()
-
-for person_name in people_profiles:
-    social_media_graph.addVertex(person_name)
-
-# Establishing initial connections
-social_media_graph.addEdge("Alice Wonderland", "Bob TheBuilder")
-social_media_graph.addEdge("Alice Wonderland", "Charlie Chaplin")
-social_media_graph.addEdge("Alice Wonderland", "Diana Prince")
-
-social_media_graph.addEdge("Bob TheBuilder", "Alice Wonderland")
-social_media_graph.addEdge("Bob TheBuilder", "Eve Harrington")
-
-social_media_graph.addEdge("Charlie Chaplin", "Alice Wonderland")
-
-social_media_graph.addEdge("Diana Prince", "Bob TheBuilder")
-social_media_graph.addEdge("Diana Prince", "Frankenstein Monster")
-
-social_media_graph.addEdge("Frankenstein Monster", "Grace Hopper")
-
-social_media_graph.addEdge("Grace Hopper", "Alice Wonderland")
-
-
-def display_menu():
-    """Displays the main menu options for the social media application with improved aesthetics."""
-    print("\n**********************************************")
-    print("      --- Social Media App Menu ---")
-    print("**********************************************")
-    print("Mandatory Features:")
-    print("  1) Display all users' names")
-    print("  2) View a person's profile in detail (Ignore privacy)")
-    print("  3) View followed accounts of a person")
-    print("  4) View followers of a person")
-    print("\nAdvanced Features:")
-    print("  5) Add a new user profile")
-    print("  6) View a person's profile (with privacy settings)")
-    print("  7) Allow a user to follow another user")
-    print("  8) Allow a user to unfollow another user")
-    print("\n  x) Exit")
-    print("==============================================")
-
-def select_from_list(items, prompt="Select an item:", item_type="profile"):
-    """
-    Displays a numbered list of items and prompts the user to select one by number.
-    Returns the selected item or None.
-    """
-    print(f"==============================================")
-    print(f"      --- {prompt} ---")
-    print(f"==============================================")
-    
-    if not items:
-        print(f"No {item_type}s available to select.")
-        return None
-
-    for i, item in enumerate(items):
-        print(f"{i+1}.) {item}")
-    print("----------------------------------------------")
-    
-    while True:
-        try:
-            choice_num_str = input(f"Select a {item_type} (1 - {len(items)}): ").strip()
-            if not choice_num_str.isdigit():
-                print("Invalid input. Please enter a number.")
-                continue
-
-            choice_num = int(choice_num_str)
-            if 1 <= choice_num <= len(items):
-                return items[choice_num - 1]
-            else:
-                print(f"Invalid number. Please enter a number between 1 and {len(items)}.")
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
-            return None
-
-def get_person_choice(prompt="Select a person:"):
-    """
-    A specialized wrapper for select_from_list to choose from all people profiles.
-    """
-    return select_from_list(list(people_profiles.keys()), prompt, "person")
-
-def get_followed_choice(follower_name, prompt="Select a user to unfollow:"):
-    """
-    A specialized wrapper for select_from_list to choose from a user's followed accounts.
-    """
-    followed_accounts = social_media_graph.listOutgoingAdjacentVertex(follower_name)
-    if not followed_accounts:
-        print(f"\n{follower_name} is not following anyone to unfollow.")
-        return None
-    return select_from_list(list(followed_accounts), prompt, "followed account")
-
-
-def view_followers(graph, target_vertex):
-    """
-    Finds and displays all users who follow the target_vertex with improved aesthetics.
-    """
-    followers = []
-    # Iterate through all vertices to find who has an outgoing edge to target_vertex
-    for vertex, outgoing_edges in graph.vertices.items():
-        if target_vertex in outgoing_edges:
-            followers.append(vertex)
-
-    print(f"\n==============================================")
-    print(f"      --- Followers of {target_vertex} ---")
-    print(f"==============================================")
-    if followers:
-        for follower in followers:
-            print(f"- {follower}")
-    else:
-        print(f"    {target_vertex} has no followers.")
-    print("----------------------------------------------")
-
-def press_any_key_to_continue():
-    """Pauses execution and waits for user input before continuing."""
-    input("\n< < < Press Enter to return to the main menu... > > >")
-
-def main():
-    """Main function to run the social media application with improved aesthetics."""
-    while True:
-        display_menu()
-        choice = input("Enter your choice: ").lower()
-
-        if choice == '1':
-            print(f"\n==============================================")
-            print("         --- All Users ---")
-            print(f"==============================================")
-            if not people_profiles:
-                print("No users in the system.")
-            else:
-                for name, person_obj in people_profiles.items():
-                    privacy_status = "Private" if person_obj.is_private else "Public"
-                    print(f"- {name} ({privacy_status})")
-            print("-------------------------------------")
-            press_any_key_to_continue()
-
-        elif choice == '2':
-            person_name = get_person_choice("View Details for Any Profile:")
-            if person_name:
-                people_profiles[person_name].display_profile(ignore_privacy=True)
-            press_any_key_to_continue()
-
-        elif choice == '3':
-            person_name = get_person_choice("View Followed Accounts:")
-            if person_name:
-                followed_accounts = social_media_graph.listOutgoingAdjacentVertex(person_name)
-                print(f"\n==============================================")
-                print(f"    --- Accounts followed by {person_name} ---")
-                print(f"==============================================")
-                if followed_accounts:
-                    for account in followed_accounts:
-                        print(f"- {account}")
-                else:
-                    print(f"    {person_name} is not following anyone.")
-                print("---------------------------------------")
-            press_any_key_to_continue()
-
-        elif choice == '4':
-            person_name = get_person_choice("View Followers:")
-            if person_name:
-                view_followers(social_media_graph, person_name)
-            press_any_key_to_continue()
-
-        elif choice == '5':
-            print(f"\n==============================================")
-            print("     --- Add New User Profile ---")
-            print(f"==============================================")
-            
-            # --- Input Validation for New User Profile ---
-            while True:
-                name = input("Enter new user's name: ").strip()
-                if not name:
-                    print("Error: User name cannot be empty. Please try again.")
-                elif name in people_profiles:
-                    print(f"Error: A user with the name '{name}' already exists. Please choose a different name.")
-                else:
-                    break # Valid name entered
-
-            while True:
-                gender = input("Enter new user's gender: ").strip()
-                if not gender:
-                    print("Error: Gender cannot be empty. Please try again.")
-                else:
-                    break # Valid gender entered
-
-            while True:
-                biography = input("Enter new user's biography: ").strip()
-                if not biography:
-                    print("Error: Biography cannot be empty. Please try again.")
-                else:
-                    break # Valid biography entered
-
-            while True:
-                is_private_input = input("Is this profile private? (yes/no): ").strip().lower()
-                if is_private_input in ['yes', 'no']:
-                    is_private = True if is_private_input == 'yes' else False
-                    break # Valid privacy setting entered
-                else:
-                    print("Error: Please enter 'yes' or 'no'.")
-            # --- End Input Validation ---
-
-            new_person = Person(name, gender, biography, is_private)
-            people_profiles[name] = new_person
-            social_media_graph.addVertex(name) # This will print "Vertex added" from graph.py
-            print(f"User '{name}' added successfully!")
-            print("-------------------------------------")
-            press_any_key_to_continue()
-
-        elif choice == '6':
-            person_name = get_person_choice("View Profile with Privacy Settings:")
-            if person_name:
-                people_profiles[person_name].display_profile(ignore_privacy=False)
-            press_any_key_to_continue()
-
-        elif choice == '7':
-            follower_name = get_person_choice("Select the user who wants to follow:")
-            if follower_name:
-                followed_name = get_person_choice("Select the user to be followed:") # This still uses the full list
-                if followed_name:
-                    if follower_name == followed_name:
-                        print("\n! ! ! A user cannot follow themselves. ! ! !")
-                    else:
-                        social_media_graph.addEdge(follower_name, followed_name)
-            press_any_key_to_continue()
-
-        elif choice == '8':
-            unfollower_name = get_person_choice("Select the user who wants to unfollow:")
-            if unfollower_name:
-                # Use the new get_followed_choice to show only who the unfollower is following
-                unfollowed_name = get_followed_choice(unfollower_name, "Select the user to unfollow:")
-                if unfollowed_name: # Only proceed if a valid followed person was selected
-                    social_media_graph.removeEdge(unfollower_name, unfollowed_name)
-            press_any_key_to_continue()
-
-        elif choice == 'x':
-            print("\n**********************************************")
-            print("    Exiting Social Media App. Goodbye!")
-            print("**********************************************")
-            break
-
-        else:
-            print("\n! ! ! Invalid choice. Please try again. ! ! !")
-            press_any_key_to_continue()
-
-if __name__ == "__main__":
-    main()
+import argparse
+import asyncio
+import random
+import sys
+import datetime
+import threading
+from graph import Graph
+from graph_loader import describe_load, load_edges, load_people
+from graph_queries import SocialGraphQueries
+from graph_ranking import InDegreeLeaderboard, PageRank
+from persistence import SocialStore
+from person import Person
+from profile_cache import RenderedProfileCache
+from profile_search import ProfileSearch
+from profile_store import ProfileStore, profiles_page, render_user_list
+
+# Initializing Person objects and the social media graph
+person1 = Person("Alice Wonderland", "Female", "Loves adventures and tea parties.", False)
+person2 = Person("Bob TheBuilder", "Male", "Can we fix it? Yes we can!", False)
+person3 = Person("Charlie Chaplin", "Male", "Silent film actor and comedian.", True)
+person4 = Person("Diana Prince", "Female", "Warrior princess and ambassador of peace.", False)
+person5 = Person("Eve Harrington", "Female", "Aspiring actress with a mysterious past.", True)
+person6 = Person("Frankenstein Monster", "Male", "Misunderstood creation seeking acceptance.", False)
+person7 = Person("Grace Hopper", "Female", "Pioneering computer scientist and naval admiral.", False)
+
+# Columnar profile storage; people_profiles behaves like a name -> Person dict
+people_profiles = ProfileStore([person1, person2, person3, person4, person5, person6, person7])
+
+social_media_graph = Graph()
+
+social_media_graph.add_vertices(people_profiles)
+
+# Establishing initial connections
+social_media_graph.add_edges([
+    ("Alice Wonderland", "Bob TheBuilder"),
+    ("Alice Wonderland", "Charlie Chaplin"),
+    ("Alice Wonderland", "Diana Prince"),
+
+    ("Bob TheBuilder", "Alice Wonderland"),
+    ("Bob TheBuilder", "Eve Harrington"),
+
+    ("Charlie Chaplin", "Alice Wonderland"),
+
+    ("Diana Prince", "Bob TheBuilder"),
+    ("Diana Prince", "Frankenstein Monster"),
+
+    ("Frankenstein Monster", "Grace Hopper"),
+
+    ("Grace Hopper", "Alice Wonderland"),
+])
+
+# Cached multi-hop queries; the cache is invalidated by the graph on every follow/unfollow
+social_queries = SocialGraphQueries(social_media_graph)
+# Leaderboards: follower counts update on every follow/unfollow, PageRank on demand
+follower_leaderboard = InDegreeLeaderboard(social_media_graph)
+influence_ranking = PageRank(social_media_graph)
+# Name autocomplete and biography search (updated through people_profiles' change listeners);
+# pick lists switch to search past PICK_LIST_LIMIT users
+profile_search = ProfileSearch(people_profiles)
+PICK_LIST_LIMIT = 20
+MORE_CHOICES = "[Show more...]"
+# Rendered profiles for options 2 and 6; people_profiles drops stale entries on every change
+profile_cache = RenderedProfileCache(people_profiles)
+# Long listings (options 1, 3 and 4) are fetched and printed one page at a time
+MENU_PAGE_SIZE = 50
+
+# Held around every change to the graph or profiles, so the storage thread (--data-dir)
+# never snapshots a half-applied change
+data_lock = threading.RLock()
+social_store = None
+
+
+def display_menu():
+    """Displays the main menu options for the social media application with improved aesthetics."""
+    print("\n**********************************************")
+    print("      --- Social Media App Menu ---")
+    print("**********************************************")
+    print("Mandatory Features:")
+    print("  1) Display all users' names")
+    print("  2) View a person's profile in detail (Ignore privacy)")
+    print("  3) View followed accounts of a person")
+    print("  4) View followers of a person")
+    print("\nAdvanced Features:")
+    print("  5) Add a new user profile")
+    print("  6) View a person's profile (with privacy settings)")
+    print("  7) Allow a user to follow another user")
+    print("  8) Allow a user to unfollow another user")
+    print("  9) People you may know (friend-of-friend suggestions)")
+    print(" 10) Degrees of separation between two users")
+    print(" 11) Most followed and most influential users")
+    print(" 12) Search users by biography")
+    print("\n  x) Exit")
+    print("==============================================")
+
+def select_from_list(items, prompt="Select an item:", item_type="profile"):
+    """
+    Displays a numbered list of items and prompts the user to select one by number.
+    Returns the selected item or None.
+    """
+    print(f"==============================================")
+    print(f"      --- {prompt} ---")
+    print(f"==============================================")
+    
+    if not items:
+        print(f"No {item_type}s available to select.")
+        return None
+
+    for i, item in enumerate(items):
+        print(f"{i+1}.) {item}")
+    print("----------------------------------------------")
+    
+    while True:
+        try:
+            choice_num_str = input(f"Select a {item_type} (1 - {len(items)}): ").strip()
+            if not choice_num_str.isdigit():
+                print("Invalid input. Please enter a number.")
+                continue
+
+            choice_num = int(choice_num_str)
+            if 1 <= choice_num <= len(items):
+                return items[choice_num - 1]
+            else:
+                print(f"Invalid number. Please enter a number between 1 and {len(items)}.")
+        except ValueError:
+            print("Invalid input. Please enter a valid number.")
+        except Exception as e:
+            print(f"An unexpected error occurred: {e}")
+            return None
+
+def get_person_choice(prompt="Select a person:"):
+    """
+    A specialized wrapper for select_from_list to choose from all people profiles.
+    With more than PICK_LIST_LIMIT users, asks for the start of a name first and only lists the matches.
+    """
+    if len(people_profiles) <= PICK_LIST_LIMIT:
+        return select_from_list(list(people_profiles.keys()), prompt, "person")
+    while True:
+        query = input(f"{prompt} Type the start of a name (Enter to cancel): ").strip()
+        if not query:
+            return None
+        matches = profile_search.search_names(query, PICK_LIST_LIMIT)
+        if matches:
+            return select_from_list(matches, prompt, "person")
+        print(f"No users match '{query}'. Please try again.")
+
+def get_followed_choice(follower_name, prompt="Select a user to unfollow:"):
+    """
+    A specialized wrapper for select_from_list to choose from a user's followed accounts.
+    The accounts are listed PICK_LIST_LIMIT at a time; the last entry of a full page shows the next one.
+    """
+    followed_accounts, cursor = social_media_graph.following_page(follower_name, limit=PICK_LIST_LIMIT)
+    if not followed_accounts:
+        print(f"\n{follower_name} is not following anyone to unfollow.")
+        return None
+    while True:
+        choice = select_from_list(followed_accounts + ([MORE_CHOICES] if cursor else []), prompt, "followed account")
+        if choice != MORE_CHOICES or cursor is None:
+            return choice
+        followed_accounts, cursor = social_media_graph.following_page(follower_name, cursor, PICK_LIST_LIMIT)
+
+
+def stream_pages(fetch_page, render_page, interactive=True, page_size=MENU_PAGE_SIZE):
+    """
+    Prints a listing page by page: fetch_page(cursor=..., limit=...) returns (items, next_cursor)
+    and render_page(items) the text for one page. Interactive listings pause between pages.
+    """
+    cursor = None
+    while True:
+        items, cursor = fetch_page(cursor=cursor, limit=page_size)
+        sys.stdout.write(render_page(items))
+        if cursor is None:
+            return
+        if interactive and input("-- Press Enter for more, or q to stop: --").strip().lower() == 'q':
+            return
+
+def render_name_lines(names):
+    return "".join(f"- {name}\n" for name in names)
+
+def view_followers(graph, target_vertex, interactive=True):
+    """
+    Finds and displays all users who follow the target_vertex with improved aesthetics.
+    """
+    print(f"\n==============================================")
+    print(f"      --- Followers of {target_vertex} ---")
+    print(f"==============================================")
+    # The graph keeps a follower index, so each page is a direct lookup
+    if graph.in_degree(target_vertex):
+        stream_pages(lambda cursor, limit: graph.followers_page(target_vertex, cursor, limit),
+                     render_name_lines, interactive)
+    else:
+        print(f"    {target_vertex} has no followers.")
+    print("----------------------------------------------")
+
+def view_recommendations(person_name, k=5):
+    """
+    Displays the top-k accounts followed by the people person_name follows.
+    """
+    suggestions = social_queries.recommend(person_name, k)
+    print(f"\n==============================================")
+    print(f"   --- People {person_name} may know ---")
+    print(f"==============================================")
+    if suggestions:
+        for name, mutual_count in suggestions:
+            print(f"- {name} (followed by {mutual_count} account(s) {person_name} follows)")
+    else:
+        print(f"    No suggestions for {person_name} yet.")
+    print("----------------------------------------------")
+
+def view_degrees_of_separation(source_name, target_name):
+    """
+    Displays the shortest chain of follows from source_name to target_name.
+    """
+    path = social_queries.shortest_follow_path(source_name, target_name)
+    print(f"\n==============================================")
+    print(f"      --- Degrees of Separation ---")
+    print(f"==============================================")
+    if path is None:
+        print(f"    {source_name} cannot reach {target_name} through follows.")
+    else:
+        print(f"{len(path) - 1} degree(s): {' --> '.join(path)}")
+    print("----------------------------------------------")
+
+def view_biography_search(query, k=10):
+    """
+    Displays the users whose biographies best match the query.
+    """
+    results = profile_search.search_biographies(query, k)
+    print(f"\n==============================================")
+    print(f"      --- Biographies matching '{query}' ---")
+    print(f"==============================================")
+    if results:
+        for name, score in results:
+            print(f"- {name} (relevance {score:.2f}): {people_profiles[name].biography}")
+    else:
+        print("    No biographies match.")
+    print("----------------------------------------------")
+
+def view_leaderboards(k=5):
+    """
+    Displays the k most followed users and the k highest PageRank scores.
+    """
+    print(f"\n==============================================")
+    print(f"      --- Top {k} Most Followed ---")
+    print(f"==============================================")
+    for position, (name, followers) in enumerate(follower_leaderboard.top_k(k), start=1):
+        print(f"{position}. {name} ({followers} follower(s))")
+    print(f"\n==============================================")
+    print(f"      --- Top {k} Most Influential ---")
+    print(f"==============================================")
+    for position, (name, score) in enumerate(influence_ranking.top_k(k), start=1):
+        print(f"{position}. {name} (influence {score:.4f})")
+    print("----------------------------------------------")
+
+def press_any_key_to_continue():
+    """Pauses execution and waits for user input before continuing."""
+    input("\n< < < Press Enter to return to the main menu... > > >")
+
+def main():
+    """Main function to run the social media application with improved aesthetics."""
+    while True:
+        display_menu()
+        choice = input("Enter your choice: ").lower()
+
+        if choice == '1':
+            print(f"\n==============================================")
+            print("         --- All Users ---")
+            print(f"==============================================")
+            if not people_profiles:
+                print("No users in the system.")
+            else:
+                stream_pages(lambda cursor, limit: profiles_page(people_profiles, cursor, limit),
+                             lambda names: render_user_list(people_profiles, names))
+            print("-------------------------------------")
+            press_any_key_to_continue()
+
+        elif choice == '2':
+            person_name = get_person_choice("View Details for Any Profile:")
+            if person_name:
+                sys.stdout.write(profile_cache.get(person_name, ignore_privacy=True))
+            press_any_key_to_continue()
+
+        elif choice == '3':
+            person_name = get_person_choice("View Followed Accounts:")
+            if person_name:
+                print(f"\n==============================================")
+                print(f"    --- Accounts followed by {person_name} ---")
+                print(f"==============================================")
+                if social_media_graph.out_degree(person_name):
+                    stream_pages(lambda cursor, limit: social_media_graph.following_page(person_name, cursor, limit),
+                                 render_name_lines)
+                else:
+                    print(f"    {person_name} is not following anyone.")
+                print("---------------------------------------")
+            press_any_key_to_continue()
+
+        elif choice == '4':
+            person_name = get_person_choice("View Followers:")
+            if person_name:
+                view_followers(social_media_graph, person_name)
+            press_any_key_to_continue()
+
+        elif choice == '5':
+            print(f"\n==============================================")
+            print("     --- Add New User Profile ---")
+            print(f"==============================================")
+            
+            # --- Input Validation for New User Profile ---
+            while True:
+                name = input("Enter new user's name: ").strip()
+                if not name:
+                    print("Error: User name cannot be empty. Please try again.")
+                elif name in people_profiles:
+                    print(f"Error: A user with the name '{name}' already exists. Please choose a different name.")
+                else:
+                    break # Valid name entered
+
+            while True:
+                gender = input("Enter new user's gender: ").strip()
+                if not gender:
+                    print("Error: Gender cannot be empty. Please try again.")
+                else:
+                    break # Valid gender entered
+
+            while True:
+                biography = input("Enter new user's biography: ").strip()
+                if not biography:
+                    print("Error: Biography cannot be empty. Please try again.")
+                else:
+                    break # Valid biography entered
+
+            while True:
+                is_private_input = input("Is this profile private? (yes/no): ").strip().lower()
+                if is_private_input in ['yes', 'no']:
+                    is_private = True if is_private_input == 'yes' else False
+                    break # Valid privacy setting entered
+                else:
+                    print("Error: Please enter 'yes' or 'no'.")
+            # --- End Input Validation ---
+
+            new_person = Person(name, gender, biography, is_private)
+            with data_lock:
+                try:
+                    people_profiles[name] = new_person
+                except ValueError as error: # e.g. too many distinct gender values
+                    print(f"Error: {error}")
+                    new_person = None
+                if new_person:
+                    social_media_graph.addVertex(name) # This will print "Vertex added" from graph.py
+                    if social_store:
+                        social_store.log_person(new_person)
+            if new_person:
+                influence_ranking.invalidate()
+                print(f"User '{name}' added successfully!")
+            print("-------------------------------------")
+            press_any_key_to_continue()
+
+        elif choice == '6':
+            person_name = get_person_choice("View Profile with Privacy Settings:")
+            if person_name:
+                sys.stdout.write(profile_cache.get(person_name, ignore_privacy=False))
+            press_any_key_to_continue()
+
+        elif choice == '7':
+            follower_name = get_person_choice("Select the user who wants to follow:")
+            if follower_name:
+                followed_name = get_person_choice("Select the user to be followed:") # This still uses the full list
+                if followed_name:
+                    if follower_name == followed_name:
+                        print("\n! ! ! A user cannot follow themselves. ! ! !")
+                    else:
+                        with data_lock:
+                            social_media_graph.addEdge(follower_name, followed_name)
+            press_any_key_to_continue()
+
+        elif choice == '8':
+            unfollower_name = get_person_choice("Select the user who wants to unfollow:")
+            if unfollower_name:
+                # Use the new get_followed_choice to show only who the unfollower is following
+                unfollowed_name = get_followed_choice(unfollower_name, "Select the user to unfollow:")
+                if unfollowed_name: # Only proceed if a valid followed person was selected
+                    with data_lock:
+                        social_media_graph.removeEdge(unfollower_name, unfollowed_name)
+            press_any_key_to_continue()
+
+        elif choice == '9':
+            person_name = get_person_choice("Suggest People For:")
+            if person_name:
+                view_recommendations(person_name)
+            press_any_key_to_continue()
+
+        elif choice == '10':
+            source_name = get_person_choice("Select the starting user:")
+            if source_name:
+                target_name = get_person_choice("Select the user to reach:")
+                if target_name:
+                    view_degrees_of_separation(source_name, target_name)
+            press_any_key_to_continue()
+
+        elif choice == '11':
+            view_leaderboards()
+            press_any_key_to_continue()
+
+        elif choice == '12':
+            query = input("Search biographies for: ").strip()
+            if query:
+                view_biography_search(query)
+            press_any_key_to_continue()
+
+        elif choice == 'x':
+            print("\n**********************************************")
+            print("    Exiting Social Media App. Goodbye!")
+            print("**********************************************")
+            break
+
+        else:
+            print("\n! ! ! Invalid choice. Please try again. ! ! !")
+            press_any_key_to_continue()
+
+def load_data_files(people_path=None, edges_path=None, has_header=False):
+    """Streams extra users and follow edges from CSV/TSV files into the running app."""
+    with data_lock:
+        if people_path:
+            summary = load_people(people_path, people_profiles, social_media_graph, has_header=has_header)
+            print(describe_load("users", summary))
+        if edges_path:
+            summary = load_edges(social_media_graph, edges_path, has_header=has_header)
+            print(describe_load("follow edges", summary))
+        influence_ranking.invalidate()
+        if social_store and (people_path or edges_path):
+            # One snapshot instead of leaving every loaded row in the log
+            social_store.checkpoint()
+
+def open_data_store(directory):
+    """Restores the users and follow graph saved in `directory`, or saves the built-in ones there."""
+    global social_store
+    with data_lock:
+        social_store = SocialStore(directory, social_media_graph, people_profiles, lock=data_lock)
+        if social_store.exists():
+            people_profiles.clear()
+            load_seconds = social_store.load()
+            follower_leaderboard.rebuild()
+            influence_ranking.invalidate()
+            print(f"Restored {len(people_profiles)} users and {len(social_media_graph.get_all_vertices())} accounts "
+                  f"from '{directory}' in {load_seconds * 1000:.1f} ms "
+                  f"({social_store.replayed_records} logged changes replayed).")
+        else:
+            social_store.checkpoint()
+            print(f"Saving users and follow edges to '{directory}'.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Social media graph app.")
+    parser.add_argument("--people", help="CSV/TSV of name,gender,biography[,is_private] rows to load at startup")
+    parser.add_argument("--edges", help="CSV/TSV of follower,followed rows to load at startup")
+    parser.add_argument("--header", action="store_true", help="the data files start with a header row")
+    parser.add_argument("--serve", type=int, metavar="PORT",
+                        help="serve the app as line-delimited JSON over TCP on PORT instead of showing the menu")
+    parser.add_argument("--host", default="127.0.0.1", help="interface for --serve")
+    parser.add_argument("--data-dir", help="directory to save the social graph in and restore it from on the next start")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="time the hot paths and write the metrics to PATH (.json, or .prom for Prometheus text) "
+                             "on exit and on SIGUSR2")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="time the hot paths and serve /metrics and /metrics.json over HTTP on PORT; "
+                             "POST /allocations/start or /allocations/stop switches allocation tracking")
+    parser.add_argument("--track-allocations", action="store_true",
+                        help="record allocations with tracemalloc from startup and report the largest sites "
+                             "with the metrics")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="sample the session's stacks and write them to PATH as folded stacks on exit "
+                             "(SIGUSR1 toggles sampling)")
+    args = parser.parse_args()
+    profiler = None
+    if args.metrics or args.metrics_port is not None or args.track_allocations or args.profile:
+        import instrumentation
+        instrumentation.enable()
+        if args.track_allocations:
+            instrumentation.start_allocation_tracking()
+        if args.metrics_port is not None:
+            instrumentation.serve_metrics(args.metrics_port, args.host)
+        # Installed for every instrumentation flag, so a session started with only
+        # --metrics-port can still be profiled and dumped from outside
+        profiler = instrumentation.install_signal_handlers(args.metrics or "session-metrics.json",
+                                                           args.profile or "session.folded")
+        if args.profile:
+            profiler.start()
+    if args.data_dir:
+        open_data_store(args.data_dir)
+    load_data_files(args.people, args.edges, args.header)
+    try:
+        if args.serve is not None:
+            from social_server import SocialServer
+            server = SocialServer(social_media_graph, people_profiles, lock=data_lock, store=social_store,
+                                  search=profile_search)
+            try:
+                asyncio.run(server.serve_forever(args.host, args.serve))
+            except KeyboardInterrupt:
+                print("\nServer stopped.")
+        else:
+            main()
+    finally:
+        if social_store:
+            social_store.close()
+        if profiler is not None:
+            if args.profile and profiler.running:
+                profiler.stop()
+                profiler.write_folded(args.profile)
+            if args.metrics:
+                instrumentation.write_metrics(args.metrics)
@@ -0,0 +1,46 @@
+import base64
+import json
+
+# Opaque keyset cursors: a page request passes back the cursor of the previous page,
+# which encodes the last key it returned (a name, vertex id or row number) tagged with
+# its kind. The next page starts strictly after that key, so follows and unfollows
+# between pages never repeat or skip an entry that exists throughout the iteration.
+DEFAULT_PAGE_SIZE = 100
+# The key type of each cursor kind; a decoded key of another type is rejected.
+CURSOR_KEY_TYPES = {"name": str, "id": int, "row": int, "position": int}
+
+
+def encode_cursor(kind, key):
+    return base64.urlsafe_b64encode(json.dumps([kind, key]).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor, kind):
+    # Returns the key stored in `cursor`; raises ValueError for a malformed cursor or
+    # one issued by a different listing.
+    try:
+        cursor_kind, key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError, AttributeError):
+        raise ValueError(f"Invalid cursor: {cursor!r}") from None
+    if cursor_kind != kind:
+        raise ValueError(f"Cursor {cursor!r} does not belong to this listing.")
+    key_type = CURSOR_KEY_TYPES.get(kind)
+    if key_type is not None and (type(key) is not key_type or (key_type is int and key < 0)):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return key
+
+
+def check_limit(limit):
+    # Page sizes must be positive integers; raises ValueError otherwise.
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"Page limit must be a positive integer, not {limit!r}.")
+
+
+def iter_pages(fetch_page, page_size=DEFAULT_PAGE_SIZE):
+    # Lazily yields the pages of fetch_page(cursor=..., limit=...) -> (items, next_cursor).
+    cursor = None
+    while True:
+        items, cursor = fetch_page(cursor=cursor, limit=page_size)
+        if items:
+            yield items
+        if cursor is None:
+            return
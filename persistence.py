@@ -0,0 +1,375 @@
+import gc
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from array import array
+
+from person import Person
+
+# Snapshot file (little-endian), version 1:
+#   header (64 bytes): magic b"SGSN", version u16, reserved u16, generation u64,
+#     vertex count u64, out-edge count u64, text length in characters u64,
+#     text length in bytes u64
+#   field offsets: u64 x (3 * vertices + 1), character offsets of name / gender /
+#     biography of every vertex into the text
+#   profile flags: u8 x vertices (0 = vertex without a profile, 1 = public, 2 = private)
+#   padding to 8 bytes
+#   out-edge CSR: offsets u64 x (vertices + 1), targets u32 x edges
+#   in-edge CSR: offsets u64 x (vertices + 1), targets u32 x edges
+#   text: every field concatenated, UTF-8
+# Log file: header b"SGLG" + generation u64, then records of
+#   [payload length u32][crc32 u32][payload: op u8, then u32-length-prefixed UTF-8 fields].
+# The log only holds mutations made after the snapshot of the same generation.
+SNAPSHOT_MAGIC = b"SGSN"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER_FORMAT = "<4sHHQQQQQ"
+SNAPSHOT_HEADER_SIZE = 64
+LOG_MAGIC = b"SGLG"
+LOG_HEADER_FORMAT = "<4sQ"
+LOG_HEADER_SIZE = struct.calcsize(LOG_HEADER_FORMAT)
+RECORD_HEADER_FORMAT = "<II"
+RECORD_HEADER_SIZE = struct.calcsize(RECORD_HEADER_FORMAT)
+
+OP_ADD_VERTEX = 1
+OP_ADD_EDGE = 2
+OP_REMOVE_EDGE = 3
+OP_PUT_PROFILE = 4
+OP_REMOVE_PROFILE = 5
+
+NO_PROFILE = 0
+PUBLIC_PROFILE = 1
+PRIVATE_PROFILE = 2
+
+
+def _fsync_directory(directory):
+    # Makes renames inside `directory` durable; not every platform supports it.
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def encode_record(op, *fields):
+    payload = bytearray([op])
+    for field in fields:
+        encoded = field.encode('utf-8')
+        payload += struct.pack("<I", len(encoded))
+        payload += encoded
+    return struct.pack(RECORD_HEADER_FORMAT, len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_records(buffer, start):
+    # Yields (op, fields, end_offset) for every intact record from `start`. Stops at the
+    # first truncated or corrupt record, which is where a crash mid-write would leave off.
+    position = start
+    while position + RECORD_HEADER_SIZE <= len(buffer):
+        length, checksum = struct.unpack_from(RECORD_HEADER_FORMAT, buffer, position)
+        payload_start = position + RECORD_HEADER_SIZE
+        payload = bytes(buffer[payload_start:payload_start + length])
+        if len(payload) != length or length == 0 or zlib.crc32(payload) != checksum:
+            return
+        fields = []
+        offset = 1
+        while offset < length:
+            (field_length,) = struct.unpack_from("<I", payload, offset)
+            offset += 4
+            fields.append(payload[offset:offset + field_length].decode('utf-8'))
+            offset += field_length
+        position = payload_start + length
+        yield payload[0], fields, position
+
+
+class SocialStore:
+    # Durable storage for a Graph (or CompactGraph) plus its people_profiles dict:
+    # a binary snapshot and an append-only mutation log in `directory`.
+    #
+    # Edge changes and new vertices are captured through the graph's edge and vertex
+    # listeners (a vertex that already has a profile is covered by the profile's
+    # record). With a ProfileStore, new users, profile edits (including ProfileView
+    # setters) and deletions are captured through its change listener; clear() is not
+    # logged, so checkpoint() after it. A plain dict cannot report changes, so its users
+    # and edits are recorded with log_person(). Records are buffered and written +
+    # fsync'd once batch_size records are pending, when flush() is called, or by the
+    # background thread every sync_interval seconds, so a crash loses at most that
+    # window. The same thread compacts (rewrites the snapshot and starts an empty log)
+    # once the log grows past compact_bytes. It takes `lock`, so callers that mutate the
+    # graph or profiles from other threads must hold the same lock while doing so.
+
+    def __init__(self, directory, graph, profiles, lock=None, batch_size=256,
+                 sync_interval=1.0, compact_bytes=64 * 1024 * 1024, background=True):
+        self.directory = directory
+        self.graph = graph
+        self.profiles = profiles
+        self.lock = lock or threading.RLock()
+        self.batch_size = batch_size
+        self.sync_interval = sync_interval
+        self.compact_bytes = compact_bytes
+        self.snapshot_path = os.path.join(directory, "snapshot.bin")
+        self.log_path = os.path.join(directory, "log.bin")
+        self.generation = 0
+        self.pending = []
+        self.replayed_records = 0
+        self._log_file = None
+        self._replaying = False
+        self._stop = threading.Event()
+        self._background = background
+        self._thread = None
+        os.makedirs(directory, exist_ok=True)
+        graph.add_edge_listener(self._on_edge_change)
+        graph.add_vertex_listener(self._on_vertex_added)
+        self._tracks_profiles = hasattr(profiles, "add_change_listener")
+        if self._tracks_profiles:
+            profiles.add_change_listener(self._on_profile_change)
+
+    def exists(self):
+        return os.path.exists(self.snapshot_path) or os.path.exists(self.log_path)
+
+    # --- Loading -----------------------------------------------------------------
+
+    def load(self):
+        # Loads the snapshot and replays the log tail into the (empty) graph and profiles,
+        # then opens the log for appending. Returns the load time in seconds.
+        start_time = time.perf_counter()
+        # Loading allocates millions of long-lived objects; pausing the cyclic GC avoids
+        # repeatedly rescanning them while they are created.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with self.lock:
+                if os.path.exists(self.snapshot_path):
+                    # Restoring profiles fires the change listener; nothing to log.
+                    self._replaying = True
+                    try:
+                        self._load_snapshot()
+                    finally:
+                        self._replaying = False
+                self._replay_log()
+                self._start_background()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return time.perf_counter() - start_time
+
+    def _load_snapshot(self):
+        with open(self.snapshot_path, 'rb') as snapshot_file:
+            with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self._decode_snapshot(mapped)
+
+    def _decode_snapshot(self, mapped):
+        (magic, version, _, generation, vertex_count, edge_count,
+         text_chars, text_bytes) = struct.unpack_from(SNAPSHOT_HEADER_FORMAT, mapped, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"'{self.snapshot_path}' is not a version {SNAPSHOT_VERSION} social graph snapshot.")
+        self.generation = generation
+
+        view = memoryview(mapped)
+        try:
+            position = SNAPSHOT_HEADER_SIZE
+            field_offsets = view[position:position + (3 * vertex_count + 1) * 8].cast('Q')
+            position += (3 * vertex_count + 1) * 8
+            flags = view[position:position + vertex_count]
+            position += vertex_count
+            position += -position % 8
+
+            csr = []
+            for _ in range(2):
+                offsets = view[position:position + (vertex_count + 1) * 8].cast('Q')
+                position += (vertex_count + 1) * 8
+                targets = view[position:position + edge_count * 4].cast('I')
+                position += edge_count * 4
+                csr += [offsets, targets]
+
+            text = str(view[position:position + text_bytes], 'utf-8')
+            bounds = field_offsets.tolist()
+            fields = [text[start:end] for start, end in zip(bounds, bounds[1:])]
+            names = fields[0::3]
+            self.graph.load_csr(names, *csr)
+
+            profiles = self.profiles
+            for name, gender, biography, flag in zip(names, fields[1::3], fields[2::3], bytes(flags)):
+                if flag != NO_PROFILE:
+                    profiles[name] = Person(name, gender, biography, flag == PRIVATE_PROFILE)
+            del csr, offsets, targets, field_offsets, flags
+        finally:
+            view.release()
+
+    def _replay_log(self):
+        if os.path.exists(self.log_path):
+            with open(self.log_path, 'rb') as log_file:
+                data = log_file.read()
+            valid_end = LOG_HEADER_SIZE
+            if len(data) >= LOG_HEADER_SIZE:
+                magic, generation = struct.unpack_from(LOG_HEADER_FORMAT, data, 0)
+                # A log from an older generation is already folded into the snapshot
+                # (a crash hit between writing the snapshot and resetting the log).
+                if magic == LOG_MAGIC and generation == self.generation:
+                    self._replaying = True
+                    try:
+                        for op, fields, end in decode_records(data, LOG_HEADER_SIZE):
+                            self._apply(op, fields)
+                            self.replayed_records += 1
+                            valid_end = end
+                    finally:
+                        self._replaying = False
+                    if valid_end < len(data):
+                        # Drop a torn tail so new records follow the last intact one.
+                        with open(self.log_path, 'r+b') as log_file:
+                            log_file.truncate(valid_end)
+                    self._log_file = open(self.log_path, 'ab')
+                    return
+        self._reset_log()
+
+    def _apply(self, op, fields):
+        if op == OP_ADD_VERTEX:
+            self.graph.add_vertices(fields[:1])
+        elif op == OP_ADD_EDGE:
+            self.graph.add_edges([tuple(fields[:2])])
+        elif op == OP_REMOVE_EDGE:
+            self.graph.remove_edges([tuple(fields[:2])])
+        elif op == OP_PUT_PROFILE:
+            name, gender, biography, is_private = fields[:4]
+            self.profiles[name] = Person(name, gender, biography, is_private == "1")
+            self.graph.add_vertices([name])
+        elif op == OP_REMOVE_PROFILE:
+            self.profiles.pop(fields[0], None)
+
+    # --- Logging -----------------------------------------------------------------
+
+    def _on_edge_change(self, from_vertex, to_vertex, added):
+        if not self._replaying:
+            self._append(encode_record(OP_ADD_EDGE if added else OP_REMOVE_EDGE, from_vertex, to_vertex))
+
+    def _on_profile_change(self, name):
+        if self._replaying or name is None:
+            return
+        person = self.profiles.get(name)
+        if person is None:
+            self._append(encode_record(OP_REMOVE_PROFILE, name))
+        else:
+            self._write_person(person)
+
+    def _on_vertex_added(self, name):
+        if not self._replaying and name not in self.profiles:
+            self._append(encode_record(OP_ADD_VERTEX, name))
+
+    def log_person(self, person):
+        # Records a new user or an edit of an existing profile (the latest record wins).
+        # A ProfileStore's changes are already logged by its change listener.
+        if not self._tracks_profiles:
+            self._write_person(person)
+
+    def _write_person(self, person):
+        self._append(encode_record(OP_PUT_PROFILE, person.name, person.gender, person.biography,
+                                   "1" if person.is_private else "0"))
+
+    def _append(self, record):
+        with self.lock:
+            self.pending.append(record)
+            if len(self.pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        # Writes every pending record and fsyncs the log.
+        with self.lock:
+            if not self.pending or self._log_file is None:
+                return
+            self._log_file.write(b"".join(self.pending))
+            self._log_file.flush()
+            os.fsync(self._log_file.fileno())
+            self.pending = []
+
+    def _reset_log(self):
+        # Starts an empty log for the current generation (atomically replacing the old one).
+        if self._log_file is not None:
+            self._log_file.close()
+        temporary_path = self.log_path + ".tmp"
+        with open(temporary_path, 'wb') as log_file:
+            log_file.write(struct.pack(LOG_HEADER_FORMAT, LOG_MAGIC, self.generation))
+            log_file.flush()
+            os.fsync(log_file.fileno())
+        os.replace(temporary_path, self.log_path)
+        _fsync_directory(self.directory)
+        self._log_file = open(self.log_path, 'ab')
+
+    # --- Snapshots and compaction ---------------------------------------------------
+
+    def checkpoint(self):
+        # Writes a new snapshot of the current state and empties the log.
+        with self.lock:
+            self.flush()
+            self.generation += 1
+            self._write_snapshot()
+            self._reset_log()
+            self._start_background()
+
+    def _write_snapshot(self):
+        names, out_offsets, out_targets, in_offsets, in_targets = self.graph.export_csr()
+        field_offsets = array('Q', [0])
+        flags = bytearray(len(names))
+        parts = []
+        length = 0
+        for i, name in enumerate(names):
+            person = self.profiles.get(name)
+            if person is None:
+                values = (name, "", "")
+            else:
+                values = (name, person.gender, person.biography)
+                flags[i] = PRIVATE_PROFILE if person.is_private else PUBLIC_PROFILE
+            for value in values:
+                parts.append(value)
+                length += len(value)
+                field_offsets.append(length)
+        text = "".join(parts).encode('utf-8')
+
+        temporary_path = self.snapshot_path + ".tmp"
+        with open(temporary_path, 'wb') as snapshot_file:
+            header = struct.pack(SNAPSHOT_HEADER_FORMAT, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0,
+                                 self.generation, len(names), len(out_targets), length, len(text))
+            snapshot_file.write(header.ljust(SNAPSHOT_HEADER_SIZE, b'\0'))
+            snapshot_file.write(field_offsets)
+            snapshot_file.write(flags)
+            snapshot_file.write(b'\0' * (-(SNAPSHOT_HEADER_SIZE + len(field_offsets) * 8 + len(flags)) % 8))
+            for array_part in (out_offsets, out_targets, in_offsets, in_targets):
+                snapshot_file.write(array_part)
+            snapshot_file.write(text)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        _fsync_directory(self.directory)
+
+    def log_size(self):
+        with self.lock:
+            pending_bytes = sum(len(record) for record in self.pending)
+            return (self._log_file.tell() if self._log_file else 0) + pending_bytes
+
+    def _start_background(self):
+        if self._background and self._thread is None:
+            self._thread = threading.Thread(target=self._background_loop, name="SocialStore", daemon=True)
+            self._thread.start()
+
+    def _background_loop(self):
+        while not self._stop.wait(self.sync_interval):
+            with self.lock:
+                self.flush()
+                if self.log_size() > self.compact_bytes:
+                    self.checkpoint()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self.lock:
+            self.flush()
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
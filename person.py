@@ -1,20 +1,29 @@
-class Person:
-    def __init__(self, name, gender, biography, is_private=False):
-        self.name = name
-        self.gender = gender
-        self.biography = biography
-        self.is_private = is_private
-
-    def display_profile(self, ignore_privacy=True):
-        print(f"\n------- Profile of {self.name} -------")
-        print(f"Name: {self.name}")
-        if not self.is_private or ignore_privacy:
-            print(f"Gender: {self.gender}")
-            print(f"Biography: {self.biography}")
-        else:
-            print("This profile is private. Details are hidden.")
-        print(f"Profile Status: {'Private' if self.is_private else 'Public'}")
-        print("-------------------------------------------\n")
-
-    def __str__(self):
-        return self.name
+class Person:
+    # __slots__ drops the per-instance __dict__ (roughly 100 bytes less per profile).
+    __slots__ = ("name", "gender", "biography", "is_private")
+
+    def __init__(self, name, gender, biography, is_private=False):
+        self.name = name
+        self.gender = gender
+        self.biography = biography
+        self.is_private = is_private
+
+    def render_profile(self, ignore_privacy=True):
+        # The text display_profile prints, as one string (without the trailing newline).
+        return render_profile(self.name, self.gender, self.biography, self.is_private, ignore_privacy)
+
+    def display_profile(self, ignore_privacy=True):
+        print(self.render_profile(ignore_privacy))
+
+    def __str__(self):
+        return self.name
+
+
+def render_profile(name, gender, biography, is_private, ignore_privacy=True):
+    if not is_private or ignore_privacy:
+        details = f"Gender: {gender}\nBiography: {biography}\n"
+    else:
+        details = "This profile is private. Details are hidden.\n"
+    return (f"\n------- Profile of {name} -------\nName: {name}\n{details}"
+            f"Profile Status: {'Private' if is_private else 'Public'}\n"
+            "-------------------------------------------\n")
@@ -0,0 +1,66 @@
+import time
+
+from graph_queries import LRUCache
+
+
+def render_profile_text(person, ignore_privacy):
+    # What display_profile prints, including the final newline.
+    return person.render_profile(ignore_privacy) + "\n"
+
+
+def render_profile_payload(person, ignore_privacy):
+    # The server's JSON form: hidden fields are left out of private profiles.
+    payload = {"name": person.name, "is_private": person.is_private}
+    if not person.is_private or ignore_privacy:
+        payload["gender"] = person.gender
+        payload["biography"] = person.biography
+    return payload
+
+
+class RenderedProfileCache:
+    # Bounded LRU cache of rendered profiles, keyed by (name, ignore_privacy), so the
+    # full and privacy-respecting renderings of a user are cached separately.
+    #
+    # Entries can also expire after `ttl` seconds. They are dropped as soon as the user
+    # changes: a ProfileStore reports additions, edits (including the privacy flag)
+    # and deletions through its change listeners. Plain dicts cannot, so callers using
+    # one must call invalidate(name) after editing a profile.
+
+    def __init__(self, profiles, render=render_profile_text, max_entries=4096, ttl=None, clock=time.monotonic):
+        self.profiles = profiles
+        self.render = render
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = LRUCache(max_entries, None if ttl is None else self._expired)
+        self.invalidations = 0
+        if hasattr(profiles, "add_change_listener"):
+            profiles.add_change_listener(self.invalidate)
+
+    def get(self, name, ignore_privacy=True):
+        # Returns the rendered profile of `name`; raises KeyError for an unknown user.
+        key = (name, ignore_privacy)
+        cached = self.entries.get(key)
+        if cached is not None:
+            return cached[1]
+        payload = self.render(self.profiles[name], ignore_privacy)
+        expires_at = None if self.ttl is None else self.clock() + self.ttl
+        self.entries.put(key, (expires_at, payload))
+        return payload
+
+    def _expired(self, cached):
+        return self.clock() >= cached[0]
+
+    def invalidate(self, name=None):
+        # Drops both renderings of `name`, or everything for None.
+        if name is None:
+            self.invalidations += len(self.entries)
+            self.entries.clear()
+            return
+        for ignore_privacy in (True, False):
+            if self.entries.pop((name, ignore_privacy)) is not None:
+                self.invalidations += 1
+
+    def stats(self):
+        stats = self.entries.stats()
+        stats["invalidations"] = self.invalidations
+        return stats
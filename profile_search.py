@@ -0,0 +1,261 @@
+import heapq
+import math
+import re
+import threading
+from array import array
+from bisect import bisect_left
+
+from profile_store import ProfileStore
+
+TOKEN_PATTERN = re.compile(r"\w+")
+STOP_WORDS = frozenset("a an and are as at be but by for from has have i in is it its me my of on or so "
+                       "the to was who with".split())
+
+
+def tokenize(text):
+    return [token for token in TOKEN_PATTERN.findall(text.casefold()) if token not in STOP_WORDS]
+
+
+class NameIndex:
+    # Autocomplete over user names: a sorted list of "key\0name" strings searched with
+    # bisect. Every word of a name starts an entry ("grace hopper", "hopper"), so a
+    # prefix of any word matches, case-insensitively. Adding a user is one insort per
+    # word (a memmove of the list tail); a lookup is a bisect plus the matches read.
+    # Plain strings sort about 3x faster than (key, name) tuples and take less memory.
+
+    def __init__(self, names=()):
+        entries = []
+        for name in names:
+            entries.extend(self._entries(name))
+        entries.sort()
+        self.entries = entries
+
+    @staticmethod
+    def _entries(name):
+        words = name.casefold().split()
+        return [" ".join(words[i:]) + "\0" + name for i in range(len(words))]
+
+    def add(self, name):
+        for entry in self._entries(name):
+            position = bisect_left(self.entries, entry)
+            if position == len(self.entries) or self.entries[position] != entry:
+                self.entries.insert(position, entry)
+
+    def remove(self, name):
+        for entry in self._entries(name):
+            position = bisect_left(self.entries, entry)
+            if position < len(self.entries) and self.entries[position] == entry:
+                del self.entries[position]
+
+    def search(self, prefix, limit=20):
+        # Names with a word starting with `prefix` (words in order), sorted by matched
+        # key and without duplicates, at most `limit` of them.
+        key = " ".join(prefix.casefold().split())
+        if not key:
+            return []
+        matches = []
+        seen = set()
+        entries = self.entries
+        position = bisect_left(entries, key)
+        while position < len(entries) and len(matches) < limit:
+            entry = entries[position]
+            separator = entry.find("\0")
+            if not entry.startswith(key) or separator < len(key):
+                break
+            name = entry[separator + 1:]
+            if name not in seen:
+                seen.add(name)
+                matches.append(name)
+            position += 1
+        return matches
+
+
+class BiographyIndex:
+    # Ranked full-text search over biographies.
+    #
+    # A user's weight for a token is tf / sqrt(token count of the biography); a query
+    # scores users by the sum of idf(token) * weight over its tokens. Each token's
+    # postings are kept sorted by weight, highest first (parallel array('d') of negated
+    # weights and list of names), so a one-token query just reads the first k postings
+    # and longer queries use the threshold algorithm: walk all lists in step, score
+    # each newly seen user exactly, and stop once k scores beat what any unseen user
+    # could still reach. Updates are an insort per distinct token.
+
+    def __init__(self, profiles=None):
+        self.weights = {}
+        self.names = {}
+        self.user_tokens = {}
+        if profiles is not None:
+            if isinstance(profiles, ProfileStore):
+                # Read the columns directly instead of creating a view per user.
+                pairs = zip(profiles.names, profiles.biographies)
+            else:
+                pairs = ((person.name, person.biography) for person in profiles.values())
+            for name, biography in pairs:
+                if name is not None:
+                    self._index(name, biography, sort=False)
+            for token, weights in self.weights.items():
+                order = sorted(range(len(weights)), key=weights.__getitem__)
+                self.weights[token] = array('d', (weights[i] for i in order))
+                names = self.names[token]
+                self.names[token] = [names[i] for i in order]
+
+    @staticmethod
+    def _token_weights(biography):
+        tokens = tokenize(biography)
+        if not tokens:
+            return {}
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        norm = math.sqrt(len(tokens))
+        if len(counts) == len(tokens):  # the usual case: no repeated words
+            return dict.fromkeys(tokens, 1 / norm)
+        return {token: count / norm for token, count in counts.items()}
+
+    def _index(self, name, biography, sort=True):
+        token_weights = self._token_weights(biography)
+        self.user_tokens[name] = token_weights
+        for token, weight in token_weights.items():
+            weights = self.weights.get(token)
+            if weights is None:
+                weights = self.weights[token] = array('d')
+                self.names[token] = []
+            if sort:
+                position = bisect_left(weights, -weight)
+                weights.insert(position, -weight)
+                self.names[token].insert(position, name)
+            else:
+                weights.append(-weight)
+                self.names[token].append(name)
+
+    def add(self, person):
+        # Indexes a new user, or re-indexes one whose biography changed.
+        if person.name in self.user_tokens:
+            self.remove(person.name)
+        self._index(person.name, person.biography)
+
+    def remove(self, name):
+        for token, weight in self.user_tokens.pop(name, {}).items():
+            weights, names = self.weights[token], self.names[token]
+            position = bisect_left(weights, -weight)
+            while names[position] != name:
+                position += 1
+            del weights[position]
+            del names[position]
+            if not names:
+                del self.weights[token]
+                del self.names[token]
+
+    def idf(self, token):
+        return math.log(1 + len(self.user_tokens) / len(self.names[token]))
+
+    def search(self, query, k=10):
+        # Returns [(name, score), ...] for the k best matching users, best first.
+        tokens = [token for token in dict.fromkeys(tokenize(query)) if token in self.names]
+        if not tokens or k <= 0:
+            return []
+        idfs = [self.idf(token) for token in tokens]
+        if len(tokens) == 1:
+            weights, names = self.weights[tokens[0]], self.names[tokens[0]]
+            return [(names[i], -weights[i] * idfs[0]) for i in range(min(k, len(names)))]
+
+        lists = [(self.weights[token], self.names[token]) for token in tokens]
+        user_tokens = self.user_tokens
+        best = []  # min-heap of (score, name)
+        seen = set()
+        depth = 0
+        longest = max(len(names) for _, names in lists)
+        while depth < longest:
+            threshold = 0.0
+            for (weights, names), idf in zip(lists, idfs):
+                if depth < len(names):
+                    threshold -= weights[depth] * idf
+                    name = names[depth]
+                    if name not in seen:
+                        seen.add(name)
+                        token_weights = user_tokens[name]
+                        score = sum(idf_other * token_weights.get(token, 0.0)
+                                    for token, idf_other in zip(tokens, idfs))
+                        if len(best) < k:
+                            heapq.heappush(best, (score, name))
+                        elif score > best[0][0]:
+                            heapq.heapreplace(best, (score, name))
+            if len(best) == k and best[0][0] >= threshold:
+                break
+            depth += 1
+        return [(name, score) for score, name in sorted(best, key=lambda item: (-item[0], item[1]))]
+
+
+class ProfileSearch:
+    # Name autocomplete plus biography search over a profiles mapping.
+    #
+    # A ProfileStore reports every addition, edit and deletion through its change
+    # listeners; the names are queued and applied before the next search, so both
+    # indexes follow the store without the callers doing anything. A large backlog
+    # (a bulk load, or clear()) is applied as one rebuild instead of an insort per
+    # user. Plain dicts cannot report changes: call add() for every new or edited user
+    # and remove() for deleted ones (or rebuild() after bulk loads).
+
+    def __init__(self, profiles):
+        self.profiles = profiles
+        self.pending = set()
+        self.stale = False
+        self.lock = threading.Lock()
+        self.rebuild()
+        if hasattr(profiles, "add_change_listener"):
+            profiles.add_change_listener(self._on_profile_change)
+
+    def rebuild(self):
+        with self.lock:
+            self._rebuild()
+
+    def _rebuild(self):
+        self.names = NameIndex(self.profiles)
+        self.biographies = BiographyIndex(self.profiles)
+        self.pending.clear()
+        self.stale = False
+
+    def _on_profile_change(self, name):
+        with self.lock:
+            if name is None:
+                self.stale = True
+            else:
+                self.pending.add(name)
+
+    def _sync(self):
+        # Applies the queued changes; called with the lock held.
+        if self.stale or len(self.pending) > len(self.profiles) // 8:
+            self._rebuild()
+            return
+        profiles = self.profiles
+        for name in self.pending:
+            if name in profiles:
+                self.names.add(name)
+                self.biographies.add(profiles[name])
+            else:
+                self.names.remove(name)
+                self.biographies.remove(name)
+        self.pending.clear()
+
+    def add(self, person):
+        with self.lock:
+            self.names.add(person.name)
+            self.biographies.add(person)
+
+    def remove(self, name):
+        with self.lock:
+            self.names.remove(name)
+            self.biographies.remove(name)
+
+    def search_names(self, prefix, limit=20):
+        with self.lock:
+            if self.pending or self.stale:
+                self._sync()
+            return self.names.search(prefix, limit)
+
+    def search_biographies(self, query, k=10):
+        with self.lock:
+            if self.pending or self.stale:
+                self._sync()
+            return self.biographies.search(query, k)
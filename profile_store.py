@@ -0,0 +1,231 @@
+import sys
+from array import array
+from itertools import chain, islice
+from collections.abc import MutableMapping
+
+from pagination import DEFAULT_PAGE_SIZE, check_limit, decode_cursor, encode_cursor
+from person import Person, render_profile
+
+# PRIVACY_LABELS[byte] holds the labels of the 8 users packed into one bitset byte.
+PRIVACY_LABELS = [tuple("Private" if byte & (1 << bit) else "Public" for bit in range(8)) for byte in range(256)]
+MAX_GENDER_VALUES = 1 << 16
+
+
+class ProfileView(Person):
+    # A Person backed by one row of a ProfileStore. Only (store, row) is stored per
+    # view; attribute reads and writes go to the store's columns.
+    __slots__ = ("store", "row")
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    @property
+    def name(self):
+        return self.store.names[self.row]
+
+    @property
+    def gender(self):
+        return self.store.gender_values[self.store.gender_codes[self.row]]
+
+    @gender.setter
+    def gender(self, value):
+        self.store.gender_codes[self.row] = self.store.intern_gender(value)
+        self.store._notify_change(self.name)
+
+    @property
+    def biography(self):
+        return self.store.biographies[self.row]
+
+    @biography.setter
+    def biography(self, value):
+        self.store.biographies[self.row] = value
+        self.store._notify_change(self.name)
+
+    @property
+    def is_private(self):
+        return self.store.is_private_row(self.row)
+
+    @is_private.setter
+    def is_private(self, value):
+        self.store.set_private_row(self.row, value)
+        self.store._notify_change(self.name)
+
+
+class ProfileStore(MutableMapping):
+    # Columnar people_profiles: a name -> Person mapping that stores parallel columns
+    # instead of one object per user. Genders are interned into a value table (a
+    # two-byte code per user, so up to 65536 distinct values), is_private is a
+    # bitset, and names / biographies are plain lists of str. Lookups return
+    # ProfileView objects over a row.
+    #
+    # Assigning a Person copies its fields in; deleting leaves a tombstone row so the
+    # rows of other users (and views over them) stay valid.
+
+    def __init__(self, people=()):
+        self.change_listeners = []
+        self._reset()
+        for person in people:
+            self[person.name] = person
+
+    def _reset(self):
+        self.names = []
+        self.biographies = []
+        self.gender_codes = array('H')
+        self.gender_values = []
+        self.gender_lookup = {}
+        self.private_bits = bytearray()
+        self.rows = {}
+
+    def add_change_listener(self, listener):
+        # listener(name) runs after a user is added, replaced, edited through a view or
+        # deleted; listener(None) after clear().
+        self.change_listeners.append(listener)
+
+    def _notify_change(self, name):
+        for listener in self.change_listeners:
+            listener(name)
+
+    def intern_gender(self, gender):
+        code = self.gender_lookup.get(gender)
+        if code is None:
+            if len(self.gender_values) == MAX_GENDER_VALUES:
+                raise ValueError(f"ProfileStore supports at most {MAX_GENDER_VALUES} distinct gender values.")
+            code = len(self.gender_values)
+            self.gender_values.append(gender)
+            self.gender_lookup[gender] = code
+        return code
+
+    def is_private_row(self, row):
+        return bool(self.private_bits[row >> 3] & (1 << (row & 7)))
+
+    def set_private_row(self, row, is_private):
+        if is_private:
+            self.private_bits[row >> 3] |= 1 << (row & 7)
+        else:
+            self.private_bits[row >> 3] &= ~(1 << (row & 7)) & 0xFF
+
+    # --- Mapping interface ---------------------------------------------------------
+
+    def __getitem__(self, name):
+        return ProfileView(self, self.rows[name])
+
+    def __setitem__(self, name, person):
+        # Resolve the gender first: it is the only step that can fail (ValueError), and
+        # it must do so before any column grows.
+        gender_code = self.intern_gender(person.gender)
+        row = self.rows.get(name)
+        if row is None:
+            row = len(self.names)
+            self.rows[name] = row
+            self.names.append(name)
+            self.biographies.append(person.biography)
+            self.gender_codes.append(gender_code)
+            if row % 8 == 0:
+                self.private_bits.append(0)
+        else:
+            self.biographies[row] = person.biography
+            self.gender_codes[row] = gender_code
+        self.set_private_row(row, person.is_private)
+        if self.change_listeners:
+            self._notify_change(name)
+
+    def __delitem__(self, name):
+        row = self.rows.pop(name)
+        self.names[row] = None
+        self.biographies[row] = None
+        self._notify_change(name)
+
+    def __contains__(self, name):
+        return name in self.rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def clear(self):
+        self._reset()
+        self._notify_change(None)
+
+    def live_rows(self, start=0, stop=None):
+        # Row numbers of live users in insertion order, from row `start` up to `stop`.
+        names = self.names
+        return [row for row in range(start, len(names) if stop is None else min(stop, len(names)))
+                if names[row] is not None]
+
+    def page(self, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        # Returns (names, next_cursor) for up to `limit` users in join (row) order after
+        # `cursor`. Rows never move, so users added while paging show up at the end and
+        # deleted ones are simply skipped.
+        check_limit(limit)
+        names = self.names
+        row = 0 if cursor is None else decode_cursor(cursor, "row") + 1
+        page = []
+        while row < len(names) and len(page) < limit:
+            if names[row] is not None:
+                page.append(names[row])
+            row += 1
+        # The last page may come back empty if only deleted rows were left.
+        return page, encode_cursor("row", row - 1) if row < len(names) else None
+
+    def nbytes(self):
+        # Approximate column memory: pointers plus string objects, the gender codes and bitset.
+        strings = sum(sys.getsizeof(value) for value in self.names if value is not None)
+        strings += sum(sys.getsizeof(value) for value in self.biographies if value is not None)
+        return (strings + sys.getsizeof(self.names) + sys.getsizeof(self.biographies)
+                + len(self.gender_codes) * self.gender_codes.itemsize + len(self.private_bits) + sys.getsizeof(self.rows))
+
+    # --- Batch rendering -----------------------------------------------------------
+
+    def render_user_list(self, rows=None):
+        # Option 1 lines ("- name (Public)") for the given rows (all users by default),
+        # as one string.
+        names = self.names
+        if rows is None:
+            if len(self.rows) == len(names):
+                # No tombstones: walk names alongside the bitset a byte at a time.
+                labels = chain.from_iterable(PRIVACY_LABELS[byte] for byte in self.private_bits)
+                return "".join([f"- {name} ({label})\n" for name, label in zip(names, labels)])
+            rows = self.live_rows()
+        private_bits = self.private_bits
+        return "".join([f"- {names[row]} ({PRIVACY_LABELS[private_bits[row >> 3]][row & 7]})\n" for row in rows])
+
+    def render_profiles(self, rows, ignore_privacy=True):
+        # display_profile output for the given rows, as one string.
+        names, biographies = self.names, self.biographies
+        gender_values, gender_codes, private_bits = self.gender_values, self.gender_codes, self.private_bits
+        return "".join(
+            render_profile(names[row], gender_values[gender_codes[row]], biographies[row],
+                           bool(private_bits[row >> 3] & (1 << (row & 7))), ignore_privacy) + "\n"
+            for row in rows
+        )
+
+
+def render_user_list(profiles, names=None):
+    # Option 1 lines for any name -> Person mapping (all users by default), as one string.
+    if isinstance(profiles, ProfileStore):
+        return profiles.render_user_list(None if names is None else [profiles.rows[name] for name in names])
+    people = profiles.values() if names is None else (profiles[name] for name in names)
+    return "".join(f"- {person.name} ({'Private' if person.is_private else 'Public'})\n" for person in people)
+
+
+def profiles_page(profiles, cursor=None, limit=DEFAULT_PAGE_SIZE):
+    # Page through any name -> Person mapping. A ProfileStore pages by row; a plain dict
+    # by position in insertion order (O(position) per page, and not stable if users are
+    # removed in between).
+    if isinstance(profiles, ProfileStore):
+        return profiles.page(cursor, limit)
+    check_limit(limit)
+    start = 0 if cursor is None else decode_cursor(cursor, "position")
+    page = list(islice(profiles, start, start + limit))
+    more = start + limit < len(profiles)
+    return page, encode_cursor("position", start + limit) if more else None
+
+
+def render_profiles(profiles, names, ignore_privacy=True):
+    if isinstance(profiles, ProfileStore):
+        return profiles.render_profiles([profiles.rows[name] for name in names], ignore_privacy)
+    return "".join(profiles[name].render_profile(ignore_privacy) + "\n" for name in names)
+
@@ -1,160 +1,569 @@
-import random
-import threading
-import time
-import statistics
-from typing import List, Dict, Any
-
-# Overall simulation parameters
-# These values will be used by both multithreaded and sequential tests.
-GLOBAL_NUM_SETS = 3
-GLOBAL_NUM_ROUNDS = 10
-GLOBAL_NUM_RANDOM_NUMBERS_PER_SET = 100
-GLOBAL_MIN_VAL = 0
-GLOBAL_MAX_VAL = 10000
-
-def generate_random_numbers(num_count: int = GLOBAL_NUM_RANDOM_NUMBERS_PER_SET, 
-                            min_val: int = GLOBAL_MIN_VAL, 
-                            max_val: int = GLOBAL_MAX_VAL) -> List[int]:
-    # Generates a list of random numbers within a specified range.
-    return [random.randint(min_val, max_val) for _ in range(num_count)]
-
-# Global variables and lock for thread synchronization.
-thread_results: List[Dict[str, Any]] = []
-thread_start_times: Dict[str, int] = {}
-thread_end_times: Dict[str, int] = {}
-thread_lock = threading.Lock()
-
-def thread_task(set_id: str) -> None:
-    # Generates random numbers and records thread-specific start/end times.
-    start_time_thread = time.monotonic_ns()
-    
-    with thread_lock: # Safely record thread's start time
-        thread_start_times[set_id] = start_time_thread
-
-    numbers = generate_random_numbers(GLOBAL_NUM_RANDOM_NUMBERS_PER_SET, GLOBAL_MIN_VAL, GLOBAL_MAX_VAL) # Generate numbers
-    
-    end_time_thread = time.monotonic_ns()
-    
-    with thread_lock: # Safely record thread's end time and results
-        thread_end_times[set_id] = end_time_thread
-        thread_results.append({
-            "set_id": set_id,
-            "numbers": numbers,
-            "start_time": start_time_thread,
-            "end_time": end_time_thread
-        })
-
-def run_with_multithreading() -> List[int]:
-    # Runs random number generation using multiple threads and measures performance.
-    print(f"\n--- Running with Multithreading ({GLOBAL_NUM_ROUNDS} rounds, {GLOBAL_NUM_SETS} sets of {GLOBAL_NUM_RANDOM_NUMBERS_PER_SET} numbers) ---")
-    round_times: List[int] = []
-
-    for round_num in range(1, GLOBAL_NUM_ROUNDS + 1):
-        # Reset global data for each new round.
-        global thread_results, thread_start_times, thread_end_times
-        thread_results = []
-        thread_start_times = {}
-        thread_end_times = {}
-
-        threads: List[threading.Thread] = []
-        for i in range(GLOBAL_NUM_SETS): # Create and start threads.
-            thread_name = f"Set_{i+1}"
-            thread = threading.Thread(
-                target=thread_task,
-                args=(thread_name,)
-            )
-            threads.append(thread)
-            thread.start()
-
-        for thread in threads: # Wait for all threads to complete.
-            thread.join()
-
-        overall_start_time = float('inf')
-        overall_end_time = 0
-
-        with thread_lock: # Calculate overall elapsed time.
-            if thread_start_times and thread_end_times:
-                overall_start_time = min(thread_start_times.values())
-                overall_end_time = max(thread_end_times.values())
-            else:
-                print(f"Warning: No thread times recorded for Round {round_num}. Skipping time calculation.")
-                continue
-
-        time_elapsed_ns = overall_end_time - overall_start_time
-        round_times.append(time_elapsed_ns)
-        print(f"Round {round_num}: Time Taken (T) = {time_elapsed_ns:,} ns")
-
-    if round_times:
-        average_time_ns = statistics.mean(round_times)
-        print(f"\nAverage Time Taken (Multithreading) over {GLOBAL_NUM_ROUNDS} rounds: {average_time_ns:,.0f} ns")
-    else:
-        print("\nCould not calculate average time for Multithreading (no valid rounds recorded).")
-    return round_times
-
-
-def run_without_multithreading() -> List[int]:
-    # Runs random number generation sequentially and measures performance.
-    print(f"\n--- Running without Multithreading ({GLOBAL_NUM_ROUNDS} rounds, {GLOBAL_NUM_SETS} sets of {GLOBAL_NUM_RANDOM_NUMBERS_PER_SET} numbers) ---")
-    round_times: List[int] = []
-
-    for round_num in range(1, GLOBAL_NUM_ROUNDS + 1):
-        start_time_sequential = time.monotonic_ns() # Record start time.
-        
-        sequential_results: List[Dict[str, List[int]]] = []
-        for i in range(GLOBAL_NUM_SETS): # Generate numbers sequentially.
-            numbers = generate_random_numbers(GLOBAL_NUM_RANDOM_NUMBERS_PER_SET, GLOBAL_MIN_VAL, GLOBAL_MAX_VAL)
-            sequential_results.append({f"Set_{i+1}": numbers})
-            
-        end_time_sequential = time.monotonic_ns() # Record end time.
-        
-        time_elapsed_ns = end_time_sequential - start_time_sequential
-        round_times.append(time_elapsed_ns)
-        print(f"Round {round_num}: Time Taken (T) = {time_elapsed_ns:,} ns")
-
-    if round_times:
-        average_time_ns = statistics.mean(round_times)
-        print(f"\nAverage Time Taken (Without Multithreading) over {GLOBAL_NUM_ROUNDS} rounds: {average_time_ns:,.0f} ns")
-    else:
-        print("\nCould not calculate average time for Sequential (no valid rounds recorded).")
-    return round_times
-
-def main():
-    # Orchestrates the random number generation performance comparison.
-
-    # Perform tests for both multithreaded and sequential scenarios.
-    # Functions now called without specific test parameters as they use globals.
-    multithreaded_times = run_with_multithreading()
-    sequential_times = run_without_multithreading()
-
-    print("\n--- Final Performance Summary ---")
-    
-    if multithreaded_times: # Display multithreaded average.
-        avg_multithreaded = statistics.mean(multithreaded_times)
-        print(f"Multithreaded Average Time: {avg_multithreaded:,.0f} ns")
-    else:
-        avg_multithreaded = 0
-        print("Multithreaded Average Time: N/A (no data)")
-
-    if sequential_times: # Display sequential average.
-        avg_sequential = statistics.mean(sequential_times)
-        print(f"Sequential Average Time: {avg_sequential:,.0f} ns")
-    else:
-        avg_sequential = 0
-        print("Sequential Average Time: N/A (no data)")
-
-    if avg_multithreaded > 0 and avg_sequential > 0: # Calculate and display percentage difference.
-        if avg_sequential > 0:
-            percentage_diff = ((avg_sequential - avg_multithreaded) / avg_sequential) * 100
-            if percentage_diff > 0:
-                print(f"Multithreaded execution was {percentage_diff:.2f}% faster than Sequential.")
-            elif percentage_diff < 0:
-                print(f"Multithreaded execution was {-percentage_diff:.2f}% slower than Sequential.")
-            else:
-                print("Multithreaded and Sequential execution times were approximately the same.")
-        else:
-            print("Cannot calculate percentage difference as sequential average time is zero.")
-    else:
-        print("Not enough data to calculate percentage difference.")
-
-if __name__ == "__main__":
-    main()
+import argparse
+import mmap
+import os
+import random
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from benchmark_harness import (add_harness_arguments, compare_results, display_comparison, display_results,
+                               harness_options, measure, read_results, write_results)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the NumPy backends are skipped without it.
+    np = None
+
+
+@dataclass(frozen=True)
+class Workload:
+    # What one round generates: `num_sets` sets of `numbers_per_set` integers in
+    # [min_val, max_val]. How often rounds run is up to the benchmark harness.
+    num_sets: int = 3
+    numbers_per_set: int = 100
+    min_val: int = 0
+    max_val: int = 10000
+
+
+DEFAULT_WORKLOAD = Workload()
+
+def generate_random_numbers(num_count: int = DEFAULT_WORKLOAD.numbers_per_set,
+                            min_val: int = DEFAULT_WORKLOAD.min_val,
+                            max_val: int = DEFAULT_WORKLOAD.max_val) -> List[int]:
+    # Generates a list of random numbers within a specified range.
+    return [random.randint(min_val, max_val) for _ in range(num_count)]
+
+# Global variables and lock for thread synchronization.
+thread_results: List[Dict[str, Any]] = []
+thread_start_times: Dict[str, int] = {}
+thread_end_times: Dict[str, int] = {}
+thread_lock = threading.Lock()
+
+def thread_task(set_id: str, workload: Workload = DEFAULT_WORKLOAD) -> None:
+    # Generates random numbers and records thread-specific start/end times.
+    start_time_thread = time.monotonic_ns()
+    
+    with thread_lock: # Safely record thread's start time
+        thread_start_times[set_id] = start_time_thread
+
+    numbers = generate_random_numbers(workload.numbers_per_set, workload.min_val, workload.max_val) # Generate numbers
+    
+    end_time_thread = time.monotonic_ns()
+    
+    with thread_lock: # Safely record thread's end time and results
+        thread_end_times[set_id] = end_time_thread
+        thread_results.append({
+            "set_id": set_id,
+            "numbers": numbers,
+            "start_time": start_time_thread,
+            "end_time": end_time_thread
+        })
+
+def run_threaded_round(workload: Workload = DEFAULT_WORKLOAD) -> None:
+    # One round: a thread per set, started together and joined.
+    global thread_results, thread_start_times, thread_end_times
+    thread_results = [] # Reset global data for each new round.
+    thread_start_times = {}
+    thread_end_times = {}
+
+    threads: List[threading.Thread] = []
+    for i in range(workload.num_sets): # Create and start threads.
+        thread = threading.Thread(target=thread_task, args=(f"Set_{i+1}", workload))
+        threads.append(thread)
+        thread.start()
+
+    for thread in threads: # Wait for all threads to complete.
+        thread.join()
+
+def run_sequential_round(workload: Workload = DEFAULT_WORKLOAD) -> List[Dict[str, List[int]]]:
+    # One round: every set generated in turn on the calling thread.
+    sequential_results: List[Dict[str, List[int]]] = []
+    for i in range(workload.num_sets):
+        numbers = generate_random_numbers(workload.numbers_per_set, workload.min_val, workload.max_val)
+        sequential_results.append({f"Set_{i+1}": numbers})
+    return sequential_results
+
+def run_with_multithreading(workload: Workload = DEFAULT_WORKLOAD, **options: Any) -> Dict[str, Any]:
+    # Measures threaded rounds with the benchmark harness; `options` go to measure().
+    print(f"\n--- Running with Multithreading ({workload.num_sets} sets of {workload.numbers_per_set} numbers) ---")
+    stats = measure(lambda: run_threaded_round(workload), **options)
+    print(f"Mean Time Taken (Multithreading) over {stats['rounds']} rounds: {stats['mean_ns']:,.0f} ns "
+          f"(+/- {stats['relative_ci']:.1%})")
+    return stats
+
+
+def run_without_multithreading(workload: Workload = DEFAULT_WORKLOAD, **options: Any) -> Dict[str, Any]:
+    # Measures sequential rounds with the benchmark harness; `options` go to measure().
+    print(f"\n--- Running without Multithreading ({workload.num_sets} sets of {workload.numbers_per_set} numbers) ---")
+    stats = measure(lambda: run_sequential_round(workload), **options)
+    print(f"Mean Time Taken (Without Multithreading) over {stats['rounds']} rounds: {stats['mean_ns']:,.0f} ns "
+          f"(+/- {stats['relative_ci']:.1%})")
+    return stats
+
+class ThreadWorkerPool:
+    # Persistent generation threads, reused across rounds. Each worker owns a
+    # random.Random seeded independently (no shared generator state) and a result
+    # slot only it writes, so no lock is taken. Rounds are synchronized by two
+    # barriers: every worker starts generating as the coordinator releases the start
+    # barrier, and the round ends once all of them reach the end barrier. A worker that
+    # fails still reaches the end barrier, with the exception in its slot; run_round()
+    # re-raises it.
+
+    def __init__(self, num_workers: int = DEFAULT_WORKLOAD.num_sets, seed: Optional[int] = None):
+        self.num_workers = num_workers
+        seed_source = random.Random(seed)
+        self.generators = [random.Random(seed_source.getrandbits(64)) for _ in range(num_workers)]
+        self.slots: List[Optional[Tuple[int, int, List[List[int]], Optional[BaseException]]]] = [None] * num_workers
+        self.workload: Optional[Workload] = None
+        self.start_barrier = threading.Barrier(num_workers + 1)
+        self.end_barrier = threading.Barrier(num_workers + 1)
+        self.threads = [threading.Thread(target=self._worker, args=(i,), name=f"Generator_{i+1}", daemon=True)
+                        for i in range(num_workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def _worker(self, index: int) -> None:
+        randint = self.generators[index].randint
+        while True:
+            self.start_barrier.wait()
+            workload = self.workload
+            if workload is None:
+                return
+            start = time.perf_counter_ns()
+            try:
+                sets = [[randint(workload.min_val, workload.max_val) for _ in range(workload.numbers_per_set)]
+                        for _ in range(index, workload.num_sets, self.num_workers)]
+                self.slots[index] = (start, time.perf_counter_ns(), sets, None)
+            except Exception as error:
+                self.slots[index] = (start, time.perf_counter_ns(), [], error)
+            self.end_barrier.wait()
+
+    def run_round(self, workload: Workload = DEFAULT_WORKLOAD) -> Dict[str, Any]:
+        # Generates one round (worker i makes sets i, i + workers, ...) and returns the
+        # sets plus its timing: wall_ns as seen by the caller, generation_ns from the
+        # first worker start to the last worker finish, and the difference as overhead.
+        self.workload = workload
+        wall_start = time.perf_counter_ns()
+        self.start_barrier.wait()
+        self.end_barrier.wait()
+        wall_ns = time.perf_counter_ns() - wall_start
+
+        slots = self.slots
+        for _, _, _, error in slots:
+            if error is not None:
+                raise error
+        sets: List[Optional[List[int]]] = [None] * workload.num_sets
+        for index, (_, _, worker_sets, _) in enumerate(slots):
+            sets[index::self.num_workers] = worker_sets
+        generation_ns = max(slot[1] for slot in slots) - min(slot[0] for slot in slots)
+        return {"sets": sets, "wall_ns": wall_ns, "generation_ns": generation_ns,
+                "overhead_ns": wall_ns - generation_ns}
+
+    def close(self) -> None:
+        self.workload = None
+        self.start_barrier.wait()
+        for thread in self.threads:
+            thread.join()
+
+
+def measure_threading_overhead(workload: Workload = DEFAULT_WORKLOAD, seed: Optional[int] = None,
+                               **options: Any) -> Dict[str, Dict[str, Any]]:
+    # Splits each round's wall time into generation (first thread start to last thread
+    # finish) and overhead (everything else: creating and joining threads, lock
+    # traffic, barrier hand-offs), for spawning threads every round against the
+    # persistent pool. `options` go to measure().
+    def spawned_round() -> Dict[str, int]:
+        wall_start = time.perf_counter_ns()
+        run_threaded_round(workload)
+        wall_ns = time.perf_counter_ns() - wall_start
+        generation_ns = max(thread_end_times.values()) - min(thread_start_times.values())
+        return {"wall_ns": wall_ns, "generation_ns": generation_ns}
+
+    pool = ThreadWorkerPool(workload.num_sets, seed)
+    try:
+        report = {}
+        paths = (("spawn per round", spawned_round), ("persistent pool", lambda: pool.run_round(workload)))
+        for name, run_round in paths:
+            rounds: List[Dict[str, Any]] = []
+            stats = measure(lambda: rounds.append(run_round()), **options)
+            timed = rounds[options.get("warmup", 3):] or rounds
+            generation = sum(item["generation_ns"] for item in timed) / len(timed)
+            wall = sum(item["wall_ns"] for item in timed) / len(timed)
+            stats.update({"wall_ns": wall, "generation_ns": generation, "overhead_ns": wall - generation,
+                          "overhead_ratio": (wall - generation) / wall if wall else 0.0})
+            report[name] = stats
+        return report
+    finally:
+        pool.close()
+
+
+def display_threading_overhead(report: Dict[str, Dict[str, Any]]) -> None:
+    print("\n--- Threading Overhead (per round) ---")
+    header = f"| {'Path':<16} | {'Wall (ns)':>14} | {'Generation (ns)':>15} | {'Overhead (ns)':>14} | {'Overhead':>8} |"
+    print("-" * len(header))
+    print(header)
+    print("-" * len(header))
+    for name, stats in report.items():
+        print(f"| {name:<16} | {stats['wall_ns']:>14,.0f} | {stats['generation_ns']:>15,.0f} | "
+              f"{stats['overhead_ns']:>14,.0f} | {stats['overhead_ratio']:>8.1%} |")
+    print("-" * len(header))
+
+
+# Workload sizes (sets, numbers per set) for the backend comparison, small to large.
+BACKEND_WORKLOADS = [(3, 100), (4, 10_000), (8, 200_000)]
+
+
+def _generate_set(num_count: int, min_val: int, max_val: int) -> List[int]:
+    # Worker-process entry point (must be module-level to be picklable).
+    return generate_random_numbers(num_count, min_val, max_val)
+
+
+def _generate_set_numpy(num_count: int, min_val: int, max_val: int, seed: int) -> Any:
+    # Worker-process entry point: one vectorized draw from a per-task Generator.
+    return np.random.default_rng(seed).integers(min_val, max_val, size=num_count, endpoint=True)
+
+
+class GenerationBackend:
+    # One way of producing `num_sets` sets of `numbers_per_set` integers in
+    # [min_val, max_val]. generate() returns one sequence per set (a list, or a NumPy
+    # row). Backends that hold workers create them once, outside the timed calls;
+    # close() releases them.
+    name = "base"
+
+    def generate(self, num_sets: int, numbers_per_set: int, min_val: int, max_val: int) -> List[Sequence[int]]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class SequentialBackend(GenerationBackend):
+    name = "sequential"
+
+    def generate(self, num_sets, numbers_per_set, min_val, max_val):
+        return [generate_random_numbers(numbers_per_set, min_val, max_val) for _ in range(num_sets)]
+
+
+class ThreadBackend(GenerationBackend):
+    # One thread per set, as run_with_multithreading does. random.randint holds the
+    # GIL, so this can only add overhead to CPU-bound generation.
+    name = "threads"
+
+    def generate(self, num_sets, numbers_per_set, min_val, max_val):
+        results: List[Optional[List[int]]] = [None] * num_sets
+
+        def fill(index: int) -> None:
+            results[index] = generate_random_numbers(numbers_per_set, min_val, max_val)
+
+        threads = [threading.Thread(target=fill, args=(i,)) for i in range(num_sets)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+
+class ThreadPoolBackend(GenerationBackend):
+    # The persistent ThreadWorkerPool: no thread creation or locking per call. The
+    # pool is started here, outside any timed call.
+    name = "thread-pool"
+
+    def __init__(self, num_workers: Optional[int] = None, seed: Optional[int] = None):
+        self.pool: Optional[ThreadWorkerPool] = ThreadWorkerPool(num_workers or os.cpu_count() or 1, seed)
+
+    def generate(self, num_sets, numbers_per_set, min_val, max_val):
+        return self.pool.run_round(Workload(num_sets, numbers_per_set, min_val, max_val))["sets"]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+
+class ProcessPoolBackend(GenerationBackend):
+    # One task per set on a ProcessPoolExecutor: real parallelism, paid for by
+    # pickling every set back to the parent.
+    name = "processes"
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+
+    def generate(self, num_sets, numbers_per_set, min_val, max_val):
+        return list(self.executor.map(_generate_set, [numbers_per_set] * num_sets,
+                                      [min_val] * num_sets, [max_val] * num_sets))
+
+    def close(self):
+        self.executor.shutdown()
+
+
+class NumpyBackend(GenerationBackend):
+    # All sets in one vectorized Generator.integers call; the rows are the sets.
+    name = "numpy"
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = np.random.default_rng(seed)
+
+    def generate(self, num_sets, numbers_per_set, min_val, max_val):
+        return self.rng.integers(min_val, max_val, size=(num_sets, numbers_per_set), endpoint=True)
+
+
+class NumpyProcessBackend(ProcessPoolBackend):
+    # Vectorized generation inside each worker process, one set per task. Each task
+    # gets its own seed from a SeedSequence so the workers' streams are independent.
+    name = "numpy-processes"
+
+    def __init__(self, max_workers: Optional[int] = None, seed: Optional[int] = None):
+        super().__init__(max_workers)
+        self.seeds = np.random.SeedSequence(seed)
+
+    def generate(self, num_sets, numbers_per_set, min_val, max_val):
+        seeds = [int(child.generate_state(1)[0]) for child in self.seeds.spawn(num_sets)]
+        return list(self.executor.map(_generate_set_numpy, [numbers_per_set] * num_sets,
+                                      [min_val] * num_sets, [max_val] * num_sets, seeds))
+
+
+def available_backends() -> List[GenerationBackend]:
+    # Sequential first: speedups are reported against it.
+    backends = [SequentialBackend(), ThreadBackend(), ThreadPoolBackend(os.cpu_count()), ProcessPoolBackend()]
+    if np is not None:
+        backends += [NumpyBackend(), NumpyProcessBackend()]
+    return backends
+
+
+def compare_backends(workloads: Sequence[Tuple[int, int]] = BACKEND_WORKLOADS,
+                     min_val: int = DEFAULT_WORKLOAD.min_val,
+                     max_val: int = DEFAULT_WORKLOAD.max_val,
+                     **options: Any) -> List[Dict[str, Any]]:
+    # Measures every backend on every (sets, numbers per set) workload with the
+    # benchmark harness (`options` go to measure()). Returns one row per workload with
+    # each backend's summary and its speedup against the sequential backend.
+    backends = available_backends()
+    rows: List[Dict[str, Any]] = []
+    try:
+        for num_sets, numbers_per_set in workloads:
+            stats: Dict[str, Dict[str, Any]] = {}
+            for backend in backends:
+                stats[backend.name] = measure(
+                    lambda: backend.generate(num_sets, numbers_per_set, min_val, max_val), **options)
+            baseline = stats[SequentialBackend.name]["mean_ns"]
+            rows.append({
+                "num_sets": num_sets,
+                "numbers_per_set": numbers_per_set,
+                "stats": stats,
+                "speedup": {name: baseline / value["mean_ns"] for name, value in stats.items()},
+            })
+    finally:
+        for backend in backends:
+            backend.close()
+    return rows
+
+
+def display_backend_comparison(rows: List[Dict[str, Any]]) -> None:
+    print(f"\n--- Backend Comparison ({os.cpu_count()} CPU(s), speedup against sequential) ---")
+    for row in rows:
+        print(f"\n{row['num_sets']} sets of {row['numbers_per_set']:,} numbers:")
+        header = f"| {'Backend':<16} | {'Mean Time (ns)':>16} | {'+/- CI':>7} | {'Speedup':>8} |"
+        print("-" * len(header))
+        print(header)
+        print("-" * len(header))
+        for name, stats in row["stats"].items():
+            print(f"| {name:<16} | {stats['mean_ns']:>16,.0f} | {stats['relative_ci']:>7.1%} | "
+                  f"{row['speedup'][name]:>7.2f}x |")
+        print("-" * len(header))
+    if np is None:
+        print("NumPy is not installed; the NumPy backends were skipped.")
+
+
+# --- Streaming generation of large datasets ------------------------------------------
+# Values are stored as 32-bit signed ints (array typecode 'i', NumPy int32), so a file
+# of N values is exactly 4 * N bytes in native byte order. Every chunk is drawn from
+# its own generator seeded by (seed, chunk index), so the output of a seeded run does
+# not depend on the chunk-to-worker assignment.
+ITEM_SIZE = 4
+INT32_MIN, INT32_MAX = -2**31, 2**31 - 1
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _check_int32_range(min_val: int, max_val: int) -> None:
+    if not INT32_MIN <= min_val <= max_val <= INT32_MAX:
+        raise ValueError(f"Range [{min_val}, {max_val}] does not fit 32-bit ints (or min > max).")
+
+
+def _chunk_seed(seed: Optional[int], chunk_index: int) -> Optional[int]:
+    # Deterministic per-chunk seed, as Hashing.simulation_seed derives per-round ones.
+    return None if seed is None else seed * 1000003 + chunk_index
+
+
+def generate_chunk(count: int, min_val: int, max_val: int, seed: Optional[int] = None,
+                   use_numpy: bool = True) -> Any:
+    # `count` values as an int32 NumPy array, or as array('i') without NumPy.
+    if use_numpy and np is not None:
+        return np.random.default_rng(seed).integers(min_val, max_val, size=count, endpoint=True, dtype=np.int32)
+    rng = random.Random(seed)
+    return array('i', rng.choices(range(min_val, max_val + 1), k=count))
+
+
+def iter_random_chunks(total: int, min_val: int = DEFAULT_WORKLOAD.min_val, max_val: int = DEFAULT_WORKLOAD.max_val,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE, seed: Optional[int] = None,
+                       use_numpy: bool = True) -> Any:
+    # Lazily yields `total` values in chunks of at most `chunk_size`; only one chunk is
+    # alive at a time, so memory does not grow with `total`.
+    _check_int32_range(min_val, max_val)
+    for chunk_index, start in enumerate(range(0, total, chunk_size)):
+        yield generate_chunk(min(chunk_size, total - start), min_val, max_val,
+                             _chunk_seed(seed, chunk_index), use_numpy)
+
+
+def _fill_region(path: str, first_chunk: int, last_chunk: int, total: int, chunk_size: int,
+                 min_val: int, max_val: int, seed: Optional[int], use_numpy: bool) -> int:
+    # Worker-process entry point: maps the output file and writes chunks
+    # [first_chunk, last_chunk) in place. Nothing but the value count returns to the parent.
+    # Written pages are dropped from the process after each chunk (they stay in the page
+    # cache, so nothing is lost) to keep the resident set at about one chunk.
+    release = getattr(mmap, "MADV_DONTNEED", None)
+    with open(path, 'r+b') as output_file, mmap.mmap(output_file.fileno(), 0) as mapped:
+        written = 0
+        for chunk_index in range(first_chunk, last_chunk):
+            start = chunk_index * chunk_size
+            chunk = generate_chunk(min(chunk_size, total - start), min_val, max_val,
+                                   _chunk_seed(seed, chunk_index), use_numpy)
+            offset = start * ITEM_SIZE
+            mapped[offset:offset + len(chunk) * ITEM_SIZE] = memoryview(chunk).cast('B')
+            if release is not None and offset % mmap.PAGESIZE == 0:
+                mapped.madvise(release, offset, len(chunk) * ITEM_SIZE)
+            written += len(chunk)
+        mapped.flush()
+    return written
+
+
+def write_random_file(path: str, total: int, min_val: int = DEFAULT_WORKLOAD.min_val,
+                      max_val: int = DEFAULT_WORKLOAD.max_val, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      workers: int = 1, seed: Optional[int] = None, use_numpy: bool = True) -> Dict[str, Any]:
+    # Writes `total` random int32 values to `path` through a memory map. With several
+    # workers, each process fills its own contiguous run of chunks directly in the
+    # mapped file. Memory use is about one chunk per worker whatever `total` is.
+    # workers=0 uses one process per CPU.
+    _check_int32_range(min_val, max_val)
+    if workers < 0 or chunk_size < 1 or total < 0:
+        raise ValueError("workers must be >= 0, chunk_size >= 1 and total >= 0.")
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    start_time = time.perf_counter()
+    with open(path, 'wb') as output_file:
+        output_file.truncate(total * ITEM_SIZE)
+    chunk_count = -(-total // chunk_size)
+    if total == 0:
+        written = 0
+    elif workers == 1:
+        written = _fill_region(path, 0, chunk_count, total, chunk_size, min_val, max_val, seed, use_numpy)
+    else:
+        workers = min(workers, chunk_count)
+        bounds = [chunk_count * i // workers for i in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_fill_region, path, bounds[i], bounds[i + 1], total, chunk_size,
+                                       min_val, max_val, seed, use_numpy) for i in range(workers)]
+            written = sum(future.result() for future in futures)
+    seconds = time.perf_counter() - start_time
+    return {
+        "path": path,
+        "values": written,
+        "bytes": written * ITEM_SIZE,
+        "workers": workers,
+        "seconds": seconds,
+        "mb_per_second": written * ITEM_SIZE / 1e6 / seconds if seconds > 0 else float('inf'),
+    }
+
+
+def iter_file_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    # Reads a file written by write_random_file back as array('i') chunks.
+    with open(path, 'rb') as input_file:
+        while True:
+            data = input_file.read(chunk_size * ITEM_SIZE)
+            if not data:
+                return
+            chunk = array('i')
+            chunk.frombytes(data)
+            yield chunk
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    # Orchestrates the random number generation performance comparison.
+    parser = argparse.ArgumentParser(description="Random number generation: threads, processes and NumPy.")
+    parser.add_argument("--sets", type=int,
+                        help=f"sets per round (default {DEFAULT_WORKLOAD.num_sets}; setting --sets or --numbers also "
+                             f"limits the backend comparison to that workload instead of its size sweep)")
+    parser.add_argument("--numbers", type=int,
+                        help=f"random numbers per set (default {DEFAULT_WORKLOAD.numbers_per_set})")
+    parser.add_argument("--min", type=int, default=DEFAULT_WORKLOAD.min_val, dest="min_val", help="lowest value")
+    parser.add_argument("--max", type=int, default=DEFAULT_WORKLOAD.max_val, dest="max_val", help="highest value")
+    parser.add_argument("--seed", type=int, help="seed for the thread pool's generators and --stream-to")
+    parser.add_argument("--no-backends", action="store_true", help="skip the backend comparison")
+    parser.add_argument("--stream-to", metavar="PATH",
+                        help="instead of benchmarking, write --count random int32 values to PATH")
+    parser.add_argument("--count", type=int, default=10_000_000, help="values to write with --stream-to")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="values per chunk")
+    parser.add_argument("--workers", type=int, default=1, help="processes filling the output file (0: one per CPU)")
+    add_harness_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.stream_to:
+        summary = write_random_file(args.stream_to, args.count, args.min_val, args.max_val, args.chunk_size,
+                                    args.workers, args.seed)
+        print(f"Wrote {summary['values']:,} values ({summary['bytes'] / 2**20:,.1f} MiB) to {summary['path']} "
+              f"with {summary['workers']} worker(s) in {summary['seconds']:.2f} s "
+              f"({summary['mb_per_second']:,.0f} MB/s)")
+        return
+    workload = Workload(DEFAULT_WORKLOAD.num_sets if args.sets is None else args.sets,
+                        DEFAULT_WORKLOAD.numbers_per_set if args.numbers is None else args.numbers,
+                        args.min_val, args.max_val)
+    options = harness_options(args)
+
+    # Perform tests for both multithreaded and sequential scenarios.
+    results = {
+        "multithreading": run_with_multithreading(workload, **options),
+        "sequential": run_without_multithreading(workload, **options),
+    }
+
+    print("\n--- Final Performance Summary ---")
+    display_results(results)
+    avg_multithreaded = results["multithreading"]["mean_ns"]
+    avg_sequential = results["sequential"]["mean_ns"]
+    if avg_multithreaded > 0 and avg_sequential > 0: # Calculate and display percentage difference.
+        percentage_diff = ((avg_sequential - avg_multithreaded) / avg_sequential) * 100
+        if percentage_diff > 0:
+            print(f"Multithreaded execution was {percentage_diff:.2f}% faster than Sequential.")
+        elif percentage_diff < 0:
+            print(f"Multithreaded execution was {-percentage_diff:.2f}% slower than Sequential.")
+        else:
+            print("Multithreaded and Sequential execution times were approximately the same.")
+    else:
+        print("Not enough data to calculate percentage difference.")
+
+    overhead = measure_threading_overhead(workload, args.seed, **options)
+    display_threading_overhead(overhead)
+    for name, stats in overhead.items():
+        results[f"overhead/{name}"] = stats
+
+    if not args.no_backends:
+        if args.sets is None and args.numbers is None:
+            backend_workloads = BACKEND_WORKLOADS
+        else:
+            backend_workloads = [(workload.num_sets, workload.numbers_per_set)]
+        rows = compare_backends(backend_workloads, workload.min_val, workload.max_val, **options)
+        display_backend_comparison(rows)
+        for row in rows:
+            for name, stats in row["stats"].items():
+                results[f"{name}/{row['num_sets']}x{row['numbers_per_set']}"] = stats
+
+    if args.output:
+        write_results(args.output, results, {"workload": asdict(workload), **options})
+        print(f"Results written to {args.output}")
+    if args.compare:
+        if display_comparison(compare_results(read_results(args.compare), results, args.threshold), args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
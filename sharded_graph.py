@@ -0,0 +1,567 @@
+import argparse
+import heapq
+import json
+import multiprocessing
+import os
+import random
+import time
+import zlib
+from collections import Counter
+
+from graph_generator import generate_follow_edges, generate_people
+from Hashing import splitmix_finalize
+
+
+def shard_of(name, shard_count):
+    # Stable across processes and runs, unlike hash(): the CRC-32 of the UTF-8 name is
+    # spread over 64 bits with the SplitMix64 finalizer and bucketed by modulo, as
+    # Hashing.HashTable buckets IC keys.
+    return splitmix_finalize(zlib.crc32(name.encode('utf-8'))) % shard_count
+
+
+class GraphShard:
+    # The part of the graph one worker process owns: the vertices that hash to it, the
+    # accounts they follow, and a replica of their followers (the in-edges whose
+    # out-edge lives on the follower's shard). Each public method takes and returns
+    # whole batches so one pipe round trip carries many operations.
+
+    def __init__(self, shard_id, shard_count):
+        self.shard_id = shard_id
+        self.shard_count = shard_count
+        self.out_edges = {}
+        self.in_edges = {}
+        # Per-batch candidate counts kept between the rounds of recommend_many.
+        self.candidate_counts = {}
+
+    def add_vertices(self, names):
+        added = []
+        for name in names:
+            if name in self.out_edges:
+                added.append(False)
+            else:
+                self.out_edges[name] = set()
+                self.in_edges[name] = set()
+                added.append(True)
+        return added
+
+    def has_vertices(self, names):
+        return [name in self.out_edges for name in names]
+
+    def link_in(self, pairs):
+        # Records followers; pairs are (followed, follower) with `followed` owned here.
+        outcomes = []
+        for followed, follower in pairs:
+            followers = self.in_edges.get(followed)
+            if followers is None:
+                outcomes.append("missing")
+            elif follower in followers:
+                outcomes.append("duplicate")
+            else:
+                followers.add(follower)
+                outcomes.append("added")
+        return outcomes
+
+    def unlink_in(self, pairs):
+        removed = []
+        for followed, follower in pairs:
+            followers = self.in_edges[followed]
+            removed.append(follower in followers)
+            followers.discard(follower)
+        return removed
+
+    def link_out(self, pairs):
+        outcomes = []
+        for follower, followed in pairs:
+            following = self.out_edges.get(follower)
+            if following is None:
+                outcomes.append("missing")
+            else:
+                following.add(followed)
+                outcomes.append("added")
+        return outcomes
+
+    def unlink_out(self, pairs):
+        removed = []
+        for follower, followed in pairs:
+            following = self.out_edges.get(follower)
+            if following is None or followed not in following:
+                removed.append(False)
+            else:
+                following.remove(followed)
+                removed.append(True)
+        return removed
+
+    def neighbours(self, names, direction):
+        # Lists of followed accounts ("out") or followers ("in"), None for unknown names.
+        adjacency = self.out_edges if direction == "out" else self.in_edges
+        return [list(adjacency[name]) if name in adjacency else None for name in names]
+
+    def degrees(self, names, direction):
+        adjacency = self.out_edges if direction == "out" else self.in_edges
+        return [len(adjacency.get(name, ())) for name in names]
+
+    def vertices(self):
+        return list(self.out_edges)
+
+    def edge_count(self):
+        return sum(len(following) for following in self.out_edges.values())
+
+    # --- Distributed top-k for recommend_many (three rounds, see ShardedGraph) ----------
+
+    def count_candidates(self, batch_id, queries, k):
+        # queries: [(query index, followees owned here, excluded names)]. Counts how many
+        # of the followees follow each candidate and returns each query's local top k.
+        counts_by_query = {}
+        local_tops = []
+        for query, followees, excluded in queries:
+            counts = Counter()
+            for followee in followees:
+                counts.update(self.out_edges.get(followee, ()))
+            for name in excluded:
+                counts.pop(name, None)
+            counts_by_query[query] = counts
+            local_tops.append((query, heapq.nlargest(k, counts.items(), key=lambda item: item[1])))
+        self.candidate_counts[batch_id] = counts_by_query
+        return local_tops
+
+    def candidates_above(self, batch_id, thresholds):
+        # thresholds: [(query index, t)] -> [(query index, [(name, count) with count >= t])]
+        counts_by_query = self.candidate_counts[batch_id]
+        return [(query, [(name, count) for name, count in counts_by_query[query].items() if count >= threshold])
+                for query, threshold in thresholds]
+
+    def exact_counts(self, batch_id, requests):
+        # requests: [(query index, names)] -> [(query index, [count, ...])]; ends the batch.
+        counts_by_query = self.candidate_counts.pop(batch_id, {})
+        return [(query, [counts_by_query.get(query, {}).get(name, 0) for name in names])
+                for query, names in requests]
+
+    def forget(self, batch_id):
+        self.candidate_counts.pop(batch_id, None)
+        return True
+
+
+def _shard_main(connection, shard_id, shard_count):
+    # Worker loop: receive a batch [(method, args), ...], reply with the results list.
+    # A request that raises puts its exception in the list instead of a result, so the
+    # worker keeps serving and the coordinator re-raises it (see ShardedGraph._scatter).
+    shard = GraphShard(shard_id, shard_count)
+    while True:
+        try:
+            batch = connection.recv()
+        except EOFError:
+            break
+        if batch is None:
+            break
+        results = []
+        for method, args in batch:
+            try:
+                results.append(getattr(shard, method)(*args))
+            except Exception as error:
+                results.append(error)
+        try:
+            connection.send(results)
+        except Exception as error:  # e.g. an exception that cannot be pickled
+            connection.send([RuntimeError(f"GraphShard-{shard_id} could not send its reply: {error!r}")
+                             for _ in batch])
+    connection.close()
+
+
+class ShardedGraph:
+    # Graph-compatible coordinator over `shard_count` worker processes.
+    #
+    # Vertices live on shard_of(name). An edge a -> b is stored as an out-edge on a's
+    # shard and as a follower replica on b's shard; adding one first records the
+    # follower on b's shard (which also checks that b exists and is not already
+    # followed by a), then the out-edge on a's shard, undoing the first step if a turns
+    # out not to exist. Every step is batched per shard and sent to all shards before
+    # any reply is read, so the shards work in parallel.
+    #
+    # The coordinator is single-threaded and not meant to be shared between threads.
+
+    def __init__(self, shard_count=None, context=None):
+        self.shard_count = shard_count or os.cpu_count() or 1
+        context = context or multiprocessing.get_context()
+        self.connections = []
+        self.processes = []
+        # Batches sent to the shards, and the last id handed to a recommend_many batch.
+        self.messages_sent = 0
+        self.query_batches = 0
+        for shard_id in range(self.shard_count):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(target=_shard_main, args=(child_end, shard_id, self.shard_count),
+                                      name=f"GraphShard-{shard_id}", daemon=True)
+            process.start()
+            child_end.close()
+            self.connections.append(parent_end)
+            self.processes.append(process)
+
+    def close(self):
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+        for connection in self.connections:
+            connection.close()
+        self.connections = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # --- Scatter-gather plumbing ---------------------------------------------------
+
+    def _scatter(self, requests):
+        # requests: {shard: [(method, args), ...]}. Sends every batch, then collects the
+        # replies; returns {shard: [result, ...]}. Every reply is read before the first
+        # exception a shard sent back is re-raised, so the pipes stay in step.
+        for shard, batch in requests.items():
+            self.connections[shard].send(batch)
+        self.messages_sent += len(requests)
+        replies = {shard: self.connections[shard].recv() for shard in requests}
+        for results in replies.values():
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return replies
+
+    def _route(self, items, key):
+        # Groups items by the shard of key(item); returns {shard: (positions, items)}.
+        groups = {}
+        shard_count = self.shard_count
+        for position, item in enumerate(items):
+            positions, grouped = groups.setdefault(shard_of(key(item), shard_count), ([], []))
+            positions.append(position)
+            grouped.append(item)
+        return groups
+
+    def _call_routed(self, method, items, key, *extra_args):
+        # Calls shard.method(items_for_that_shard, *extra_args) on every shard that owns
+        # some items and returns the per-item results in the original order.
+        groups = self._route(items, key)
+        replies = self._scatter({shard: [(method, (grouped,) + extra_args)]
+                                 for shard, (_, grouped) in groups.items()})
+        results = [None] * len(items)
+        for shard, (positions, _) in groups.items():
+            for position, result in zip(positions, replies[shard][0]):
+                results[position] = result
+        return results
+
+    # --- Graph API -----------------------------------------------------------------
+
+    def add_vertices(self, vertices, max_errors=20):
+        vertices = list(vertices)
+        added = self._call_routed("add_vertices", vertices, lambda name: name)
+        summary = {"added": sum(added), "existing": len(added) - sum(added), "errors": []}
+        for vertex, was_added in zip(vertices, added):
+            if not was_added and len(summary["errors"]) < max_errors:
+                summary["errors"].append(f"Vertex '{vertex}' already exists in the graph.")
+        return summary
+
+    def add_edges(self, edges, max_errors=20):
+        edges = list(edges)
+        summary = {"added": 0, "duplicates": 0, "missing": 0, "errors": []}
+        outcomes = self._call_routed("link_in", [(to_vertex, from_vertex) for from_vertex, to_vertex in edges],
+                                     lambda pair: pair[0])
+        pending = [position for position, outcome in enumerate(outcomes) if outcome == "added"]
+        out_outcomes = self._call_routed("link_out", [edges[position] for position in pending], lambda pair: pair[0])
+        rollback = []
+        for position, outcome in zip(pending, out_outcomes):
+            if outcome == "missing":
+                outcomes[position] = "missing"
+                rollback.append((edges[position][1], edges[position][0]))
+        if rollback:
+            self._call_routed("unlink_in", rollback, lambda pair: pair[0])
+
+        for (from_vertex, to_vertex), outcome in zip(edges, outcomes):
+            if outcome == "added":
+                summary["added"] += 1
+                continue
+            if outcome == "duplicate":
+                summary["duplicates"] += 1
+                message = f"Error: {from_vertex} is already following {to_vertex}."
+            else:
+                summary["missing"] += 1
+                message = f"Error: One or both vertices ('{from_vertex}', '{to_vertex}') not found. Cannot add edge."
+            if len(summary["errors"]) < max_errors:
+                summary["errors"].append(message)
+        return summary
+
+    def remove_edges(self, edges, max_errors=20):
+        edges = list(edges)
+        removed = self._call_routed("unlink_out", edges, lambda pair: pair[0])
+        self._call_routed("unlink_in", [(to_vertex, from_vertex)
+                                        for (from_vertex, to_vertex), was_removed in zip(edges, removed) if was_removed],
+                          lambda pair: pair[0])
+        summary = {"removed": sum(removed), "missing": len(removed) - sum(removed), "errors": []}
+        for (from_vertex, to_vertex), was_removed in zip(edges, removed):
+            if not was_removed and len(summary["errors"]) < max_errors:
+                summary["errors"].append(
+                    f"Error: Edge from '{from_vertex}' to '{to_vertex}' does not exist or vertices not found.")
+        return summary
+
+    def addVertex(self, vertex):
+        if self.add_vertices([vertex])["added"]:
+            print(f"Vertex '{vertex}' added to the graph.")
+        else:
+            print(f"Vertex '{vertex}' already exists in the graph.")
+
+    def addEdge(self, from_vertex, to_vertex):
+        summary = self.add_edges([(from_vertex, to_vertex)])
+        print(f"Edge added from '{from_vertex}' to '{to_vertex}'." if summary["added"] else summary["errors"][0])
+
+    def removeEdge(self, from_vertex, to_vertex):
+        summary = self.remove_edges([(from_vertex, to_vertex)])
+        print(f"Edge removed from '{from_vertex}' to '{to_vertex}'." if summary["removed"] else summary["errors"][0])
+
+    def _neighbour_set(self, vertex, direction):
+        neighbours = self._call_routed("neighbours", [vertex], lambda name: name, direction)[0]
+        if neighbours is None:
+            print(f"Vertex '{vertex}' not found in the graph.")
+            return set()
+        return set(neighbours)
+
+    def listOutgoingAdjacentVertex(self, vertex):
+        # Returns a new set (the data lives in another process).
+        return self._neighbour_set(vertex, "out")
+
+    def listIncomingAdjacentVertex(self, vertex):
+        return self._neighbour_set(vertex, "in")
+
+    def out_degree(self, vertex):
+        return self._call_routed("degrees", [vertex], lambda name: name, "out")[0]
+
+    def in_degree(self, vertex):
+        return self._call_routed("degrees", [vertex], lambda name: name, "in")[0]
+
+    def has_vertex(self, vertex):
+        return self._call_routed("has_vertices", [vertex], lambda name: name)[0]
+
+    def get_all_vertices(self):
+        replies = self._scatter({shard: [("vertices", ())] for shard in range(self.shard_count)})
+        return [name for shard in range(self.shard_count) for name in replies[shard][0]]
+
+    def edge_count(self):
+        replies = self._scatter({shard: [("edge_count", ())] for shard in range(self.shard_count)})
+        return sum(reply[0] for reply in replies.values())
+
+    # --- Multi-hop queries -----------------------------------------------------------
+
+    def shortest_follow_path(self, source, target):
+        # Bidirectional BFS like SocialGraphQueries, expanding a whole frontier with one
+        # scatter-gather per level. Returns the list of names or None.
+        if not all(self._call_routed("has_vertices", [source, target], lambda name: name)):
+            return None
+        if source == target:
+            return [source]
+        forward_parent = {source: None}
+        backward_parent = {target: None}
+        forward_frontier = [source]
+        backward_frontier = [target]
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, parent, other, direction = forward_frontier, forward_parent, backward_parent, "out"
+            else:
+                frontier, parent, other, direction = backward_frontier, backward_parent, forward_parent, "in"
+            next_frontier = []
+            meeting = None
+            for vertex, neighbours in zip(frontier, self._call_routed("neighbours", frontier, lambda name: name,
+                                                                      direction)):
+                for neighbour in neighbours or ():
+                    if neighbour not in parent:
+                        parent[neighbour] = vertex
+                        next_frontier.append(neighbour)
+                        if meeting is None and neighbour in other:
+                            meeting = neighbour
+            if direction == "out":
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+            if meeting is not None:
+                path = []
+                vertex = meeting
+                while vertex is not None:
+                    path.append(vertex)
+                    vertex = forward_parent[vertex]
+                path.reverse()
+                vertex = backward_parent[meeting]
+                while vertex is not None:
+                    path.append(vertex)
+                    vertex = backward_parent[vertex]
+                return path
+        return None
+
+    def degrees_of_separation(self, source, target):
+        path = self.shortest_follow_path(source, target)
+        return None if path is None else len(path) - 1
+
+    def recommend(self, vertex, k=5):
+        return self.recommend_many([vertex], k)[0]
+
+    def recommend_many(self, vertices, k=5):
+        # Friend-of-friend suggestions for many users at once, ranked like
+        # SocialGraphQueries.recommend: [(name, mutual_count), ...] per vertex.
+        #
+        # Mutual counts are split across the shards that own each user's followees.
+        # Rather than shipping every partial count to the coordinator, this runs the
+        # three-round TPUT top-k algorithm: (1) each shard returns its local top k and
+        # the k-th best partial sum tau gives a lower bound; (2) shards return every
+        # candidate whose local count reaches tau / (shards involved), which bounds what
+        # any unreported candidate can score; (3) exact counts are fetched only for
+        # candidates whose upper bound can still reach the top k.
+        if not vertices:
+            return []
+        if k <= 0:
+            return [[] for _ in vertices]
+        followees = self._call_routed("neighbours", list(vertices), lambda name: name, "out")
+        self.query_batches += 1
+        batch_id = self.query_batches
+
+        queries_by_shard = {}
+        involved = []
+        for query, (vertex, following) in enumerate(zip(vertices, followees)):
+            following = following or []
+            excluded = following + [vertex]
+            shards = set()
+            for shard, (_, owned) in self._route(following, lambda name: name).items():
+                queries_by_shard.setdefault(shard, []).append((query, owned, excluded))
+                shards.add(shard)
+            involved.append(shards)
+        if not queries_by_shard:
+            return [[] for _ in vertices]
+
+        reported = [{} for _ in vertices]  # query -> {candidate: {shard: count}}
+        replies = self._scatter({shard: [("count_candidates", (batch_id, queries, k))]
+                                 for shard, queries in queries_by_shard.items()})
+        for shard, (local_tops,) in replies.items():
+            for query, top in local_tops:
+                for name, count in top:
+                    reported[query].setdefault(name, {})[shard] = count
+
+        thresholds = []
+        for query in range(len(vertices)):
+            partial_sums = [sum(counts.values()) for counts in reported[query].values()]
+            tau = heapq.nlargest(k, partial_sums)[-1] if len(partial_sums) >= k else 0
+            thresholds.append(tau / max(1, len(involved[query])))
+        replies = self._scatter({shard: [("candidates_above", (batch_id, [(query, thresholds[query])
+                                                                         for query, _, _ in queries]))]
+                                 for shard, queries in queries_by_shard.items()})
+        for shard, (above,) in replies.items():
+            for query, candidates in above:
+                for name, count in candidates:
+                    reported[query].setdefault(name, {})[shard] = count
+
+        missing_by_shard = {}
+        for query in range(len(vertices)):
+            shard_count = len(involved[query])
+            lower_bounds = {name: sum(counts.values()) for name, counts in reported[query].items()}
+            tau = heapq.nlargest(k, lower_bounds.values())[-1] if len(lower_bounds) >= k else 0
+            survivors = {}
+            for name, counts in reported[query].items():
+                unreported = shard_count - len(counts)
+                # Unreported shards each hold a count below the threshold.
+                if unreported == 0 or lower_bounds[name] + unreported * thresholds[query] > tau:
+                    survivors[name] = counts
+                    for shard in involved[query] - counts.keys():
+                        missing_by_shard.setdefault(shard, {}).setdefault(query, []).append(name)
+            reported[query] = survivors
+        replies = self._scatter({
+            shard: [("exact_counts", (batch_id, list(missing_by_shard.get(shard, {}).items())))]
+            for shard in queries_by_shard
+        })
+        for shard, (exact,) in replies.items():
+            for query, counts in exact:
+                for name, count in zip(missing_by_shard[shard][query], counts):
+                    reported[query][name][shard] = count
+
+        results = []
+        for query in range(len(vertices)):
+            totals = [(name, sum(counts.values())) for name, counts in reported[query].items()]
+            totals = [item for item in totals if item[1] > 0]
+            results.append(heapq.nsmallest(k, totals, key=lambda item: (-item[1], item[0])))
+        return results
+
+
+# --- Scaling benchmark ---------------------------------------------------------------
+
+def load_synthetic_graph(graph, user_count, follows_per_user=10, seed=0, chunk_size=50000):
+    # Streams a generated follow graph into any graph with the bulk API; returns the names.
+    names = [person.name for person in generate_people(user_count, seed=seed)]
+    for start in range(0, len(names), chunk_size):
+        graph.add_vertices(names[start:start + chunk_size])
+    for chunk in generate_follow_edges(user_count, follows_per_user, seed=seed + 1, chunk_size=chunk_size):
+        graph.add_edges([(names[follower], names[followed]) for follower, followed in chunk])
+    return names
+
+
+def benchmark_shard_count(shard_count, names, edges, queries, k=5, batch_size=200):
+    with ShardedGraph(shard_count) as graph:
+        start_time = time.perf_counter()
+        for start in range(0, len(names), 50000):
+            graph.add_vertices(names[start:start + 50000])
+        for start in range(0, len(edges), 50000):
+            graph.add_edges(edges[start:start + 50000])
+        ingest_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for start in range(0, len(queries), batch_size):
+            graph.recommend_many(queries[start:start + batch_size], k)
+        query_seconds = time.perf_counter() - start_time
+    return {
+        "shards": shard_count,
+        "edges_per_second": len(edges) / ingest_seconds,
+        "recommendations_per_second": len(queries) / query_seconds,
+    }
+
+
+def run_shard_benchmark(shard_counts=(1, 2, 4), user_count=50000, follows_per_user=20, query_count=5000, seed=0):
+    names = [person.name for person in generate_people(user_count, seed=seed)]
+    edges = [(names[follower], names[followed])
+             for chunk in generate_follow_edges(user_count, follows_per_user, seed=seed + 1)
+             for follower, followed in chunk]
+    rng = random.Random(seed)
+    queries = [rng.choice(names) for _ in range(query_count)]
+    results = [benchmark_shard_count(shard_count, names, edges, queries) for shard_count in shard_counts]
+    for row in results:
+        row["ingest_speedup"] = row["edges_per_second"] / results[0]["edges_per_second"]
+        row["query_speedup"] = row["recommendations_per_second"] / results[0]["recommendations_per_second"]
+    return results
+
+
+def display_shard_benchmark(results):
+    print(f"\n--- Sharded Graph Scaling ({os.cpu_count()} CPU(s) available) ---")
+    header = (f"| {'Shards':>6} | {'Edges/s':>12} | {'Speedup':>7} | {'Recs/s':>10} | {'Speedup':>7} | "
+              f"{'Efficiency':>10} |")
+    print("-" * len(header))
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(f"| {row['shards']:>6} | {row['edges_per_second']:>12,.0f} | {row['ingest_speedup']:>6.2f}x | "
+              f"{row['recommendations_per_second']:>10,.0f} | {row['query_speedup']:>6.2f}x | "
+              f"{row['query_speedup'] / row['shards'] * results[0]['shards']:>9.0%} |")
+    print("-" * len(header))
+    if max(row["shards"] for row in results) > (os.cpu_count() or 1):
+        print("Note: more shards than CPUs; the shards time-share cores, so scaling flattens out.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput scaling of the hash-partitioned sharded graph.")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4], help="shard counts to compare")
+    parser.add_argument("--users", type=int, default=50000, help="generated users")
+    parser.add_argument("--follows", type=int, default=20, help="follows per generated user")
+    parser.add_argument("--queries", type=int, default=5000, help="recommendation queries per shard count")
+    parser.add_argument("--seed", type=int, default=0, help="generator seed")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = run_shard_benchmark(args.shards, args.users, args.follows, args.queries, args.seed)
+    display_shard_benchmark(results)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({"config": vars(args), "cpus": os.cpu_count(), "results": results}, output_file, indent=2)
+        print(f"Results written to {args.output}")
@@ -0,0 +1,365 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+import traceback
+
+from pagination import DEFAULT_PAGE_SIZE
+from person import Person
+from profile_cache import RenderedProfileCache, render_profile_payload
+from profile_store import profiles_page
+
+# Line-delimited JSON over TCP. Each request line is one object, or a JSON array of
+# objects answered by one array line (a batch):
+#   {"id": 1, "op": "list_users", "cursor": null, "limit": 100}
+#   {"id": 2, "op": "profile", "name": "...", "respect_privacy": true}
+#   {"id": 3, "op": "following" | "followers", "name": "...", "cursor": null, "limit": 100}
+#   {"id": 6, "op": "search", "query": "...", "in": "names" | "biographies", "limit": 10}
+#   {"id": 7, "op": "stats"}
+#   {"id": 4, "op": "add_user", "name": "...", "gender": "...", "biography": "...", "is_private": false}
+#   {"id": 5, "op": "follow" | "unfollow", "follower": "...", "followed": "..."}
+# Responses echo the id: {"id": 1, "ok": true, "result": ...} or {"id": 1, "ok": false, "error": "..."}.
+# Listings are paged: their result is {"items": [...], "next_cursor": "..." or null}; pass
+# next_cursor back to get the following page. Listing and search limits must be from 1
+# to MAX_PAGE_SIZE.
+# Replies to requests that arrive together are written back with a single drain(), in
+# request order. Those requests are processed concurrently, so a read does not wait for
+# a write sent just before it on the same connection; wait for the write's reply first.
+READ_OPERATIONS = {"list_users", "profile", "following", "followers", "search", "stats"}
+WRITE_OPERATIONS = {"add_user", "follow", "unfollow"}
+MAX_LINE_BYTES = 1 << 20
+MAX_PAGE_SIZE = 1000
+
+
+class RequestError(Exception):
+    pass
+
+
+class SocialServer:
+    # Serves the menu's read and write operations (options 1-8) to many clients.
+    #
+    # Everything runs on one event loop thread. Reads are answered inline, so they
+    # always see a consistent graph. Writes are queued to a single writer task that
+    # applies everything queued so far as one batch under `lock` (shared with
+    # SocialStore's background thread and the rest of the app), then resolves each
+    # request's future; with many clients that is one lock round trip per batch.
+
+    def __init__(self, graph, profiles, lock=None, store=None, search=None):
+        self.graph = graph
+        self.profiles = profiles
+        self.lock = lock or threading.RLock()
+        self.store = store
+        self.search = search
+        self.profile_cache = RenderedProfileCache(profiles, render_profile_payload)
+        self.write_queue = None
+        self.requests_served = 0
+        self.write_batches = 0
+        self.clients = 0
+
+    async def start(self, host="127.0.0.1", port=8765):
+        self.write_queue = asyncio.Queue()
+        self._writer_task = asyncio.ensure_future(self._writer_loop())
+        self._writer_task.add_done_callback(self._writer_done)
+        self.server = await asyncio.start_server(self._handle_client, host, port)
+        return self.server
+
+    async def serve_forever(self, host="127.0.0.1", port=8765):
+        server = await self.start(host, port)
+        address = server.sockets[0].getsockname()
+        print(f"Social media server listening on {address[0]}:{address[1]} (line-delimited JSON).")
+        async with server:
+            await server.serve_forever()
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self._writer_task.cancel()
+
+    # --- Connections -------------------------------------------------------------
+
+    async def _handle_client(self, reader, writer):
+        self.clients += 1
+        pending = b""
+        try:
+            while True:
+                # Reading in chunks rather than line by line lets pipelined requests that
+                # arrive together be answered with one write and one drain.
+                chunk = await reader.read(65536)
+                if not chunk:
+                    break
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                if len(pending) > MAX_LINE_BYTES:
+                    break
+                lines = [line for line in lines if line.strip()]
+                if lines:
+                    responses = await asyncio.gather(*(self._handle_line(line) for line in lines))
+                    writer.write(b"".join(responses))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    async def _handle_line(self, line):
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return self._encode({"id": None, "ok": False, "error": "Error: Request is not valid JSON."})
+        if isinstance(message, list):
+            responses = await asyncio.gather(*(self._handle_request(request) for request in message))
+            return self._encode(list(responses))
+        return self._encode(await self._handle_request(message))
+
+    @staticmethod
+    def _encode(response):
+        return json.dumps(response, separators=(",", ":")).encode('utf-8') + b"\n"
+
+    async def _handle_request(self, request):
+        if not isinstance(request, dict):
+            return {"id": None, "ok": False, "error": "Error: Each request must be a JSON object."}
+        self.requests_served += 1
+        request_id = request.get("id")
+        op = request.get("op")
+        try:
+            if not isinstance(op, str):
+                raise RequestError("Error: op must be an operation name.")
+            if op in READ_OPERATIONS:
+                try:
+                    result = self._read(op, request)
+                except RequestError:
+                    raise
+                except Exception as error:
+                    # As in the writer loop: report a bug for this request only, so the
+                    # connection and the other requests in its batch still get replies.
+                    traceback.print_exception(error)
+                    raise RequestError(f"Error: Internal error while answering '{op}': {error}") from None
+            elif op in WRITE_OPERATIONS:
+                future = asyncio.get_running_loop().create_future()
+                self.write_queue.put_nowait((op, request, future))
+                result = await future
+            else:
+                raise RequestError(f"Error: Unknown operation '{op}'.")
+        except RequestError as error:
+            return {"id": request_id, "ok": False, "error": str(error)}
+        return {"id": request_id, "ok": True, "result": result}
+
+    # --- Reads -------------------------------------------------------------------
+
+    def _require_person(self, request, field="name"):
+        name = request.get(field)
+        if not isinstance(name, str) or name not in self.profiles:
+            raise RequestError(f"Error: User '{name}' not found.")
+        return name
+
+    def _read(self, op, request):
+        if op == "list_users":
+            names, next_cursor = self._page(lambda cursor, limit: profiles_page(self.profiles, cursor, limit), request)
+            profiles = self.profiles
+            items = [{"name": name, "is_private": profiles[name].is_private} for name in names]
+            return {"items": items, "next_cursor": next_cursor}
+        if op == "search":
+            query, limit = request.get("query"), request.get("limit", 10)
+            if self.search is None:
+                raise RequestError("Error: Search is not enabled on this server.")
+            if not isinstance(query, str):
+                raise RequestError("Error: Search needs a text query.")
+            self._check_limit(limit)
+            if request.get("in", "names") == "biographies":
+                return [{"name": name, "score": score} for name, score in self.search.search_biographies(query, limit)]
+            return self.search.search_names(query, limit)
+        if op == "stats":
+            return {"requests": self.requests_served, "write_batches": self.write_batches, "clients": self.clients,
+                    "profile_cache": self.profile_cache.stats()}
+        name = self._require_person(request)
+        if op == "profile":
+            return self.profile_cache.get(name, ignore_privacy=not request.get("respect_privacy", True))
+        fetch_page = self.graph.following_page if op == "following" else self.graph.followers_page
+        names, next_cursor = self._page(lambda cursor, limit: fetch_page(name, cursor, limit), request)
+        return {"items": names, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _check_limit(limit):
+        # bool is an int subclass, but true/false is not a page size.
+        if not isinstance(limit, int) or isinstance(limit, bool) or not 1 <= limit <= MAX_PAGE_SIZE:
+            raise RequestError(f"Error: limit must be an integer from 1 to {MAX_PAGE_SIZE}.")
+
+    @staticmethod
+    def _page(fetch_page, request):
+        limit = request.get("limit", DEFAULT_PAGE_SIZE)
+        cursor = request.get("cursor")
+        SocialServer._check_limit(limit)
+        if cursor is not None and not isinstance(cursor, str):
+            raise RequestError("Error: cursor must be a string from a previous page.")
+        try:
+            return fetch_page(cursor, limit)
+        except (ValueError, TypeError) as error:  # malformed or forged cursor
+            raise RequestError(f"Error: {error}") from None
+
+    # --- Writes ------------------------------------------------------------------
+
+    async def _writer_loop(self):
+        queue = self.write_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            self.write_batches += 1
+            with self.lock:
+                for op, request, future in batch:
+                    try:
+                        result = self._write(op, request)
+                    except RequestError as error:
+                        future.set_exception(error)
+                    except Exception as error:
+                        # A bug in the graph, store or profile code: report it for this
+                        # request and keep the writer alive for the ones after it.
+                        traceback.print_exception(error)
+                        future.set_exception(RequestError(f"Error: Internal error while applying '{op}': {error}"))
+                    else:
+                        future.set_result(result)
+
+    @staticmethod
+    def _writer_done(task):
+        # The writer only ends by cancellation (stop()); anything else leaves every
+        # later write waiting, so say so loudly.
+        if not task.cancelled() and task.exception() is not None:
+            print("Social media server: the writer task stopped; writes will no longer be applied.", file=sys.stderr)
+            traceback.print_exception(task.exception())
+
+    def _write(self, op, request):
+        if op == "add_user":
+            fields = {}
+            for field in ("name", "gender", "biography"):
+                value = request.get(field)
+                if not isinstance(value, str) or not value.strip():
+                    raise RequestError(f"Error: {field.capitalize()} cannot be empty.")
+                fields[field] = value.strip()
+            if fields["name"] in self.profiles:
+                raise RequestError(f"Error: A user with the name '{fields['name']}' already exists.")
+            person = Person(fields["name"], fields["gender"], fields["biography"], bool(request.get("is_private")))
+            try:
+                self.profiles[person.name] = person
+            except ValueError as error:  # a ProfileStore rejects the profile before storing anything
+                raise RequestError(f"Error: {error}") from None
+            self.graph.add_vertices([person.name])
+            if self.store:
+                self.store.log_person(person)
+            return f"User '{person.name}' added successfully!"
+
+        follower = self._require_person(request, "follower")
+        followed = self._require_person(request, "followed")
+        if op == "follow":
+            if follower == followed:
+                raise RequestError("Error: A user cannot follow themselves.")
+            summary = self.graph.add_edges([(follower, followed)])
+            if not summary["added"]:
+                raise RequestError(summary["errors"][0])
+            return f"Edge added from '{follower}' to '{followed}'."
+        summary = self.graph.remove_edges([(follower, followed)])
+        if not summary["removed"]:
+            raise RequestError(summary["errors"][0])
+        return f"Edge removed from '{follower}' to '{followed}'."
+
+
+# --- Load generator ---------------------------------------------------------------
+
+async def _load_client(host, port, names, requests, pipeline, write_ratio, rng, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE_BYTES)
+    try:
+        sent = 0
+        while sent < requests:
+            window = min(pipeline, requests - sent)
+            lines = []
+            for i in range(window):
+                roll = rng.random()
+                if roll < write_ratio:
+                    request = {"op": rng.choice(("follow", "unfollow")),
+                               "follower": rng.choice(names), "followed": rng.choice(names)}
+                elif roll < write_ratio + (1 - write_ratio) / 3:
+                    request = {"op": "profile", "name": rng.choice(names), "respect_privacy": True}
+                else:
+                    request = {"op": rng.choice(("following", "followers")), "name": rng.choice(names)}
+                request["id"] = sent + i
+                lines.append(json.dumps(request).encode('utf-8') + b"\n")
+            start = time.perf_counter_ns()
+            writer.write(b"".join(lines))
+            await writer.drain()
+            for _ in range(window):
+                response = json.loads(await reader.readline())
+                if not response["ok"]:
+                    errors[0] += 1
+            # Every request in a pipelined window shares the window's round-trip time.
+            latencies.extend([time.perf_counter_ns() - start] * window)
+            sent += window
+    finally:
+        writer.close()
+
+
+async def run_load_test(host="127.0.0.1", port=8765, clients=50, requests_per_client=1000, pipeline=1,
+                        write_ratio=0.1, seed=0):
+    # Opens `clients` connections that each send `requests_per_client` mixed reads and
+    # follow/unfollow writes, `pipeline` at a time. Returns throughput and latency stats.
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE_BYTES)
+    names = []
+    cursor = None
+    while True:
+        writer.write(json.dumps({"id": 0, "op": "list_users", "cursor": cursor, "limit": MAX_PAGE_SIZE}).encode('utf-8')
+                     + b"\n")
+        await writer.drain()
+        page = json.loads(await reader.readline())["result"]
+        names.extend(user["name"] for user in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    writer.close()
+    if not names:
+        raise ValueError("The server has no users to query.")
+
+    latencies = []
+    errors = [0]
+    start_time = time.perf_counter()
+    await asyncio.gather(*(
+        _load_client(host, port, names, requests_per_client, pipeline, write_ratio,
+                     random.Random(seed * 1000003 + client), latencies, errors)
+        for client in range(clients)
+    ))
+    elapsed = time.perf_counter() - start_time
+    cut_points = statistics.quantiles(latencies, n=100, method='inclusive') if len(latencies) > 1 else latencies * 99
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "errors": errors[0],
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed if elapsed > 0 else float('inf'),
+        "p50_ms": cut_points[49] / 1e6,
+        "p95_ms": cut_points[94] / 1e6,
+        "p99_ms": cut_points[98] / 1e6,
+    }
+
+
+def display_load_results(stats):
+    print("\n--- Load Test ---")
+    print(f"{stats['clients']} clients, {stats['requests']:,} requests in {stats['seconds']:.2f} s "
+          f"({stats['errors']:,} error replies, e.g. duplicate follows)")
+    print(f"Throughput: {stats['requests_per_second']:,.0f} requests/s")
+    print(f"Latency: p50 {stats['p50_ms']:.2f} ms | p95 {stats['p95_ms']:.2f} ms | p99 {stats['p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load generator for the social media server (main.py --serve).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=50, help="concurrent connections")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per client")
+    parser.add_argument("--pipeline", type=int, default=1, help="requests in flight per connection")
+    parser.add_argument("--write-ratio", type=float, default=0.1, help="share of follow/unfollow requests")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    display_load_results(asyncio.run(run_load_test(args.host, args.port, args.clients, args.requests,
+                                                   args.pipeline, args.write_ratio, args.seed)))
@@ -0,0 +1,25 @@
+from benchmark_harness import percentile
+
+
+def test_percentile_is_nearest_rank_for_odd_counts():
+    values = [1, 2, 3, 4, 5]
+    assert percentile(values, 0.5) == 3
+    assert percentile(values, 0.2) == 1
+    assert percentile(values, 0.21) == 2
+    assert percentile(values, 0.95) == 5
+
+
+def test_percentile_is_nearest_rank_for_even_counts():
+    values = [10, 20, 30, 40]
+    assert percentile(values, 0.5) == 20
+    assert percentile(values, 0.51) == 30
+    assert percentile(values, 0.99) == 40
+
+
+def test_percentile_clamps_to_the_list():
+    values = list(range(1, 101))
+    assert percentile(values, 0.0) == 1
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 1.0) == 100
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.5) == 0.0
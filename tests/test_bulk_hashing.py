@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from Hashing import HashTable, OpenAddressingHashTable, pack_ic, pack_ics, unpack_ic, unpack_ics
+
+
+def random_ics(count, seed=0):
+    rng = random.Random(seed)
+    return [unpack_ic(key) for key in rng.sample(range(10**11, 10**12), count)]
+
+
+def test_pack_ics_matches_pack_ic_and_flags_invalid_entries():
+    ics = random_ics(50)
+    batch = ics + [ics[0].replace('-', ''), "12-34", "", "1234567890ab"]
+    keys, valid = pack_ics(batch)
+    assert list(valid) == [True] * 51 + [False] * 3
+    assert list(keys[:51]) == [pack_ic(ic) for ic in batch[:51]]
+    assert list(unpack_ics(keys[:50])) == ics
+
+
+@pytest.mark.parametrize("table_class", [HashTable, OpenAddressingHashTable])
+def test_insert_many_matches_one_by_one_inserts(table_class):
+    ics = random_ics(400)
+    batch = ics + ["bad", "123456-78-90"]
+    one_by_one = table_class(997)
+    for ic in ics:
+        one_by_one.insert(ic)
+    batched = table_class(997)
+    indices, collisions = batched.insert_many(batch)
+
+    assert list(indices[-2:]) == [-1, -1]
+    assert collisions == batched.get_total_collisions() == one_by_one.get_total_collisions()
+    if table_class is HashTable:
+        assert [sorted(chain) for chain in batched.table] == [sorted(chain) for chain in one_by_one.table]
+        assert all(ic in batched.table[index] for ic, index in zip(ics, indices))
+    else:
+        # Linear probing fills the same slots whatever order the keys arrive in.
+        assert list(batched.keys) == list(one_by_one.keys)
+        assert all(batched.keys[slot] == pack_ic(ic) for ic, slot in zip(ics, indices))
+
+
+@pytest.mark.parametrize("table_class", [HashTable, OpenAddressingHashTable])
+def test_contains_many_matches_contains(table_class):
+    ics = random_ics(300, seed=1)
+    table = table_class(401)
+    table.insert_many(ics[:200])
+    queries = ics + ["bad"]
+    assert list(table.contains_many(queries)) == [table.contains(ic) for ic in queries] == [True] * 200 + [False] * 101
+
+
+def test_open_addressing_insert_many_skips_duplicates():
+    ics = random_ics(100, seed=2)
+    table = OpenAddressingHashTable(211)
+    table.insert_many(ics)
+    slots, collisions = table.insert_many(ics[:50] + ics[:50])
+    assert len(table) == 100
+    assert collisions == 0
+    assert list(slots[:50]) == list(slots[50:])
+    assert all(table.keys[slot] == pack_ic(ic) for ic, slot in zip(ics[:50] * 2, slots))
@@ -0,0 +1,35 @@
+import json
+
+from Hashing import run_collision_simulation, simulate_round, write_simulation_results
+
+
+def test_rounds_are_reproducible_and_independent_of_the_worker_count():
+    arguments = dict(table_sizes=(101, 211), num_rounds=4, num_ics=300, strategy_names=("folding", "fnv1a"),
+                     base_seed=7)
+    inline = run_collision_simulation(workers=1, **arguments)
+    pooled = run_collision_simulation(workers=2, **arguments)
+    assert inline == pooled == run_collision_simulation(workers=1, **arguments)
+    assert [row["round"] for row in inline] == [1] * 4 + [2] * 4 + [3] * 4 + [4] * 4
+    assert len({row["seed"] for row in inline}) == 4
+
+
+def test_round_rows_describe_the_tables_built():
+    rows = simulate_round(1, 0, 200, [53], ["folding"])
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["entries"] == 200 and row["table_size"] == 53
+    # 200 entries in 53 buckets: every entry after a bucket's first collides.
+    assert row["collisions"] == 200 - round(53 * (1 - row["empty_bucket_ratio"]))
+    assert simulate_round(1, 1, 200, [53], ["folding"]) != rows
+
+
+def test_results_are_written_as_json_or_csv(tmp_path):
+    rows = run_collision_simulation(table_sizes=(53,), num_rounds=2, num_ics=50, workers=1)
+    json_path = tmp_path / "rows.json"
+    write_simulation_results(rows, str(json_path))
+    assert json.loads(json_path.read_text()) == rows
+    csv_path = tmp_path / "rows.csv"
+    write_simulation_results(rows, str(csv_path))
+    lines = csv_path.read_text().splitlines()
+    assert lines[0].split(",") == list(rows[0])
+    assert len(lines) == 3
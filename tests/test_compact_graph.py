@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from graph import CompactGraph, Graph
+
+
+def apply_random_edits(graphs, user_count=50, edit_count=600, seed=0):
+    rng = random.Random(seed)
+    names = [f"user{i}" for i in range(user_count)]
+    for graph in graphs:
+        for name in names:
+            graph.addVertex(name)
+    for _ in range(edit_count):
+        edge = rng.sample(names, 2)
+        remove = rng.random() < 0.25
+        for graph in graphs:
+            (graph.removeEdge if remove else graph.addEdge)(*edge)
+    return names
+
+
+def test_compact_graph_matches_graph(capsys):
+    graph, compact = Graph(), CompactGraph()
+    names = apply_random_edits([graph, compact])
+    assert compact.get_all_vertices() == graph.get_all_vertices()
+    for name in names:
+        assert set(compact.listOutgoingAdjacentVertex(name)) == set(graph.listOutgoingAdjacentVertex(name))
+        assert set(compact.listIncomingAdjacentVertex(name)) == set(graph.listIncomingAdjacentVertex(name))
+        assert compact.in_degree(name) == graph.in_degree(name)
+        assert compact.out_degree(name) == graph.out_degree(name)
+    assert compact.edge_count == sum(graph.out_degree(name) for name in names)
+
+
+def test_adjacency_arrays_stay_sorted_and_mirrored(capsys):
+    compact = CompactGraph()
+    apply_random_edits([compact], seed=1)
+    for vertex_id, targets in enumerate(compact.out_edges):
+        assert list(targets) == sorted(set(targets))
+        assert all(vertex_id in compact.in_edges[target] for target in targets)
+    for sources in compact.in_edges:
+        assert list(sources) == sorted(set(sources))
+
+
+def test_console_messages_match_graph(capsys):
+    outputs = []
+    for graph in (Graph(), CompactGraph()):
+        graph.addVertex("a")
+        graph.addVertex("a")
+        graph.addVertex("b")
+        graph.addEdge("a", "b")
+        graph.addEdge("a", "b")
+        graph.addEdge("a", "ghost")
+        graph.removeEdge("b", "a")
+        graph.removeEdge("a", "b")
+        outputs.append(capsys.readouterr().out)
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_csr_snapshot_matches_the_compact_graph(seed, capsys):
+    compact = CompactGraph()
+    names = apply_random_edits([compact], seed=seed)
+    csr = compact.freeze()
+    assert len(csr) == len(names)
+    assert csr.edge_count() == compact.edge_count
+    in_degrees = list(csr.in_degrees())
+    for name in names:
+        vertex_id = compact.intern(name)
+        assert list(csr.out_neighbors(vertex_id)) == list(compact.out_edges[vertex_id])
+        assert csr.out_degree(name) == compact.out_degree(name)
+        assert in_degrees[vertex_id] == compact.in_degree(name)
+        assert set(csr.listOutgoingAdjacentVertex(name)) == set(compact.listOutgoingAdjacentVertex(name))
+
+    new_target = next(name for name in names[1:] if name not in compact.listOutgoingAdjacentVertex(names[0]))
+    compact.addEdge(names[0], new_target)
+    assert csr.edge_count() == compact.edge_count - 1  # the snapshot does not see later edits
@@ -0,0 +1,66 @@
+import threading
+
+from concurrent_hashing import StripedHashTable
+from Hashing import generate_unique_ic_numbers
+
+
+def run_in_threads(worker, thread_count):
+    barrier = threading.Barrier(thread_count)
+
+    def run(thread_index):
+        barrier.wait()
+        worker(thread_index)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def expected_collisions(table):
+    # Every entry collides except the first one in its chain.
+    return sum(len(chain) - 1 for chain in table.table if chain)
+
+
+def test_concurrent_inserts_and_deletes_keep_entries_and_collisions_exact():
+    ic_numbers = generate_unique_ic_numbers(4000, seed=3)
+    thread_count = 8
+    shares = [ic_numbers[i::thread_count] for i in range(thread_count)]
+    table = StripedHashTable(101, stripes=8)  # long chains, so most inserts collide
+
+    run_in_threads(lambda i: [table.insert(ic) for ic in shares[i]], thread_count)
+    assert len(table) == len(ic_numbers)
+    assert table.get_total_collisions() == expected_collisions(table)
+
+    run_in_threads(lambda i: [table.delete(ic) for ic in shares[i][::2]], thread_count)
+    remaining = [ic for share in shares for ic in share[1::2]]
+    assert sorted(ic for chain in table.table for ic in chain) == sorted(remaining)
+    assert table.get_total_collisions() == expected_collisions(table)
+    assert all(table.contains(ic) for ic in remaining)
+    assert not any(table.contains(ic) for share in shares for ic in share[::2])
+
+
+def test_delete_of_missing_ic_changes_nothing():
+    table = StripedHashTable(11, stripes=4)
+    ic_numbers = generate_unique_ic_numbers(30, seed=4)
+    for ic in ic_numbers[:20]:
+        table.insert(ic)
+    before = table.get_total_collisions()
+    assert not table.delete(ic_numbers[25])
+    assert not table.delete("not-an-ic")
+    assert table.get_total_collisions() == before
+    assert table.delete(ic_numbers[0])
+    assert not table.delete(ic_numbers[0])
+    assert table.get_total_collisions() == expected_collisions(table)
+
+
+def test_insert_many_matches_one_by_one_inserts():
+    ic_numbers = generate_unique_ic_numbers(500, seed=5)
+    one_by_one = StripedHashTable(97, stripes=8)
+    for ic in ic_numbers:
+        one_by_one.insert(ic)
+    batched = StripedHashTable(97, stripes=8)
+    _, collisions = batched.insert_many(ic_numbers + ["bad"])
+    assert collisions == one_by_one.get_total_collisions() == batched.get_total_collisions()
+    assert [sorted(chain) for chain in batched.table] == [sorted(chain) for chain in one_by_one.table]
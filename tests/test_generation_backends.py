@@ -0,0 +1,37 @@
+import pytest
+
+from random_number_performance import NumpyBackend, SequentialBackend, available_backends, compare_backends, np
+
+
+def test_every_backend_generates_the_requested_sets():
+    backends = available_backends()
+    try:
+        assert backends[0].name == SequentialBackend.name
+        assert len({backend.name for backend in backends}) == len(backends)
+        for backend in backends:
+            sets = backend.generate(4, 250, -3, 3)
+            assert len(sets) == 4, backend.name
+            for numbers in sets:
+                values = [int(value) for value in numbers]
+                assert len(values) == 250
+                assert min(values) >= -3 and max(values) <= 3
+                assert set(values) == set(range(-3, 4))  # both bounds are reachable
+    finally:
+        for backend in backends:
+            backend.close()
+
+
+@pytest.mark.skipif(np is None, reason="NumPy is not installed")
+def test_seeded_numpy_backend_is_reproducible():
+    first = NumpyBackend(seed=7).generate(3, 100, 0, 10)
+    second = NumpyBackend(seed=7).generate(3, 100, 0, 10)
+    assert (first == second).all()
+
+
+def test_comparison_reports_speedups_against_sequential():
+    rows = compare_backends([(2, 20)])
+    assert [(row["num_sets"], row["numbers_per_set"]) for row in rows] == [(2, 20)]
+    speedup = rows[0]["speedup"]
+    assert speedup[SequentialBackend.name] == 1.0
+    assert {"sequential", "threads", "processes"} <= set(speedup)
+    assert all(value > 0 for value in speedup.values())
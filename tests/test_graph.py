@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from graph import Graph
+
+
+def random_graph(user_count=60, edge_count=400, seed=0):
+    rng = random.Random(seed)
+    graph = Graph()
+    names = [f"user{i}" for i in range(user_count)]
+    for name in names:
+        graph.addVertex(name)
+    for _ in range(edge_count):
+        graph.addEdge(*rng.sample(names, 2))
+    for _ in range(edge_count // 4):
+        graph.removeEdge(*rng.sample(names, 2))
+    return graph, names
+
+
+def test_follower_index_mirrors_the_following_sets(capsys):
+    graph, names = random_graph()
+    for name in names:
+        followers = {other for other in names if name in graph.listOutgoingAdjacentVertex(other)}
+        assert set(graph.listIncomingAdjacentVertex(name)) == followers
+        assert graph.in_degree(name) == len(followers)
+        assert graph.out_degree(name) == len(graph.listOutgoingAdjacentVertex(name))
+
+
+def test_getters_return_live_read_only_views(capsys):
+    graph = Graph()
+    for name in ("a", "b", "c"):
+        graph.addVertex(name)
+    graph.addEdge("a", "b")
+    following = graph.listOutgoingAdjacentVertex("a")
+    followers = graph.listIncomingAdjacentVertex("b")
+    assert following == {"b"} and followers == {"a"}
+    assert not hasattr(following, "add") and not hasattr(followers, "discard")
+
+    graph.addEdge("a", "c")
+    graph.removeEdge("a", "b")
+    assert following == {"c"} and len(following) == 1 and "b" not in following
+    assert followers == set()
+    assert following | {"x"} == {"c", "x"}
+
+
+def test_unknown_vertices(capsys):
+    graph = Graph()
+    assert graph.listOutgoingAdjacentVertex("ghost") == set()
+    assert graph.listIncomingAdjacentVertex("ghost") == set()
+    assert graph.in_degree("ghost") == graph.out_degree("ghost") == 0
+    assert "not found" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("edge", [("a", "ghost"), ("ghost", "a")])
+def test_edges_to_unknown_vertices_are_rejected(edge, capsys):
+    graph = Graph()
+    graph.addVertex("a")
+    graph.addEdge(*edge)
+    assert graph.listOutgoingAdjacentVertex("a") == set()
+    assert graph.listIncomingAdjacentVertex("a") == set()
@@ -0,0 +1,53 @@
+import pytest
+
+from graph import CompactGraph, Graph
+from graph_benchmark import benchmark_graph_size
+from graph_generator import generate_follow_edges, generate_people, generate_social_graph
+
+
+def test_people_are_unique_and_seeded():
+    people = list(generate_people(3000, seed=5))
+    assert len({person.name for person in people}) == 3000
+    again = list(generate_people(3000, seed=5))
+    assert [(p.name, p.gender, p.biography, p.is_private) for p in people] == \
+           [(p.name, p.gender, p.biography, p.is_private) for p in again]
+    private_share = sum(person.is_private for person in people) / len(people)
+    assert 0.15 < private_share < 0.25
+
+
+@pytest.mark.parametrize("chunk_size", [7, 100000])
+def test_follow_edges_are_distinct_and_point_to_earlier_users(chunk_size):
+    chunks = list(generate_follow_edges(500, follows_per_user=6, reciprocity=0.0, seed=1, chunk_size=chunk_size))
+    edges = [edge for chunk in chunks for edge in chunk]
+    assert all(len(chunk) < chunk_size + 2 * 6 for chunk in chunks)
+    assert len(set(edges)) == len(edges) == sum(min(6, user) for user in range(500))
+    assert all(followed < follower for follower, followed in edges)
+
+
+def test_follower_counts_are_skewed():
+    in_degrees = {}
+    for chunk in generate_follow_edges(5000, follows_per_user=5, seed=2):
+        for _, followed in chunk:
+            in_degrees[followed] = in_degrees.get(followed, 0) + 1
+    counts = sorted(in_degrees.values(), reverse=True)
+    average = sum(counts) / 5000
+    assert counts[0] > 20 * average
+
+
+def test_same_seed_builds_the_same_graph_in_both_implementations(capsys):
+    graph, profiles, names = generate_social_graph(800, Graph(), follows_per_user=5, seed=3, chunk_size=300)
+    compact, _, compact_names = generate_social_graph(800, CompactGraph(), follows_per_user=5, seed=3,
+                                                      chunk_size=300)
+    assert capsys.readouterr().out == ""
+    assert names == compact_names == graph.get_all_vertices() == list(profiles)
+    for name in names:
+        assert set(graph.listOutgoingAdjacentVertex(name)) == set(compact.listOutgoingAdjacentVertex(name))
+        assert graph.in_degree(name) == compact.in_degree(name)
+
+
+@pytest.mark.parametrize("graph_class", [Graph, CompactGraph])
+def test_benchmark_runs_every_operation(graph_class):
+    row = benchmark_graph_size(300, graph_class, 40, 4, 0, False)
+    assert (row["users"], row["graph"], row["peak_memory_bytes"]) == (300, graph_class.__name__, None)
+    assert row["edges"] > 0
+    assert {"addVertex", "addEdge", "removeEdge", "following", "followers"} <= set(row["operations"])
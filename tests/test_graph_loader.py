@@ -0,0 +1,78 @@
+import pytest
+
+from graph import CompactGraph, Graph
+from graph_loader import describe_load, iter_row_chunks, load_edges, load_people
+
+
+def write_lines(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def people_file(tmp_path):
+    return write_lines(tmp_path / "people.csv", [
+        "name,gender,biography,is_private",
+        "Alice,F,likes graphs,no",
+        "# a comment",
+        "",
+        "Bob,M,\"hashing, mostly\",yes",
+        "Carol,F,chess",
+        "Alice,F,duplicate row",
+        "Broken,M",
+        "Dave,M,music,private",
+    ])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_load_people_fills_profiles_and_vertices(people_file, chunk_size, capsys):
+    profiles = {}
+    graph = Graph()
+    summary = load_people(people_file, profiles, graph, chunk_size=chunk_size, has_header=True)
+    assert list(profiles) == ["Alice", "Bob", "Carol", "Dave"]
+    assert graph.get_all_vertices() == list(profiles)
+    assert profiles["Bob"].biography == "hashing, mostly"
+    assert [profiles[name].is_private for name in profiles] == [False, True, False, True]
+    assert (summary["rows"], summary["added"], summary["duplicates"], summary["malformed"]) == (6, 4, 1, 1)
+    assert summary["errors"] == ["Error: A user with the name 'Alice' already exists."]
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("graph_class", [Graph, CompactGraph])
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_load_edges_matches_single_edge_inserts(tmp_path, graph_class, chunk_size, capsys):
+    rows = ["Alice\tBob", "Bob\tAlice", "Alice\tCarol", "Alice\tBob", "Carol\tGhost", "lonely", " Carol \t Alice "]
+    path = write_lines(tmp_path / "edges.tsv", rows)
+    graph, expected = graph_class(), graph_class()
+    for name in ("Alice", "Bob", "Carol"):
+        graph.addVertex(name)
+        expected.addVertex(name)
+    for row in rows:
+        if "\t" in row:
+            expected.addEdge(*(part.strip() for part in row.split("\t")))
+    capsys.readouterr()
+
+    summary = load_edges(graph, path, chunk_size=chunk_size)
+    assert capsys.readouterr().out == ""
+    assert (summary["rows"], summary["added"], summary["duplicates"], summary["missing"],
+            summary["malformed"]) == (7, 4, 1, 1, 1)
+    assert len(summary["errors"]) == 2
+    for name in ("Alice", "Bob", "Carol"):
+        assert set(graph.listOutgoingAdjacentVertex(name)) == set(expected.listOutgoingAdjacentVertex(name))
+        assert set(graph.listIncomingAdjacentVertex(name)) == set(expected.listIncomingAdjacentVertex(name))
+
+
+def test_row_chunks_are_bounded_and_delimiter_follows_extension(tmp_path):
+    path = write_lines(tmp_path / "edges.csv", [f"user{i},user{i + 1}" for i in range(10)])
+    chunks = list(iter_row_chunks(path, chunk_size=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert chunks[0][0] == ["user0", "user1"]
+    tsv_path = write_lines(tmp_path / "edges.tab", ["a\tb,c"])
+    assert list(iter_row_chunks(tsv_path)) == [[["a", "b,c"]]]
+
+
+def test_describe_load_reports_skips(people_file):
+    summary = load_people(people_file, {}, has_header=True)
+    line = describe_load("people", summary)
+    assert line.startswith("Loaded 4 people from 6 rows")
+    assert line.endswith("2 skipped).")
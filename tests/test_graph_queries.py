@@ -0,0 +1,89 @@
+import random
+from collections import deque
+
+import pytest
+
+from graph import CompactGraph, Graph
+from graph_queries import LRUCache, SocialGraphQueries
+
+
+def brute_force_recommendations(graph, vertex, k):
+    following = set(graph.listOutgoingAdjacentVertex(vertex))
+    counts = {}
+    for followee in following:
+        for candidate in graph.listOutgoingAdjacentVertex(followee):
+            if candidate != vertex and candidate not in following:
+                counts[candidate] = counts.get(candidate, 0) + 1
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+
+def brute_force_distance(graph, source, target):
+    distances = {source: 0}
+    queue = deque([source])
+    while queue:
+        vertex = queue.popleft()
+        for neighbour in graph.listOutgoingAdjacentVertex(vertex):
+            if neighbour not in distances:
+                distances[neighbour] = distances[vertex] + 1
+                queue.append(neighbour)
+    return distances.get(target)
+
+
+def assert_valid_path(graph, path, source, target):
+    assert path[0] == source and path[-1] == target
+    assert all(b in graph.listOutgoingAdjacentVertex(a) for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("graph_class", [Graph, CompactGraph])
+def test_cached_answers_follow_edge_edits(graph_class, capsys):
+    rng = random.Random(7)
+    graph = graph_class()
+    names = [f"user{i}" for i in range(40)]
+    graph.add_vertices(names)
+    graph.add_edges([tuple(rng.sample(names, 2)) for _ in range(90)])
+    queries = SocialGraphQueries(graph, cache_size=16)
+
+    for _ in range(30):
+        for vertex in rng.sample(names, 8):
+            k = rng.choice([1, 3, 5])
+            assert queries.recommend(vertex, k) == brute_force_recommendations(graph, vertex, k)
+        for _ in range(8):
+            source, target = rng.sample(names, 2)
+            path = queries.shortest_follow_path(source, target)
+            distance = brute_force_distance(graph, source, target)
+            if distance is None:
+                assert path is None
+            else:
+                assert_valid_path(graph, path, source, target)
+                assert len(path) - 1 == distance == queries.degrees_of_separation(source, target)
+        edge = tuple(rng.sample(names, 2))
+        if rng.random() < 0.5:
+            graph.add_edges([edge])
+        else:
+            graph.remove_edges([edge])
+
+    stats = queries.cache_stats()
+    assert stats["recommendations"]["hits"] > 0 and stats["paths"]["hits"] > 0
+
+
+def test_unknown_vertices_and_trivial_paths(capsys):
+    graph = Graph()
+    graph.add_vertices(["a", "b"])
+    queries = SocialGraphQueries(graph)
+    assert queries.recommend("ghost") == []
+    assert queries.shortest_follow_path("a", "ghost") is None
+    assert queries.shortest_follow_path("a", "a") == ["a"]
+    assert queries.shortest_follow_path("a", "b") is None
+    graph.addEdge("a", "b")
+    assert queries.shortest_follow_path("a", "b") == ["a", "b"]
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    assert cache.put("c", 3) == "b"
+    assert "b" not in cache and cache.get("b") is None
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1, 1)
@@ -0,0 +1,88 @@
+import math
+import random
+
+import pytest
+
+from graph import CompactGraph, Graph
+from graph_ranking import InDegreeLeaderboard, PageRank
+
+
+def random_graph(graph_class, user_count=60, edge_count=300, seed=0):
+    rng = random.Random(seed)
+    graph = graph_class()
+    names = [f"user{i:02d}" for i in range(user_count)]
+    graph.add_vertices(names)
+    graph.add_edges([tuple(rng.sample(names, 2)) for _ in range(edge_count)])
+    return graph, names, rng
+
+
+def brute_force_top_k(graph, k):
+    degrees = [(name, graph.in_degree(name)) for name in graph.get_all_vertices()]
+    return sorted(degrees, key=lambda item: (-item[1], item[0]))[:k]
+
+
+@pytest.mark.parametrize("graph_class", [Graph, CompactGraph])
+def test_leaderboard_follows_edge_edits(graph_class, capsys):
+    graph, names, rng = random_graph(graph_class)
+    leaderboard = InDegreeLeaderboard(graph)
+    for _ in range(200):
+        edge = tuple(rng.sample(names, 2))
+        if rng.random() < 0.5:
+            graph.addEdge(*edge)
+        else:
+            graph.removeEdge(*edge)
+        k = rng.choice([1, 5, 20, 100])
+        assert leaderboard.top_k(k) == brute_force_top_k(graph, k)
+    assert all(leaderboard.in_degree(name) == graph.in_degree(name) for name in names)
+    assert leaderboard.top_k(0) == []
+
+
+def test_leaderboard_pads_with_unfollowed_users(capsys):
+    graph = Graph()
+    graph.add_vertices(["c", "b", "a"])
+    graph.addEdge("c", "b")
+    assert InDegreeLeaderboard(graph).top_k(3) == [("b", 1), ("a", 0), ("c", 0)]
+
+
+def reference_pagerank(graph, damping=0.85, iterations=500):
+    names = graph.get_all_vertices()
+    count = len(names)
+    scores = dict.fromkeys(names, 1.0 / count)
+    for _ in range(iterations):
+        dangling = sum(scores[name] for name in names if not graph.out_degree(name)) / count
+        updated = dict.fromkeys(names, (1.0 - damping) / count + damping * dangling)
+        for name in names:
+            following = graph.listOutgoingAdjacentVertex(name)
+            for followed in following:
+                updated[followed] += damping * scores[name] / len(following)
+        scores = updated
+    return scores
+
+
+@pytest.mark.parametrize("graph_class", [Graph, CompactGraph])
+def test_pagerank_matches_a_reference_and_warm_starts(graph_class, capsys):
+    graph, names, rng = random_graph(graph_class, edge_count=150, seed=3)
+    graph.addVertex("lurker")  # follows no one: its score is spread over everyone
+    ranking = PageRank(graph, tolerance=1e-12)
+    ranking.invalidate()
+    scores = ranking.compute()
+    assert math.isclose(sum(scores.values()), 1.0)
+    expected = reference_pagerank(graph)
+    assert all(math.isclose(scores[name], expected[name], rel_tol=1e-6) for name in expected)
+    assert ranking.compute() is scores  # unchanged graph: nothing recomputed
+
+    graph.addEdge("lurker", names[0])
+    cold_ranking = PageRank(graph, tolerance=1e-12)
+    cold_scores = cold_ranking.compute()
+    warm_scores = ranking.compute()
+    assert ranking.iterations < cold_ranking.iterations
+    assert all(math.isclose(warm_scores[name], cold_scores[name], rel_tol=1e-6) for name in cold_scores)
+    assert [name for name, _ in ranking.top_k(3)] == [name for name, _ in cold_ranking.top_k(3)]
+
+
+def test_pagerank_of_a_cycle_is_uniform(capsys):
+    graph = Graph()
+    graph.add_vertices(["a", "b", "c"])
+    graph.add_edges([("a", "b"), ("b", "c"), ("c", "a")])
+    scores = PageRank(graph).compute()
+    assert all(math.isclose(score, 1 / 3) for score in scores.values())
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from hash_index import MappedHashIndex
+from Hashing import HashTable, OpenAddressingHashTable, unpack_ic
+
+
+def random_ics(count, seed=0):
+    rng = random.Random(seed)
+    return [unpack_ic(key) for key in rng.sample(range(10**11, 10**12), count)]
+
+
+def test_index_survives_close_and_reopen(tmp_path):
+    path = str(tmp_path / "ics.idx")
+    ics = random_ics(600)
+    with MappedHashIndex.create(path, 100) as index:  # small on purpose: forces resizes
+        for ic in ics:
+            assert index.insert(ic)
+        for ic in ics[:100]:
+            assert index.delete(ic)
+        stats = index.get_probe_stats()
+        keys = list(index.keys)
+    assert stats["resizes"] > 0
+
+    with MappedHashIndex(path) as reopened:
+        assert reopened.get_probe_stats() == stats
+        assert list(reopened.keys) == keys
+        assert all(reopened.contains(ic) for ic in ics[100:])
+        assert not any(reopened.contains(ic) for ic in ics[:100])
+
+
+def test_read_only_index_rejects_writes(tmp_path):
+    path = str(tmp_path / "ics.idx")
+    ics = random_ics(20, seed=1)
+    with MappedHashIndex.create(path, 64) as index:
+        for ic in ics[:10]:
+            index.insert(ic)
+    with MappedHashIndex(path) as reader:
+        for write in (lambda: reader.insert(ics[10]), lambda: reader.delete(ics[0]),
+                      lambda: reader.insert_many(ics[10:]), reader.compact):
+            with pytest.raises(ValueError):
+                write()
+        assert len(reader) == 10
+
+
+def test_from_table_dumps_open_addressing_slot_for_slot(tmp_path):
+    table = OpenAddressingHashTable(97, hash_strategy="fnv1a")
+    for ic in random_ics(50, seed=2):
+        table.insert(ic)
+    path = str(tmp_path / "ics.idx")
+    MappedHashIndex.from_table(table, path).close()
+    with MappedHashIndex(path) as index:
+        assert index.hash_strategy is table.hash_strategy
+        assert list(index.keys) == list(table.keys)
+        assert index.get_probe_stats() == table.get_probe_stats()
+
+
+def test_from_chained_table_and_compact(tmp_path):
+    ics = random_ics(300, seed=3)
+    chained = HashTable(101)
+    for ic in ics:
+        chained.insert(ic)
+    path = str(tmp_path / "ics.idx")
+    with MappedHashIndex.from_table(chained, path) as index:
+        assert len(index) == 300
+        for ic in ics[:250]:
+            index.delete(ic)
+        size_before = index.size
+        index.compact()
+        assert index.size < size_before
+        assert all(index.contains(ic) for ic in ics[250:])
+    with MappedHashIndex(path) as reopened:
+        assert len(reopened) == 50
+        assert all(reopened.contains(ic) for ic in ics[250:])
+
+
+def test_rejects_files_that_are_not_indexes(tmp_path):
+    path = tmp_path / "not-an-index"
+    path.write_bytes(b"hello" * 20)
+    with pytest.raises(ValueError):
+        MappedHashIndex(str(path))
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from Hashing import (EMPTY_SLOT, HASH_STRATEGIES, HashStrategy, HashTable, OpenAddressingHashTable,
+                     chain_length_stats, get_hash_strategy, np, pack_ic, unpack_ic)
+
+
+class ClusteringHash(HashStrategy):
+    # Sends keys to a handful of home slots, so probe sequences are long, overlap and
+    # wrap around the end of the table.
+    name = "clustering"
+    strategy_id = 99
+
+    def hash_key(self, key):
+        return key % 5 * 20 + 90
+
+    def hash_keys(self, keys):
+        return keys % 5 * 20 + 90
+
+
+def random_ics(count, seed=0):
+    rng = random.Random(seed)
+    return [unpack_ic(key) for key in rng.sample(range(10**11, 10**12), count)]
+
+
+@pytest.mark.parametrize("name", list(HASH_STRATEGIES))
+def test_every_strategy_buckets_into_range_and_keeps_lookups_working(name):
+    ics = random_ics(500)
+    table = HashTable(211, hash_strategy=name)
+    for ic in ics:
+        table.insert(ic)
+    assert all(0 <= table._hash(ic) < 211 for ic in ics)
+    assert sum(len(chain) for chain in table.table) == 500
+    assert all(table.contains(ic) for ic in ics)
+    assert table.get_total_collisions() == 500 - sum(1 for chain in table.table if chain)
+
+
+@pytest.mark.skipif(np is None, reason="vectorized hashing needs NumPy")
+@pytest.mark.parametrize("name", list(HASH_STRATEGIES))
+def test_vectorized_hashes_match_scalar_hashes(name):
+    strategy = HASH_STRATEGIES[name]
+    keys = [pack_ic(ic) for ic in random_ics(300, seed=1)]
+    assert strategy.buckets(np.array(keys, dtype=np.int64), 1009).tolist() == [strategy.bucket(key, 1009) for key in keys]
+
+
+def test_get_hash_strategy_accepts_names_ids_and_instances():
+    for name, strategy in HASH_STRATEGIES.items():
+        assert get_hash_strategy(name) is strategy
+        assert get_hash_strategy(strategy.strategy_id) is strategy
+    custom = ClusteringHash()
+    assert get_hash_strategy(custom) is custom
+    assert len({strategy.strategy_id for strategy in HASH_STRATEGIES.values()}) == len(HASH_STRATEGIES)
+    with pytest.raises(ValueError):
+        get_hash_strategy("no-such-hash")
+
+
+def test_chain_length_stats():
+    stats = chain_length_stats([0, 2, 2, 0])
+    assert stats["max_chain_length"] == 2
+    assert stats["mean_chain_length"] == 2.0
+    assert stats["empty_bucket_ratio"] == 0.5
+    assert stats["chi_square"] == 4.0
+    assert chain_length_stats([1, 1, 1, 1])["chi_square"] == 0.0
+
+
+def test_open_addressing_deletes_stay_exact_under_heavy_clustering():
+    # Five home slots for 60 keys: every probe sequence overlaps the others and wraps.
+    table = OpenAddressingHashTable(101, max_load_factor=0.9, hash_strategy=ClusteringHash())
+    ics = random_ics(60, seed=2)
+    for ic in ics:
+        table.insert(ic)
+    rng = random.Random(3)
+    present = set(ics)
+    for ic in rng.sample(ics, 45):
+        assert table.delete(ic)
+        present.discard(ic)
+        lengths = [(slot - table._hash(key)) % table.size for slot, key in enumerate(table.keys) if key != EMPTY_SLOT]
+        stats = table.get_probe_stats()
+        assert stats["collisions"] == sum(1 for length in lengths if length)
+        assert stats["max_probe_length"] == max(lengths, default=0)
+        assert table.total_probes == sum(lengths)
+        assert all(table.contains(other) for other in present)
+        assert not table.contains(ic)
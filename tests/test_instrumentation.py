@@ -0,0 +1,101 @@
+import re
+
+import pytest
+
+import instrumentation
+from graph import CompactGraph, Graph
+from Hashing import HashTable, OpenAddressingHashTable, generate_unique_ic_numbers
+
+SAMPLE = re.compile(r'([a-zA-Z_:][a-zA-Z0-9_:]*)(\{le="([^"]+)"\})? (\S+)')
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.metrics.reset()
+    instrumentation.enable()
+    try:
+        yield instrumentation.metrics
+    finally:
+        instrumentation.disable()
+        instrumentation.metrics.reset()
+
+
+def hot_path_functions():
+    return {(cls, name): cls.__dict__[name]
+            for cls, name in [(HashTable, "insert"), (HashTable, "_hash"), (OpenAddressingHashTable, "insert_many"),
+                              (Graph, "addEdge"), (Graph, "listIncomingAdjacentVertex"), (CompactGraph, "add_edges")]}
+
+
+def test_enable_wraps_and_disable_restores_the_original_methods():
+    originals = hot_path_functions()
+    instrumentation.enable()
+    try:
+        instrumentation.enable()  # a second call must not wrap the wrappers
+        assert instrumentation.is_enabled()
+        for (cls, name), function in originals.items():
+            wrapper = cls.__dict__[name]
+            assert wrapper is not function and wrapper.__instrumented__
+            assert wrapper.__wrapped__ is function
+    finally:
+        instrumentation.disable()
+    assert not instrumentation.is_enabled()
+    assert hot_path_functions() == originals
+
+
+def test_calls_are_timed_only_while_enabled(enabled):
+    graph = Graph()
+    instrumentation.disable()
+    graph.add_vertices(["a", "b"])
+    bound_before = graph.listIncomingAdjacentVertex
+    instrumentation.enable()
+    graph.addEdge("a", "b")
+    graph.listIncomingAdjacentVertex("b")
+    bound_before("b")  # bound before enable(): calls the original, so it is not timed
+    histograms = enabled._copy()[1]
+    assert "graph_add_vertices" not in histograms
+    assert histograms["graph_add_edge"].count == 1
+    assert histograms["graph_followers"].count == 1
+
+
+@pytest.mark.parametrize("table_class", [HashTable, OpenAddressingHashTable])
+def test_bulk_insert_collisions_are_counted_once(enabled, table_class):
+    table = table_class(53)
+    _, collisions = table.insert_many(generate_unique_ic_numbers(200, seed=7))
+    counters = enabled._copy()[0]
+    prefix = "hashtable" if table_class is HashTable else "open_addressing"
+    assert counters[f"{prefix}_insert_many_collisions_total"] == collisions > 0
+    assert f"{prefix}_insert_collisions_total" not in counters
+
+
+def test_prometheus_output_parses(enabled):
+    table = HashTable(11)
+    for ic in generate_unique_ic_numbers(40, seed=8):
+        table.insert(ic)
+    text = enabled.to_prometheus()
+    assert text.endswith("\n")
+
+    types = {}
+    samples = []
+    for line in text.splitlines():
+        if line.startswith("#"):
+            _, keyword, name, metric_type = line.split(" ")
+            assert keyword == "TYPE" and metric_type in ("counter", "gauge", "histogram")
+            types[name] = metric_type
+        else:
+            match = SAMPLE.fullmatch(line)
+            assert match, line
+            name, _, bound, value = match.groups()
+            samples.append((name, bound, float(value)))
+
+    assert types["social_hashtable_insert_collisions_total"] == "counter"
+    assert types["social_hashtable_insert_seconds"] == "histogram"
+    for name, _, _ in samples:
+        family = re.sub(r"_(bucket|sum|count)$", "", name)
+        assert name in types or types.get(family) == "histogram", name
+
+    buckets = [(bound, value) for name, bound, value in samples if name == "social_hashtable_insert_seconds_bucket"]
+    assert buckets[-1][0] == "+Inf" and [float(bound) for bound, _ in buckets[:-1]]
+    counts = [value for _, value in buckets]
+    assert counts == sorted(counts)
+    total = [value for name, _, value in samples if name == "social_hashtable_insert_seconds_count"]
+    assert total == [counts[-1]] == [40]
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from Hashing import EMPTY_SLOT, OpenAddressingHashTable, unpack_ic
+
+
+def random_ics(count, seed=0):
+    rng = random.Random(seed)
+    keys = rng.sample(range(10**11, 10**12), count)
+    return [unpack_ic(key) for key in keys]
+
+
+def layout_stats(table):
+    # Probe statistics recomputed from scratch from the slots' contents.
+    lengths = [(slot - table._hash(key)) % table.size for slot, key in enumerate(table.keys) if key != EMPTY_SLOT]
+    return {
+        "entries": len(lengths),
+        "collisions": sum(1 for length in lengths if length > 0),
+        "total_probes": sum(lengths),
+        "max_probe_length": max(lengths, default=0),
+    }
+
+
+def assert_stats_exact(table):
+    stats = table.get_probe_stats()
+    expected = layout_stats(table)
+    assert stats["entries"] == expected["entries"] == len(table)
+    assert stats["collisions"] == expected["collisions"]
+    assert table.total_probes == expected["total_probes"]
+    assert stats["max_probe_length"] == expected["max_probe_length"]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_delete_keeps_lookups_and_probe_stats_exact(seed):
+    table = OpenAddressingHashTable(101, max_load_factor=0.9)  # ~84% full: long, wrapping probes
+    ics = random_ics(85, seed)
+    for ic in ics:
+        assert table.insert(ic)
+    assert table.resizes == 0
+    assert_stats_exact(table)
+
+    rng = random.Random(seed)
+    present = set(ics)
+    for ic in rng.sample(ics, 60):
+        assert table.delete(ic)
+        present.discard(ic)
+        assert_stats_exact(table)
+        assert all(table.contains(other) for other in present)
+        assert not table.contains(ic)
+        assert not table.delete(ic)
+
+
+def test_delete_of_missing_or_invalid_ic_changes_nothing():
+    table = OpenAddressingHashTable(31)
+    ics = random_ics(15)
+    for ic in ics:
+        table.insert(ic)
+    before = (list(table.keys), table.get_probe_stats())
+    assert not table.delete(random_ics(1, seed=50)[0])
+    assert not table.delete("not-an-ic")
+    assert (list(table.keys), table.get_probe_stats()) == before
+
+
+def test_reinserting_after_deletes_keeps_stats_exact():
+    table = OpenAddressingHashTable(53, max_load_factor=0.9)
+    ics = random_ics(45)
+    for ic in ics:
+        table.insert(ic)
+    for ic in ics[::2]:
+        table.delete(ic)
+    for ic in ics[::2]:
+        assert table.insert(ic)
+    assert_stats_exact(table)
+    assert all(table.contains(ic) for ic in ics)
+
+
+def test_resize_rebuilds_stats_for_the_new_layout():
+    table = OpenAddressingHashTable(11, max_load_factor=0.7)
+    ics = random_ics(200)
+    for ic in ics:
+        table.insert(ic)
+    assert table.resizes > 0
+    assert table.load_factor() <= 0.7
+    assert_stats_exact(table)
+    assert all(table.contains(ic) for ic in ics)
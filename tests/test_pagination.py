@@ -0,0 +1,116 @@
+import base64
+import json
+
+import pytest
+
+from graph import CompactGraph, Graph
+from pagination import check_limit, decode_cursor, encode_cursor, iter_pages
+from person import Person
+from profile_store import ProfileStore, profiles_page
+
+
+def forge(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+
+@pytest.mark.parametrize("kind, key", [("name", "Alice"), ("name", ""), ("id", 0), ("row", 41),
+                                       ("position", 1000)])
+def test_cursor_round_trips(kind, key):
+    assert decode_cursor(encode_cursor(kind, key), kind) == key
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    "",
+    forge({"kind": "name"}),
+    forge(["name"]),
+    forge(["name", "Alice", "extra"]),
+    forge(["row", -1]),
+    forge(["row", "3"]),
+    forge(["row", 2.5]),
+    forge(["row", True]),
+    forge(["name", 7]),
+    42,
+    None,
+])
+def test_forged_or_malformed_cursors_are_rejected(cursor):
+    for kind in ("name", "id", "row"):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, kind)
+
+
+def test_cursor_from_another_listing_is_rejected():
+    with pytest.raises(ValueError, match="does not belong"):
+        decode_cursor(encode_cursor("id", 3), "row")
+
+
+@pytest.mark.parametrize("limit", [0, -5, 2.0, "10", None])
+def test_non_positive_or_non_integer_limits_are_rejected(limit):
+    with pytest.raises(ValueError):
+        check_limit(limit)
+
+
+def build_star(graph_class, follower_count):
+    graph = graph_class()
+    names = [f"user{i:04d}" for i in range(follower_count)]
+    graph.add_vertices(names + ["star"])
+    graph.add_edges([(name, "star") for name in names] + [("star", name) for name in names])
+    return graph, names
+
+
+@pytest.mark.parametrize("graph_class", [Graph, CompactGraph])
+@pytest.mark.parametrize("follower_count", [7, 300])  # 300 uses Graph's cached sorted copy
+def test_pages_cover_every_neighbour_once(graph_class, follower_count):
+    graph, names = build_star(graph_class, follower_count)
+    for fetch in (graph.following_page, graph.followers_page):
+        pages = list(iter_pages(lambda cursor, limit: fetch("star", cursor, limit), page_size=32))
+        assert all(len(page) <= 32 for page in pages)
+        assert sorted(name for page in pages for name in page) == names
+
+
+@pytest.mark.parametrize("graph_class", [Graph, CompactGraph])
+def test_edits_between_pages_do_not_repeat_or_skip_stable_entries(graph_class):
+    graph, names = build_star(graph_class, 300)
+    seen = []
+    page, cursor = graph.followers_page("star", None, 50)
+    seen += page
+    removed = names[10]
+    graph.remove_edges([(removed, "star"), (names[200], "star")])
+    graph.add_edges([(names[200], "star")])
+    while cursor is not None:
+        page, cursor = graph.followers_page("star", cursor, 50)
+        seen += page
+    assert len(seen) == len(set(seen))
+    assert set(names) - {removed} <= set(seen)
+
+
+def test_graph_page_rejects_forged_cursor():
+    graph, _ = build_star(Graph, 5)
+    with pytest.raises(ValueError):
+        graph.following_page("star", forge(["id", 1]), 10)
+    with pytest.raises(ValueError):
+        graph.following_page("star", None, 0)
+
+
+@pytest.mark.parametrize("make_profiles", [dict, ProfileStore])
+def test_profile_pages_cover_every_user_once(make_profiles):
+    people = [Person(f"user{i}", "F", "bio", i % 3 == 0) for i in range(23)]
+    profiles = make_profiles()
+    for person in people:
+        profiles[person.name] = person
+    pages = list(iter_pages(lambda cursor, limit: profiles_page(profiles, cursor, limit), page_size=5))
+    assert [name for page in pages for name in page] == [person.name for person in people]
+
+
+def test_profile_store_pages_skip_deleted_users_and_keep_their_place():
+    profiles = ProfileStore(Person(f"user{i}", "F", "bio", False) for i in range(10))
+    page, cursor = profiles.page(None, 4)
+    del profiles["user2"]
+    del profiles["user5"]
+    profiles["late"] = Person("late", "M", "bio", False)
+    remaining = []
+    while cursor is not None:
+        items, cursor = profiles.page(cursor, 4)
+        remaining += items
+    assert page == ["user0", "user1", "user2", "user3"]
+    assert remaining == ["user4", "user6", "user7", "user8", "user9", "late"]
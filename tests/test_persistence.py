@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from graph import CompactGraph, Graph
+from person import Person
+from persistence import OP_ADD_EDGE, SocialStore, encode_record
+
+
+def graph_state(graph, profiles):
+    names = graph.get_all_vertices()
+    edges = {(name, other) for name in names for other in graph.listOutgoingAdjacentVertex(name)}
+    people = {name: (person.gender, person.biography, person.is_private) for name, person in profiles.items()}
+    return set(names), edges, people
+
+
+def open_store(directory, graph_class):
+    graph, profiles = graph_class(), {}
+    store = SocialStore(str(directory), graph, profiles, batch_size=4, background=False)
+    store.load()
+    return store, graph, profiles
+
+
+def add_person(store, graph, profiles, name, private=False):
+    person = Person(name, "F", f"biography of {name}", private)
+    profiles[name] = person
+    store.log_person(person)
+    graph.addVertex(name)
+
+
+@pytest.mark.parametrize("graph_class", [Graph, CompactGraph])
+def test_snapshot_plus_log_survive_a_crash(tmp_path, graph_class, capsys):
+    store, graph, profiles = open_store(tmp_path, graph_class)
+    for i in range(6):
+        add_person(store, graph, profiles, f"user{i}", private=i % 2 == 1)
+    graph.add_edges([("user0", "user1"), ("user1", "user2"), ("user2", "user0")])
+    store.checkpoint()
+
+    # Mutations after the snapshot live only in the log.
+    add_person(store, graph, profiles, "late")
+    graph.addVertex("no profile")
+    graph.addEdge("late", "no profile")
+    graph.removeEdge("user1", "user2")
+    profiles["user3"].biography = "edited"
+    store.log_person(profiles["user3"])
+    store.flush()
+    expected = graph_state(graph, profiles)
+
+    # Crash: the process dies while appending a record, leaving a torn tail.
+    torn = encode_record(OP_ADD_EDGE, "user4", "user5")
+    store._log_file.write(torn[:len(torn) - 3])
+    store._log_file.close()
+
+    recovered, recovered_graph, recovered_profiles = open_store(tmp_path, graph_class)
+    assert graph_state(recovered_graph, recovered_profiles) == expected
+    assert "no profile" not in recovered_profiles
+    assert recovered.replayed_records > 0
+    assert os.path.getsize(recovered.log_path) == recovered.log_size()
+
+    # New records follow the last intact one, and a second restart sees them.
+    recovered_graph.addEdge("user4", "user5")
+    recovered.close()
+    _, graph_again, profiles_again = open_store(tmp_path, graph_class)
+    assert graph_state(graph_again, profiles_again) == (expected[0], expected[1] | {("user4", "user5")},
+                                                        expected[2])
+
+
+def test_checkpoint_folds_the_log_into_the_snapshot(tmp_path, capsys):
+    store, graph, profiles = open_store(tmp_path, Graph)
+    for i in range(3):
+        add_person(store, graph, profiles, f"user{i}")
+    graph.addEdge("user0", "user2")
+    store.checkpoint()
+    assert store.log_size() == os.path.getsize(store.log_path)
+    store.close()
+
+    reopened, graph_again, profiles_again = open_store(tmp_path, Graph)
+    assert reopened.replayed_records == 0
+    assert graph_state(graph_again, profiles_again) == graph_state(graph, profiles)
+
+
+def test_rejects_a_foreign_snapshot(tmp_path):
+    (tmp_path / "snapshot.bin").write_bytes(b"NOPE" + b"\0" * 60)
+    graph = Graph()
+    store = SocialStore(str(tmp_path), graph, {}, background=False)
+    with pytest.raises(ValueError):
+        store.load()
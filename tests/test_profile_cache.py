@@ -0,0 +1,86 @@
+import pytest
+
+from person import Person
+from profile_cache import RenderedProfileCache, render_profile_payload, render_profile_text
+from profile_store import ProfileStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_text_rendering_matches_display_profile(capsys):
+    for person in (Person("Ada", "F", "engines", False), Person("Alan", "M", "machines", True)):
+        for ignore_privacy in (True, False):
+            person.display_profile(ignore_privacy)
+            assert render_profile_text(person, ignore_privacy) == capsys.readouterr().out
+
+
+def test_privacy_modes_are_cached_separately():
+    profiles = {"Bob": Person("Bob", "M", "secret", True)}
+    cache = RenderedProfileCache(profiles, render_profile_payload)
+    assert "biography" not in cache.get("Bob", ignore_privacy=False)
+    assert cache.get("Bob", ignore_privacy=True)["biography"] == "secret"
+    cache.get("Bob", ignore_privacy=False)
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (2, 1, 2)
+
+
+def test_profile_store_edits_invalidate_both_renderings():
+    store = ProfileStore([Person("Ada", "F", "engines", False), Person("Alan", "M", "machines", False)])
+    cache = RenderedProfileCache(store, render_profile_payload)
+    for ignore_privacy in (True, False):
+        cache.get("Ada", ignore_privacy)
+        cache.get("Alan", ignore_privacy)
+
+    store["Ada"].biography = "notes on the analytical engine"
+    store["Alan"].is_private = True
+    assert cache.get("Ada")["biography"] == "notes on the analytical engine"
+    assert "biography" not in cache.get("Alan", ignore_privacy=False)
+    assert cache.stats()["invalidations"] == 4
+
+    del store["Ada"]
+    with pytest.raises(KeyError):
+        cache.get("Ada")
+    store["Ada"] = Person("Ada", "F", "back again", False)
+    assert cache.get("Ada")["biography"] == "back again"
+
+
+def test_plain_dicts_need_explicit_invalidation():
+    profiles = {"Ada": Person("Ada", "F", "engines", False)}
+    cache = RenderedProfileCache(profiles, render_profile_payload)
+    cache.get("Ada")
+    profiles["Ada"].biography = "edited"
+    assert cache.get("Ada")["biography"] == "engines"
+    cache.invalidate("Ada")
+    assert cache.get("Ada")["biography"] == "edited"
+    cache.invalidate()
+    assert cache.stats()["entries"] == 0
+
+
+def test_entries_expire_after_the_ttl():
+    clock = FakeClock()
+    profiles = {"Ada": Person("Ada", "F", "engines", False)}
+    cache = RenderedProfileCache(profiles, render_profile_payload, ttl=10, clock=clock)
+    cache.get("Ada")
+    profiles["Ada"].biography = "edited"
+    clock.now = 9.9
+    assert cache.get("Ada")["biography"] == "engines"
+    clock.now = 10.0
+    assert cache.get("Ada")["biography"] == "edited"
+    assert cache.stats()["expirations"] == 1
+
+
+def test_small_cache_evicts_least_recently_used():
+    profiles = {name: Person(name, "F", "bio", False) for name in ("a", "b", "c")}
+    cache = RenderedProfileCache(profiles, render_profile_payload, max_entries=2)
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+    assert ("b", True) not in cache.entries and ("a", True) in cache.entries
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,123 @@
+import math
+import random
+
+import pytest
+
+from person import Person
+from profile_search import BiographyIndex, NameIndex, ProfileSearch, tokenize
+from profile_store import ProfileStore
+
+WORDS = ("python graphs hashing music chess running cooking travel data science "
+         "photography poetry robots astronomy gardening").split()
+FIRST_NAMES = ["Ada", "Alan", "Grace", "Linus", "Margaret", "Edsger", "Barbara", "Donald"]
+LAST_NAMES = ["Lovelace", "Turing", "Hopper", "Torvalds", "Hamilton", "Dijkstra", "Liskov", "Knuth"]
+
+
+def random_people(count, rng):
+    people = []
+    for i in range(count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}"
+        biography = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 8)))
+        people.append(Person(name, rng.choice("MF"), biography, rng.random() < 0.3))
+    return people
+
+
+QUERIES = ["a", "Ad", "grace h", "turing", "knuth 1", "zzz", "  ada  lovelace "]
+BIOGRAPHY_QUERIES = ["python", "chess music", "data science robots", "the", "poetry gardening travel"]
+
+
+def search_results(search):
+    return ([search.search_names(query, 50) for query in QUERIES],
+            [[(name, round(score, 9)) for name, score in search.search_biographies(query, 15)]
+             for query in BIOGRAPHY_QUERIES])
+
+
+def assert_in_sync(store, search):
+    assert search_results(search) == search_results(ProfileSearch(store))
+
+
+@pytest.mark.parametrize("edit_count", [3, 150])  # a few queued edits, or enough to force a rebuild
+def test_index_follows_store_edits(edit_count):
+    rng = random.Random(edit_count)
+    store = ProfileStore(random_people(400, rng))
+    search = ProfileSearch(store)
+    assert_in_sync(store, search)
+
+    names = list(store)
+    extra = random_people(edit_count, random.Random(99))
+    for i in range(edit_count):
+        action = i % 3
+        if action == 0:
+            store[names[i]].biography = " ".join(rng.choice(WORDS) for _ in range(4))
+        elif action == 1:
+            del store[names[i]]
+        else:
+            person = extra[i]
+            store[f"New {person.name}"] = person
+    assert search.pending or search.stale
+    assert_in_sync(store, search)
+    assert not search.pending
+
+
+def test_deleted_and_renamed_users_leave_no_stale_entries():
+    store = ProfileStore([Person("Grace Hopper", "F", "compilers navy", False),
+                          Person("Grace Kelly", "F", "films monaco", False)])
+    search = ProfileSearch(store)
+    assert search.search_names("grace") == ["Grace Hopper", "Grace Kelly"]
+    del store["Grace Hopper"]
+    store["Grace Kelly"].biography = "compilers"
+    assert search.search_names("grace") == ["Grace Kelly"]
+    assert search.search_names("hop") == []
+    assert [name for name, _ in search.search_biographies("compilers")] == ["Grace Kelly"]
+    assert search.search_biographies("navy") == []
+
+
+def test_clear_then_reload_rebuilds():
+    store = ProfileStore(random_people(50, random.Random(1)))
+    search = ProfileSearch(store)
+    store.clear()
+    assert search.search_names("a") == []
+    for person in random_people(20, random.Random(2)):
+        store[person.name] = person
+    assert_in_sync(store, search)
+
+
+def test_plain_dict_needs_explicit_updates():
+    people = {person.name: person for person in random_people(30, random.Random(3))}
+    search = ProfileSearch(people)
+    newcomer = Person("Zora Neale", "F", "astronomy poetry", False)
+    people[newcomer.name] = newcomer
+    assert search.search_names("zora") == []
+    search.add(newcomer)
+    assert search.search_names("zora") == ["Zora Neale"]
+    del people[newcomer.name]
+    search.remove(newcomer.name)
+    assert search.search_names("neale") == []
+
+
+def test_name_index_add_and_remove_keep_entries_sorted_and_unique():
+    index = NameIndex(["Ada Lovelace", "Alan Turing"])
+    index.add("Ada Lovelace")
+    index.add("Ada King")
+    assert index.entries == sorted(set(index.entries))
+    assert index.search("ada") == ["Ada King", "Ada Lovelace"]
+    index.remove("Ada Lovelace")
+    assert index.search("lovelace") == []
+    assert index.search("a", limit=1) == ["Ada King"]
+
+
+def test_biography_scores_match_exhaustive_scoring():
+    people = {person.name: person for person in random_people(200, random.Random(4))}
+    index = BiographyIndex(people)
+    for query in BIOGRAPHY_QUERIES:
+        tokens = [token for token in dict.fromkeys(tokenize(query)) if token in index.names]
+        expected = []
+        for person in people.values():
+            token_weights = index.user_tokens[person.name]
+            score = sum(index.idf(token) * token_weights.get(token, 0.0) for token in tokens)
+            if score > 0:
+                expected.append(score)
+        expected.sort(reverse=True)
+        scores = [score for _, score in index.search(query, 10)]
+        assert all(math.isclose(a, b) for a, b in zip(scores, expected[:10]))
+        assert len(scores) == min(10, len(expected))
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from graph import Graph
+from graph_queries import SocialGraphQueries
+from sharded_graph import ShardedGraph, shard_of
+
+
+@pytest.fixture(scope="module")
+def graphs():
+    rng = random.Random(11)
+    names = [f"user{i}" for i in range(120)]
+    edges = [tuple(rng.sample(names, 2)) for _ in range(900)]
+    removed = rng.sample(edges, 150)
+    reference = Graph()
+    with ShardedGraph(shard_count=3) as sharded:
+        for graph in (reference, sharded):
+            graph.add_vertices(names)
+            graph.add_edges(edges + [("user0", "ghost"), ("ghost", "user0")])
+            graph.remove_edges(removed)
+        yield reference, sharded, names, rng
+
+
+def test_bulk_summaries_match_graph(graphs):
+    reference, sharded, names, rng = graphs
+    edges = [tuple(rng.sample(names, 2)) for _ in range(60)] + [("user1", "nobody"), ("nobody", "user1")]
+    expected, summary = reference.add_edges(edges), sharded.add_edges(edges)
+    assert [summary[key] for key in ("added", "duplicates", "missing")] == \
+           [expected[key] for key in ("added", "duplicates", "missing")]
+    assert sharded.add_vertices(["user3", "newcomer"]) == reference.add_vertices(["user3", "newcomer"])
+    removal = rng.sample(edges, 30)
+    assert sharded.remove_edges(removal)["removed"] == reference.remove_edges(removal)["removed"]
+
+
+def test_adjacency_matches_graph(graphs):
+    reference, sharded, names, _ = graphs
+    assert sorted(sharded.get_all_vertices()) == sorted(reference.get_all_vertices())
+    assert sharded.edge_count() == sum(reference.out_degree(name) for name in reference.get_all_vertices())
+    for name in names:
+        assert sharded.listOutgoingAdjacentVertex(name) == set(reference.listOutgoingAdjacentVertex(name))
+        assert sharded.listIncomingAdjacentVertex(name) == set(reference.listIncomingAdjacentVertex(name))
+        assert sharded.in_degree(name) == reference.in_degree(name)
+
+
+@pytest.mark.parametrize("k", [1, 3, 10])
+def test_recommendations_match_graph_queries(graphs, k):
+    reference, sharded, names, _ = graphs
+    queries = SocialGraphQueries(reference)
+    assert sharded.recommend_many(names, k) == [queries.recommend(name, k) for name in names]
+    assert sharded.recommend_many(names[:5], 0) == [[]] * 5
+    assert sharded.recommend("ghost", k) == []
+
+
+def test_paths_match_graph_queries(graphs):
+    reference, sharded, names, rng = graphs
+    queries = SocialGraphQueries(reference)
+    for _ in range(40):
+        source, target = rng.sample(names, 2)
+        path = sharded.shortest_follow_path(source, target)
+        assert sharded.degrees_of_separation(source, target) == queries.degrees_of_separation(source, target)
+        if path is not None:
+            assert path[0] == source and path[-1] == target
+            assert all(b in reference.listOutgoingAdjacentVertex(a) for a, b in zip(path, path[1:]))
+    assert sharded.shortest_follow_path("user0", "user0") == ["user0"]
+
+
+def test_shard_errors_are_raised_in_the_coordinator(graphs):
+    _, sharded, names, _ = graphs
+    with pytest.raises(AttributeError):
+        sharded._scatter({0: [("no_such_method", ())], 1: [("vertices", ())]})
+    assert sharded.has_vertex(names[0])  # the pipes are still in step
+
+
+def test_shard_of_is_stable_and_spread():
+    counts = [0] * 4
+    for i in range(4000):
+        counts[shard_of(f"user{i}", 4)] += 1
+    assert shard_of("Alice", 4) == shard_of("Alice", 4)
+    assert min(counts) > 800
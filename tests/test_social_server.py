@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+from graph import Graph
+from person import Person
+from social_server import SocialServer
+
+
+def make_server():
+    graph = Graph()
+    profiles = {}
+    for name, private in (("Alice", False), ("Bob", True)):
+        profiles[name] = Person(name, "F", f"{name} bio", private)
+    graph.add_vertices(list(profiles))
+    return SocialServer(graph, profiles), graph, profiles
+
+
+async def exchange(server, lines):
+    # Sends every line at once (pipelined) and reads one reply line per request line.
+    tcp_server = await server.start("127.0.0.1", 0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(b"".join(line if isinstance(line, bytes) else json.dumps(line).encode() + b"\n"
+                              for line in lines))
+        await writer.drain()
+        return [json.loads(await reader.readline()) for _ in lines]
+    finally:
+        writer.close()
+        await server.stop()
+
+
+def run(server, lines):
+    return asyncio.run(exchange(server, lines))
+
+
+def test_writes_then_reads_and_ids_are_echoed():
+    server, graph, profiles = make_server()
+    replies = run(server, [
+        {"id": 1, "op": "add_user", "name": " Carol ", "gender": "F", "biography": "chess"},
+        {"id": 2, "op": "follow", "follower": "Alice", "followed": "Bob"},
+        {"id": 3, "op": "follow", "follower": "Alice", "followed": "Bob"},
+        {"id": 4, "op": "follow", "follower": "Alice", "followed": "Alice"},
+        {"id": 5, "op": "unfollow", "follower": "Bob", "followed": "Alice"},
+    ])
+    assert [reply["id"] for reply in replies] == [1, 2, 3, 4, 5]
+    assert [reply["ok"] for reply in replies] == [True, True, False, False, False]
+    assert "Carol" in profiles and "Carol" in graph.get_all_vertices()
+    assert set(graph.listOutgoingAdjacentVertex("Alice")) == {"Bob"}
+    assert server.write_batches >= 1
+
+
+def test_profiles_respect_privacy():
+    server, _, _ = make_server()
+    public, private, unlocked, missing = run(server, [
+        {"id": 1, "op": "profile", "name": "Alice"},
+        {"id": 2, "op": "profile", "name": "Bob", "respect_privacy": True},
+        {"id": 3, "op": "profile", "name": "Bob", "respect_privacy": False},
+        {"id": 4, "op": "profile", "name": "Nobody"},
+    ])
+    assert public["result"]["biography"] == "Alice bio"
+    assert private["result"]["is_private"] and "biography" not in private["result"]
+    assert unlocked["result"]["biography"] == "Bob bio"
+    assert not missing["ok"] and "not found" in missing["error"]
+
+
+def test_batches_and_malformed_requests_get_their_own_replies():
+    server, _, _ = make_server()
+    batch, bad_json, unknown, bad_op, not_object, after = run(server, [
+        [{"id": 1, "op": "profile", "name": "Alice"}, {"id": 2, "op": "follow", "follower": "Bob",
+                                                       "followed": "Alice"}],
+        b"{not json\n",
+        {"id": 3, "op": "teleport"},
+        {"id": 4, "op": []},
+        [7],
+        {"id": 5, "op": "profile", "name": "Bob"},
+    ])
+    assert [reply["id"] for reply in batch] == [1, 2] and all(reply["ok"] for reply in batch)
+    assert bad_json == {"id": None, "ok": False, "error": "Error: Request is not valid JSON."}
+    assert unknown["id"] == 3 and not unknown["ok"]
+    assert bad_op["id"] == 4 and not bad_op["ok"]
+    assert not not_object[0]["ok"]
+    assert after["ok"]
+
+
+def test_writer_survives_an_unexpected_error():
+    server, graph, _ = make_server()
+
+    def broken_add_edges(edges, max_errors=20):
+        raise RuntimeError("disk on fire")
+
+    graph.add_edges = broken_add_edges
+    failed, later = run(server, [
+        {"id": 1, "op": "follow", "follower": "Alice", "followed": "Bob"},
+        {"id": 2, "op": "add_user", "name": "Dave", "gender": "M", "biography": "music"},
+    ])
+    assert not failed["ok"] and "Internal error" in failed["error"]
+    assert later["ok"]
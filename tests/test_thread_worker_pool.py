@@ -0,0 +1,42 @@
+import pytest
+
+from random_number_performance import ThreadWorkerPool, Workload, measure_threading_overhead
+
+
+@pytest.fixture
+def pool():
+    pool = ThreadWorkerPool(3, seed=42)
+    yield pool
+    pool.close()
+
+
+def test_rounds_cover_every_set_in_range(pool):
+    for num_sets in (1, 3, 7):
+        round_result = pool.run_round(Workload(num_sets, 50, 10, 20))
+        assert len(round_result["sets"]) == num_sets
+        assert all(len(numbers) == 50 and all(10 <= value <= 20 for value in numbers)
+                   for numbers in round_result["sets"])
+        assert round_result["wall_ns"] >= round_result["generation_ns"] >= 0
+
+
+def test_seeded_pools_are_reproducible(pool):
+    other = ThreadWorkerPool(3, seed=42)
+    try:
+        workload = Workload(5, 40, 0, 1000)
+        for _ in range(3):
+            assert pool.run_round(workload)["sets"] == other.run_round(workload)["sets"]
+    finally:
+        other.close()
+
+
+def test_worker_errors_are_raised_and_the_pool_keeps_working(pool):
+    with pytest.raises(ValueError):
+        pool.run_round(Workload(3, 10, 5, 1))  # min_val > max_val
+    assert len(pool.run_round(Workload(3, 10, 0, 1))["sets"]) == 3
+
+
+def test_overhead_report_covers_both_paths():
+    report = measure_threading_overhead(Workload(2, 20, 0, 10), seed=1, warmup=1, min_rounds=3, max_rounds=5)
+    assert set(report) == {"spawn per round", "persistent pool"}
+    for stats in report.values():
+        assert stats["wall_ns"] == pytest.approx(stats["generation_ns"] + stats["overhead_ns"])